@@ -0,0 +1,65 @@
+"""
+분봉 수준의 긴 합성 시계열로 LTTB 다운샘플링 전/후의 Plotly 전송량과 소요 시간을 비교합니다.
+
+    python benchmarks/bench_downsample.py --traces 10 --points 100000 --width 1200
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.downsample import (  # noqa: E402
+    WEBGL_THRESHOLD,
+    downsample_frame,
+    figure_payload_bytes,
+    max_points_for_width,
+)
+
+
+def build_figure(series):
+    total_points = sum(len(x) for _, x, _ in series)
+    trace_type = go.Scattergl if total_points > WEBGL_THRESHOLD else go.Scatter
+    fig = go.Figure()
+    for name, x, y in series:
+        fig.add_trace(trace_type(x=x, y=y, mode="lines", name=name))
+    return fig
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--traces", type=int, default=10)
+    parser.add_argument("--points", type=int, default=100_000, help="트레이스당 점 개수 (1분봉)")
+    parser.add_argument("--width", type=int, default=1200, help="차트 가로 크기(px)")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    index = pd.date_range("2024-01-02 09:30", periods=args.points, freq="min")
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, size=(args.points, args.traces)), axis=0))
+    df = pd.DataFrame(prices, index=index, columns=[f"T{i}" for i in range(args.traces)])
+
+    started = time.perf_counter()
+    full = build_figure([(col, df.index, df[col]) for col in df.columns])
+    full_bytes = figure_payload_bytes(full)
+    full_elapsed = time.perf_counter() - started
+
+    max_points = max_points_for_width(args.width)
+    started = time.perf_counter()
+    series = downsample_frame(df, max_points)
+    downsample_elapsed = time.perf_counter() - started
+    reduced_bytes = figure_payload_bytes(build_figure(series))
+    reduced_elapsed = time.perf_counter() - started
+
+    print(f"트레이스 {args.traces}개 x {args.points:,}점, 트레이스당 최대 {max_points:,}점")
+    print(f"원본     : {full_bytes / 1024 / 1024:8.2f} MB  (figure+JSON {full_elapsed:.2f}s)")
+    print(f"다운샘플 : {reduced_bytes / 1024 / 1024:8.2f} MB  (LTTB {downsample_elapsed:.3f}s, 전체 {reduced_elapsed:.2f}s)")
+    print(f"절감률   : {1 - reduced_bytes / full_bytes:.1%}")
+
+
+if __name__ == "__main__":
+    main()
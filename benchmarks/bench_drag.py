@@ -0,0 +1,68 @@
+"""
+공기 저항 적분기(core.drag.simulate)의 정확도와 처리량을 측정합니다.
+k = 0 (진공)에서는 해석해(core.projectile.vacuum_metrics)와 비교하고,
+공기 저항이 있을 때는 스텝 수를 크게 늘린 기준 해와 비교해 수렴을 확인합니다.
+
+    python benchmarks/bench_drag.py --speeds 300 --angles 300
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.drag import drag_factor, simulate  # noqa: E402
+from core.projectile import vacuum_metrics  # noqa: E402
+
+
+def relative_error(value, reference):
+    return float(np.max(np.abs(value - reference) / np.maximum(np.abs(reference), 1e-9)))
+
+
+def timed(**kwargs):
+    started = time.perf_counter()
+    result = simulate(**kwargs)
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--speeds", type=int, default=300)
+    parser.add_argument("--angles", type=int, default=300)
+    parser.add_argument("--steps", type=int, nargs="+", default=[50, 100, 200], help="비행당 스텝 수")
+    args = parser.parse_args()
+
+    speeds = np.linspace(1, 100, args.speeds)[:, None]
+    angles = np.linspace(1, 89, args.angles)[None, :]
+    n = args.speeds * args.angles
+    print(f"발사 {n:,}회 (속도 {args.speeds} x 각도 {args.angles})")
+
+    # --- 진공: 해석해와 비교 ---
+    ranges, heights, times = vacuum_metrics(speeds, angles)
+    print("\n[k = 0, 해석해 대비 최대 상대 오차]")
+    for steps in args.steps:
+        result, elapsed = timed(speed=speeds, angle_deg=angles, steps_per_flight=steps)
+        print(
+            f"스텝 {steps:5d}: 사거리 {relative_error(result['range'], ranges):.1e}"
+            f"  최대 높이 {relative_error(result['max_height'], heights):.1e}"
+            f"  비행 시간 {relative_error(result['flight_time'], times):.1e}"
+            f"  {elapsed:6.2f}s ({n / elapsed:,.0f} 발/s)"
+        )
+
+    # --- 공기 저항 (축구공): 촘촘한 기준 해와 비교 ---
+    k = drag_factor(0.47, 0.22, 0.43)
+    reference, _ = timed(speed=speeds, angle_deg=angles, k=k, steps_per_flight=max(args.steps) * 10)
+    print(f"\n[k = {k:.4f} 1/m, 스텝 {max(args.steps) * 10} 기준 해 대비 사거리 최대 상대 오차]")
+    for steps in args.steps:
+        result, elapsed = timed(speed=speeds, angle_deg=angles, k=k, steps_per_flight=steps)
+        print(
+            f"스텝 {steps:5d}: {relative_error(result['range'], reference['range']):.1e}"
+            f"  {elapsed:6.2f}s ({n / elapsed:,.0f} 발/s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+관광지 수에 따른 근접 검색과 여행 경로 계산 시간을 측정합니다.
+- kNN: cKDTree 인덱스 조회와 전체 haversine 거리 계산(브루트포스) 비교 (결과 일치 여부 포함)
+- 경로: 고른 장소 수별 최근접 이웃 대비 2-opt 개선 폭과 계산 시간
+
+    python benchmarks/bench_nearby.py --places 1000 5000 20000 --stops 10 50 200
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fixtures import places_fixture_path  # noqa: E402
+from core.geo import haversine_matrix  # noqa: E402
+from core.nearby import NearbyIndex, plan_route  # noqa: E402
+from core.places import PlaceCatalog  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--places", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--stops", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+
+    print(f"[kNN, k={args.k}, 조회 100회 평균]")
+    for n in args.places:
+        catalog = PlaceCatalog.load(places_fixture_path(n))
+        started = time.perf_counter()
+        index = NearbyIndex(catalog.lat, catalog.lon)
+        build_elapsed = time.perf_counter() - started
+
+        queries = rng.integers(0, n, size=100)
+        started = time.perf_counter()
+        tree_results = [index.nearest(catalog.lat[q], catalog.lon[q], args.k, exclude=q)[0] for q in queries]
+        tree_elapsed = (time.perf_counter() - started) / len(queries)
+
+        started = time.perf_counter()
+        brute_results = []
+        for q in queries:
+            distance = haversine_matrix([catalog.lat[q]], [catalog.lon[q]], catalog.lat, catalog.lon)[0]
+            distance[q] = np.inf
+            brute_results.append(np.argsort(distance, kind="stable")[:args.k])
+        brute_elapsed = (time.perf_counter() - started) / len(queries)
+        same = all(set(a) == set(b) for a, b in zip(tree_results, brute_results))
+        print(
+            f"장소 {n:>6,}: 인덱스 빌드 {build_elapsed * 1000:6.1f}ms, 조회 {tree_elapsed * 1e6:7.1f}µs, "
+            f"브루트포스 {brute_elapsed * 1e6:8.1f}µs, 결과 일치 {same}"
+        )
+
+    print("\n[여행 경로, 최근접 이웃 + 2-opt]")
+    catalog = PlaceCatalog.load(places_fixture_path(max(args.places)))
+    index = NearbyIndex(catalog.lat, catalog.lon)
+    for n_stops in args.stops:
+        stops = rng.choice(len(catalog), size=n_stops, replace=False)
+        started = time.perf_counter()
+        _, total_km, greedy_km = plan_route(index.distance_matrix(stops))
+        elapsed = time.perf_counter() - started
+        print(
+            f"장소 {n_stops:>4}곳: {elapsed * 1000:8.1f}ms, 최근접 이웃 {greedy_km:9,.1f} km -> 2-opt {total_km:9,.1f} km "
+            f"({(1 - total_km / greedy_km) * 100:4.1f}% 단축)"
+        )
+
+
+if __name__ == "__main__":
+    main()
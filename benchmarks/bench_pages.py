@@ -0,0 +1,302 @@
+"""
+네 페이지(main.py, 주식, 지진, 포물선)를 streamlit.testing.v1.AppTest로 화면 없이 실행해 성능을 측정합니다.
+네트워크는 모두 오프라인 대체물로 바꿉니다.
+- 주가: yfinance 대신 FixtureProvider 합성 데이터
+- 지진: USGS 대신 로컬 FakeUSGSServer
+- 이미지: 원격 CDN 대신 로컬 FakeImageServer
+시나리오마다 새 프로세스에서 빈 캐시로 시작해 다음을 잽니다.
+- first_render_s: 첫 실행에서 첫 화면 요소(제목 등)가 나가기까지의 시간 (time-to-first-render)
+- cold_s: 첫 실행 시간
+- rerun_s: 같은 상태로 다시 실행한 시간
+- payload_bytes: 화면 요소(proto) + 미디어 파일 바이트
+- peak_rss_mb: 프로세스 최대 메모리
+
+예열 스레드(core.data_layer)는 규모 설정의 warmup 값으로 정합니다.
+- 없음: 예열 없이(APP_WARMUP=0)
+- "live" (_live 시나리오): 실제 서버와 같이 첫 방문 실행이 예열을 시작하고, 끝나기를 기다리지 않음
+- "ready" (_warm 시나리오): 예열이 기본 데이터와 라이브러리를 다 준비한 뒤 첫 방문자가 들어옴
+
+결과는 benchmarks/results/ 아래 JSON으로 저장하고, 기준(baseline) 결과보다 threshold 이상 나빠진 항목이 있으면
+종료 코드 1로 실패합니다.
+
+    python benchmarks/bench_pages.py --save-baseline          # 기준 결과 저장
+    python benchmarks/bench_pages.py --threshold 0.25         # 기준 대비 25% 넘게 나빠지면 실패
+    python benchmarks/bench_pages.py --scenarios main_10 quakes_1k
+"""
+import argparse
+import inspect
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+DEFAULT_BASELINE = os.path.join(RESULTS_DIR, "baseline.json")
+METRICS = ("first_render_s", "cold_s", "rerun_s", "payload_bytes", "peak_rss_mb")
+# 이보다 작은 변화는 측정 잡음으로 보고 비율과 상관없이 통과
+MIN_DELTA = {"first_render_s": 0.1, "cold_s": 0.1, "rerun_s": 0.1, "payload_bytes": 16 * 1024, "peak_rss_mb": 20.0}
+
+PAGES = {
+    "main": "main.py",
+    "stocks": os.path.join("pages", "00_주식데이터시각화.py"),
+    "quakes": os.path.join("pages", "01_지진과 판 구조론 탐험.py"),
+    "projectile": os.path.join("pages", "02_포물선 운동 시뮬레이터.py"),
+}
+
+# 시나리오: (페이지, 규모 설정, 측정 전에 위젯을 맞추는 단계)
+# 단계는 (설명, AppTest를 바꾸는 함수) 목록이며, 단계마다 한 번씩 실행한 뒤 마지막 상태로 측정합니다.
+SCENARIOS = {
+    "main_10": ("main", {"places": None}, []),
+    "main_5000": ("main", {"places": 5000}, []),
+    "main_10_live": ("main", {"places": None, "warmup": "live"}, []),
+    "main_10_warm": ("main", {"places": None, "warmup": "ready"}, []),
+    "stocks_10": ("stocks", {"tickers": 10}, []),
+    "stocks_10_live": ("stocks", {"tickers": 10, "warmup": "live"}, []),
+    "stocks_10_warm": ("stocks", {"tickers": 10, "warmup": "ready"}, []),
+    "stocks_500": ("stocks", {"tickers": 500}, [
+        ("직접 입력 선택", lambda at: at.sidebar.radio[0].set_value("직접 입력 (S&P 500 등 대규모 목록)")),
+        ("티커 500개 입력", lambda at: at.sidebar.text_area[0].set_value(
+            " ".join(f"T{i:04d}" for i in range(500))
+        )),
+    ]),
+    "quakes_1k": ("quakes", {"events": 1_000}, []),
+    "quakes_100k": ("quakes", {"events": 100_000}, []),
+    "quakes_100k_live": ("quakes", {"events": 100_000, "warmup": "live"}, []),
+    "quakes_100k_warm": ("quakes", {"events": 100_000, "warmup": "ready"}, []),
+    "projectile_single": ("projectile", {}, []),
+    "projectile_animation": ("projectile", {}, [
+        ("애니메이션 모드", lambda at: at.radio[0].set_value("애니메이션")),
+    ]),
+    "projectile_sweep": ("projectile", {}, [
+        ("스윕 모드", lambda at: at.radio[0].set_value("파라미터 스윕")),
+    ]),
+    "projectile_monte_carlo": ("projectile", {}, [
+        ("몬테카를로 모드", lambda at: at.radio[0].set_value("몬테카를로")),
+    ]),
+}
+
+
+def set_defaults(func, **overrides):
+    """함수의 기본 인자 값을 이름으로 바꿉니다. (페이지가 인자 없이 만드는 객체를 대체물로 향하게 함)"""
+    params = [p for p in inspect.signature(func).parameters.values() if p.default is not inspect.Parameter.empty]
+    func = getattr(func, "__func__", func)
+    func.__defaults__ = tuple(overrides.get(p.name, p.default) for p in params)
+
+
+# --- 작업자 프로세스: 시나리오 하나를 실행 ---
+def _install_offline_fixtures(page, scale, cache_root, stack):
+    """페이지가 쓰는 네트워크/저장 위치를 임시 폴더와 로컬 대체물로 바꿉니다."""
+    if page == "main":
+        from benchmarks.fake_images import FakeImageServer, rerouting_session
+        from benchmarks.fixtures import places_fixture_path
+        from core.places import PlaceCatalog
+        from core.thumbnails import ThumbnailCache
+
+        server = stack.enter_context(FakeImageServer(size=(1280, 720)))
+        # 서버 쪽 이미지 생성 시간이 측정에 섞이지 않도록 미리 만들어 둠
+        server.preload([f"{i}.jpg" for i in range(20)] + [f"{i}.gif" for i in range(20)])
+        if scale["places"]:
+            set_defaults(PlaceCatalog.load, path=places_fixture_path(scale["places"]))
+        set_defaults(ThumbnailCache.__init__, root=os.path.join(cache_root, "thumbnails"),
+                     session=rerouting_session(server))
+    elif page == "stocks":
+        import core.price_provider as price_provider
+        import core.price_store as price_store
+
+        price_store.DEFAULT_STORE_DIR = os.path.join(cache_root, "prices")
+        price_provider.PROVIDERS["yahoo"] = price_provider.FixtureProvider
+    elif page == "quakes":
+        from benchmarks.fake_usgs import FakeUSGSServer
+        from core.quake_cache import QuakeDayCache
+        from core.usgs_fetch import USGSClient
+
+        server = stack.enter_context(FakeUSGSServer(n_events=scale["events"], days=30))
+        set_defaults(USGSClient.__init__, base_url=server.base_url)
+        set_defaults(QuakeDayCache.__init__, root=os.path.join(cache_root, "quakes"))
+
+
+def _payload_bytes(tree):
+    """요소 트리의 proto 직렬화 크기 합 (Plotly 스펙, 지도 HTML, 표 데이터 등 브라우저로 가는 내용)"""
+    total = 0
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        proto = getattr(node, "proto", None)
+        if proto is not None and hasattr(proto, "ByteSize"):
+            total += proto.ByteSize()
+        stack.extend(getattr(node, "children", {}).values())
+    return total
+
+
+def run_scenario(name):
+    from contextlib import ExitStack
+
+    from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+    from streamlit.runtime.scriptrunner_utils.script_run_context import ScriptRunContext
+    from streamlit.testing.v1 import AppTest
+
+    page, scale, steps = SCENARIOS[name]
+    media_bytes = [0]
+    load_media = MemoryMediaFileStorage.load_and_get_id
+
+    def counting_load(self, path_or_data, *args, **kwargs):
+        # st.image 등으로 올라가는 파일 크기 (요소 proto에는 URL만 들어감)
+        media_bytes[0] += len(path_or_data) if isinstance(path_or_data, bytes) else os.path.getsize(path_or_data)
+        return load_media(self, path_or_data, *args, **kwargs)
+
+    MemoryMediaFileStorage.load_and_get_id = counting_load
+
+    first_delta = [None]
+    enqueue = ScriptRunContext.enqueue
+
+    def timed_enqueue(self, msg):
+        # 화면 요소(delta) 메시지가 처음 나가는 시각 (페이지 설정 메시지는 제외)
+        if first_delta[0] is None and msg.WhichOneof("type") == "delta":
+            first_delta[0] = time.perf_counter()
+        return enqueue(self, msg)
+
+    ScriptRunContext.enqueue = timed_enqueue
+
+    with ExitStack() as stack, tempfile.TemporaryDirectory() as cache_root:
+        _install_offline_fixtures(page, scale, cache_root, stack)
+        from core.data_layer import WARMUP_ENV, get_data_layer
+
+        warmup = scale.get("warmup")
+        if warmup is None:
+            os.environ[WARMUP_ENV] = "0"
+        else:
+            os.environ.pop(WARMUP_ENV, None)
+        if warmup == "ready":
+            layer = get_data_layer()
+            layer.start_warmup()
+            layer.warm.wait(600)
+        at = AppTest.from_file(os.path.join(ROOT, PAGES[page]), default_timeout=900)
+        for _, apply in steps:
+            at.run()
+            apply(at)
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+        timings = []
+        for _ in range(2):
+            media_bytes[0] = 0
+            first_delta[0] = None
+            started = time.perf_counter()
+            at.run()
+            timings.append((first_delta[0] - started, time.perf_counter() - started))
+        return {
+            "page": page,
+            "scale": scale,
+            "first_render_s": round(timings[0][0], 4),
+            "cold_s": round(timings[0][1], 4),
+            "rerun_s": round(timings[1][1], 4),
+            "payload_bytes": _payload_bytes(at._tree) + media_bytes[0],
+            "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+            "rss_before_mb": round(rss_before, 1),
+            "exceptions": [str(e.value) for e in at.exception],
+        }
+
+
+# --- 상위 프로세스: 시나리오별 작업자 실행, 저장, 기준과 비교 ---
+def run_in_subprocess(name):
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
+        output = f.name
+    try:
+        completed = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--worker", name, "--worker-output", output],
+            cwd=ROOT, capture_output=True, text=True,
+        )
+        if completed.returncode != 0:
+            return {"error": completed.stderr.strip().splitlines()[-1:] or ["unknown error"]}
+        with open(output, encoding="utf-8") as f:
+            return json.load(f)
+    finally:
+        os.remove(output)
+
+
+def compare(results, baseline, threshold):
+    """기준보다 threshold 비율 이상(그리고 MIN_DELTA 이상) 나빠진 (시나리오, 지표, 기준값, 현재값) 목록"""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if not previous or "error" in current or "error" in previous:
+            continue
+        for metric in METRICS:
+            if metric not in previous:
+                continue
+            before, after = previous[metric], current[metric]
+            if after - before > MIN_DELTA[metric] and after > before * (1 + threshold):
+                regressions.append((name, metric, before, after))
+    return regressions
+
+
+def _format(metric, value):
+    if metric == "payload_bytes":
+        return f"{value / 1024:,.0f}KB"
+    if metric == "peak_rss_mb":
+        return f"{value:,.0f}MB"
+    return f"{value:.3f}s"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scenarios", nargs="+", default=list(SCENARIOS), choices=list(SCENARIOS))
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.25, help="기준 대비 허용 악화 비율")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준으로 저장")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--worker-output", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        result = run_scenario(args.worker)
+        with open(args.worker_output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False)
+        return 0
+
+    results = {}
+    print(f"{'시나리오':<24}{'첫 화면':>10}{'첫 실행':>10}{'재실행':>10}{'전송량':>12}{'최대 메모리':>12}")
+    for name in args.scenarios:
+        result = results[name] = run_in_subprocess(name)
+        if "error" in result:
+            print(f"{name:<24}실패: {result['error']}")
+            continue
+        print(f"{name:<24}" + "".join(f"{_format(m, result[m]):>12}" for m in METRICS)
+              + (f"  예외: {result['exceptions']}" if result["exceptions"] else ""))
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "scenarios": results,
+    }
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    path = os.path.join(RESULTS_DIR, f"pages_{datetime.now():%Y%m%d_%H%M%S}.json")
+    for target in (path, os.path.join(RESULTS_DIR, "latest.json")) + ((args.baseline,) if args.save_baseline else ()):
+        with open(target, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {os.path.relpath(path, ROOT)}" + (f", 기준: {os.path.relpath(args.baseline, ROOT)}" if args.save_baseline else ""))
+
+    failed = [name for name, result in results.items() if "error" in result or result.get("exceptions")]
+    regressions = []
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for name, metric, before, after in regressions:
+            print(f"성능 저하: {name} {metric} {_format(metric, before)} -> {_format(metric, after)}")
+    if failed:
+        print(f"실행 실패: {', '.join(failed)}")
+    return 1 if failed or regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
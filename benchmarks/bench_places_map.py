@@ -0,0 +1,69 @@
+"""
+관광지 수에 따른 여행 가이드 지도 비용을 비교합니다.
+- 기존 방식: 매 rerun마다 리스트를 훑어 Marker를 하나씩 추가하고 지도를 새로 렌더링
+- 인덱스 + 캐시: 도시 인덱스로 장소를 고르고, 필터별 HTML을 한 번 만든 뒤 dict 조회
+(임계값을 넘으면 FastMarkerCluster로 바뀌므로 HTML 크기도 함께 출력)
+
+    python benchmarks/bench_places_map.py --places 10 1000 5000
+"""
+import argparse
+import os
+import sys
+import time
+
+import folium
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fixtures import places_fixture_path  # noqa: E402
+from core.places import PlaceCatalog  # noqa: E402
+from core.places_map import build_places_map, render_map_html  # noqa: E402
+
+
+def build_legacy(places, selected_city):
+    m = folium.Map(location=[36.7783, -119.4179], zoom_start=6)
+    for place in places:
+        if selected_city is not None and place["city"] != selected_city:
+            continue
+        folium.Marker(location=place["location"], popup=place["name"], tooltip=place["name"]).add_to(m)
+    return m.get_root().render()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--places", type=int, nargs="+", default=[10, 1000, 5000])
+    args = parser.parse_args()
+
+    print(f"{'장소':>6} | {'기존(전체)':>10} {'HTML':>8} | {'인덱스 빌드':>10} {'첫 렌더':>8} {'HTML':>8} {'캐시 조회':>10}")
+    for n in args.places:
+        path = places_fixture_path(n)
+
+        started = time.perf_counter()
+        catalog = PlaceCatalog.load(path)
+        load_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        legacy_html = build_legacy(catalog.places, None)
+        legacy_elapsed = time.perf_counter() - started
+
+        # 필터별 HTML 캐시 (페이지의 st.cache_data와 같은 역할)
+        cache = {}
+        started = time.perf_counter()
+        cache[None] = render_map_html(build_places_map(catalog, catalog.indices(None)))
+        first_elapsed = time.perf_counter() - started
+        for city in catalog.cities:
+            cache[city] = render_map_html(build_places_map(catalog, catalog.indices(city)))
+
+        started = time.perf_counter()
+        for city in catalog.cities * 10:
+            cache[city]
+        lookup_elapsed = (time.perf_counter() - started) / (len(catalog.cities) * 10)
+
+        print(
+            f"{n:>6,} | {legacy_elapsed:>9.3f}s {len(legacy_html) / 1024:>6.0f}KB | "
+            f"{load_elapsed:>9.3f}s {first_elapsed:>7.3f}s {len(cache[None]) / 1024:>6.0f}KB {lookup_elapsed * 1e6:>8.1f}µs"
+        )
+
+
+if __name__ == "__main__":
+    main()
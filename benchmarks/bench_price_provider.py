@@ -0,0 +1,44 @@
+"""
+오프라인 합성 데이터 제공자로 청크 단위 동시 다운로드의 처리량을 측정합니다. (네트워크 불필요)
+
+    python benchmarks/bench_price_provider.py --tickers 1000 --latency 0.2
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.price_provider import FixtureProvider, fetch_close_chunked  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tickers", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.2, help="요청 1회당 흉내 낼 지연(초)")
+    parser.add_argument("--chunk-size", type=int, default=50)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8, 16])
+    args = parser.parse_args()
+
+    tickers = [f"T{i:04d}" for i in range(args.tickers)]
+    end = date.today()
+    start = end - timedelta(days=3 * 365)
+    provider = FixtureProvider(latency=args.latency)
+
+    print(f"티커 {args.tickers}개, 청크 {args.chunk_size}개, 요청 지연 {args.latency}s")
+    for workers in args.workers:
+        started = time.perf_counter()
+        close_data, failures = fetch_close_chunked(
+            provider, tickers, start, end, chunk_size=args.chunk_size, max_workers=workers
+        )
+        elapsed = time.perf_counter() - started
+        print(
+            f"workers={workers:>3}  {elapsed:7.2f}s  {args.tickers / elapsed:8.1f} 티커/s  "
+            f"shape={close_data.shape}  실패={len(failures)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
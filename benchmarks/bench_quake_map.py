@@ -0,0 +1,75 @@
+"""
+지진 수에 따른 지도 생성 시간과 HTML 크기를 기존 방식(iterrows + CircleMarker + MarkerCluster)과 비교합니다.
+
+    python benchmarks/bench_quake_map.py --events 1000 10000 100000 200000
+"""
+import argparse
+import os
+import sys
+import time
+
+import folium
+import pandas as pd
+from folium.plugins import MarkerCluster
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fixtures import usgs_features  # noqa: E402
+from core.quake_map import DEFAULT_POINT_LIMIT, add_quake_layer, get_magnitude_color, html_size  # noqa: E402
+from core.quake_parser import USGS_EVENT_URL, _Columns  # noqa: E402
+
+
+def quake_frame(n):
+    columns = _Columns()
+    for feature in usgs_features(n):
+        columns.add(feature)
+    return columns.frame()
+
+
+def build_legacy(df):
+    m = folium.Map(location=[0, 0], zoom_start=2)
+    marker_cluster = MarkerCluster().add_to(m)
+    for _, row in df.iterrows():
+        popup_html = (
+            f"<b>장소:</b> {row['place']}<br><b>규모:</b> {row['magnitude']:.1f}<br>"
+            f"<b>시간:</b> {row['time'].strftime('%Y-%m-%d %H:%M:%S')}<br><b>깊이:</b> {row['depth']:.1f} km<br>"
+            f"<b>정보:</b> <a href=\"{USGS_EVENT_URL.format(row['id'])}\" target=\"_blank\">자세히 보기</a>"
+        )
+        color = get_magnitude_color(row["magnitude"])
+        folium.CircleMarker(
+            location=[row["latitude"], row["longitude"]], radius=row["magnitude"] * 2,
+            color=color, fill=True, fill_color=color, fill_opacity=0.7,
+            popup=folium.Popup(popup_html, max_width=300),
+        ).add_to(marker_cluster)
+    return m
+
+
+def build_bulk(df, point_limit):
+    m = folium.Map(location=[0, 0], zoom_start=2)
+    add_quake_layer(m, df, USGS_EVENT_URL, point_limit=point_limit)
+    return m
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, nargs="+", default=[1000, 10000, 100000, 200000])
+    parser.add_argument("--point-limit", type=int, default=DEFAULT_POINT_LIMIT)
+    parser.add_argument("--legacy-max", type=int, default=10000, help="기존 방식은 이 개수까지만 측정")
+    args = parser.parse_args()
+
+    rows = []
+    for n in args.events:
+        df = quake_frame(n)
+        builders = [("bulk", lambda: build_bulk(df, args.point_limit))]
+        if n <= args.legacy_max:
+            builders.append(("legacy", lambda: build_legacy(df)))
+        for name, build in builders:
+            started = time.perf_counter()
+            size = html_size(build())
+            rows.append({"방식": name, "지진 수": n, "생성+렌더 (s)": round(time.perf_counter() - started, 2),
+                         "HTML (MB)": round(size / 1024 / 1024, 2)})
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
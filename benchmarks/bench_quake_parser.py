@@ -0,0 +1,76 @@
+"""
+대용량 USGS GeoJSON에서 기존 방식(response.json() + 이벤트별 dict)과
+스트리밍 컬럼 파서의 파싱 시간과 최대 메모리 사용량을 비교합니다.
+
+    python benchmarks/bench_quake_parser.py --events 300000
+    python benchmarks/bench_quake_parser.py --file recorded_usgs.geojson
+"""
+import argparse
+import datetime
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fixtures import usgs_fixture_path  # noqa: E402
+from core.quake_parser import parse_geojson_stream  # noqa: E402
+
+
+def parse_legacy(path):
+    # 변경 전 load_earthquake_data의 처리 방식
+    with open(path, "rb") as f:
+        data = json.loads(f.read())
+    earthquakes = []
+    for feature in data.get("features", []):
+        props = feature.get("properties", {})
+        geo = feature.get("geometry", {})
+        if geo and geo.get("coordinates") and props.get("mag") is not None:
+            coords = geo["coordinates"]
+            earthquakes.append({
+                "place": props.get("place", "장소 정보 없음"),
+                "magnitude": props["mag"],
+                "time": datetime.datetime.fromtimestamp(props.get("time", 0) / 1000),
+                "longitude": coords[0],
+                "latitude": coords[1],
+                "depth": props.get("depth", None),
+                "url": props.get("url", "#"),
+            })
+    return pd.DataFrame(earthquakes)
+
+
+def parse_streaming(path):
+    with open(path, "rb") as f:
+        return parse_geojson_stream(iter(lambda: f.read(1 << 16), b""))
+
+
+def measure(func, path):
+    tracemalloc.start()
+    started = time.perf_counter()
+    df = func(path)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return df, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=300_000)
+    parser.add_argument("--file", help="직접 녹화한 USGS 응답 파일 (지정하면 합성 데이터 대신 사용)")
+    args = parser.parse_args()
+
+    path = args.file or usgs_fixture_path(args.events)
+    print(f"입력: {path} ({os.path.getsize(path) / 1024 / 1024:.1f} MB)")
+    for name, func in [("기존", parse_legacy), ("스트리밍", parse_streaming)]:
+        df, elapsed, peak = measure(func, path)
+        frame_mb = df.memory_usage(deep=True).sum() / 1024 / 1024
+        print(f"{name:>6}: {elapsed:6.2f}s  최대 메모리 {peak / 1024 / 1024:8.1f} MB  DataFrame {frame_mb:6.1f} MB  행 {len(df):,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+관광지 수에 따른 역색인 검색 시간을 부분 문자열 전체 스캔과 비교합니다.
+
+    python benchmarks/bench_search.py --places 1000 5000 20000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fixtures import places_fixture_path  # noqa: E402
+from core.places import PlaceCatalog  # noqa: E402
+from core.search import SEARCH_FIELDS, SearchIndex, field_text  # noqa: E402
+
+QUERIES = ["와이너리", "Bakery", "Disney", "해변 카페", "museum", "샌프란시스코 전망대"]
+
+
+def scan(places, query):
+    words = query.lower().split()
+    return [
+        i for i, place in enumerate(places)
+        if any(word in field_text(place.get(field, "")).lower() for field in SEARCH_FIELDS for word in words)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--places", type=int, nargs="+", default=[1000, 5000, 20000])
+    args = parser.parse_args()
+
+    for n in args.places:
+        catalog = PlaceCatalog.load(places_fixture_path(n))
+        started = time.perf_counter()
+        index = SearchIndex(catalog.places)
+        build_elapsed = time.perf_counter() - started
+        print(f"장소 {n:,}곳: 색인 빌드 {build_elapsed:.2f}s, 토큰 {len(index.vocabulary):,}개")
+        for query in QUERIES:
+            started = time.perf_counter()
+            ranked = index.search(query)
+            index_elapsed = time.perf_counter() - started
+            started = time.perf_counter()
+            scanned = scan(catalog.places, query)
+            scan_elapsed = time.perf_counter() - started
+            print(
+                f"  {query:<12} 역색인 {index_elapsed * 1000:7.2f}ms ({len(ranked):>6,}곳, 순위 포함)"
+                f"  스캔 {scan_elapsed * 1000:8.2f}ms ({len(scanned):>6,}곳)"
+            )
+
+
+if __name__ == "__main__":
+    main()
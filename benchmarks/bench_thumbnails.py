@@ -0,0 +1,64 @@
+"""
+장소 카드 이미지를 로컬 이미지 서버(fake_images.py)에서 받아 썸네일 캐시의 효과를 측정합니다.
+- 원본: 매 rerun마다 브라우저가 원본 이미지 전체를 받는 경우의 전송량
+- 썸네일: 첫 실행(다운로드 + WebP 변환)과 두 번째 실행(디스크 캐시 적중)의 시간과 전송량
+- 실패 호스트: 응답하지 않는 호스트는 한 번 실패한 뒤 기다리지 않고 대체 이미지를 돌려주는지
+
+    python benchmarks/bench_thumbnails.py --images 20 --latency 0.2
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fake_images import FakeImageServer  # noqa: E402
+from core.thumbnails import ThumbnailCache  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--images", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.2, help="이미지 요청당 지연(초)")
+    args = parser.parse_args()
+
+    with FakeImageServer(latency=args.latency) as server, tempfile.TemporaryDirectory() as root:
+        urls = [server.url(f"images/{i}.jpg") for i in range(args.images)]
+        server.preload(f"{i}.jpg" for i in range(args.images))
+
+        started = time.perf_counter()
+        original_bytes = sum(len(requests.get(url, timeout=30).content) for url in urls)
+        original_elapsed = time.perf_counter() - started
+
+        cache = ThumbnailCache(root=root)
+        started = time.perf_counter()
+        paths = cache.prefetch(urls)
+        cold_elapsed = time.perf_counter() - started
+        started = time.perf_counter()
+        cache.prefetch(urls)
+        warm_elapsed = time.perf_counter() - started
+        thumbnail_bytes = sum(os.path.getsize(path) for path in paths.values())
+
+        # 연결이 거부되는 호스트: 첫 시도 후에는 바로 대체 이미지
+        dead = [f"http://127.0.0.1:9/images/{i}.jpg" for i in range(args.images)]
+        started = time.perf_counter()
+        cache.get(dead[0])
+        first_failure = time.perf_counter() - started
+        started = time.perf_counter()
+        fallback = cache.prefetch(dead[1:])
+        rest_failure = time.perf_counter() - started
+
+    print(f"이미지 {args.images}개, 요청 지연 {args.latency}s")
+    print(f"원본 (순차)      : {original_bytes / 1024 / 1024:7.2f} MB  {original_elapsed:6.2f}s (rerun마다)")
+    print(f"썸네일 첫 실행   : {thumbnail_bytes / 1024 / 1024:7.2f} MB  {cold_elapsed:6.2f}s (동시 다운로드 + WebP 변환)")
+    print(f"썸네일 두 번째   : {thumbnail_bytes / 1024 / 1024:7.2f} MB  {warm_elapsed:6.3f}s (디스크 캐시)")
+    print(f"실패 호스트      : 첫 요청 {first_failure:.3f}s, 나머지 {len(fallback)}개 {rest_failure:.3f}s (대체 이미지)")
+    print(f"캐시 통계        : {cache.stats}")
+
+
+if __name__ == "__main__":
+    main()
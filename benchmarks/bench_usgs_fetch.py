@@ -0,0 +1,48 @@
+"""
+로컬 USGS 대체 서버를 상대로 구간 분할 + 동시 요청 방식의 소요 시간을 측정하고,
+결과가 한 번에 받은 결과(한도를 넉넉히 준 경우)와 같은지 확인합니다.
+
+    python benchmarks/bench_usgs_fetch.py --events 100000 --latency 0.3
+"""
+import argparse
+import datetime
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fake_usgs import FakeUSGSServer  # noqa: E402
+from core.usgs_fetch import USGSClient  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--latency", type=float, default=0.3, help="요청 1회당 서버 지연(초)")
+    parser.add_argument("--max-per-window", type=int, default=20_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+    args = parser.parse_args()
+
+    end = datetime.datetime.now(datetime.timezone.utc)
+    start = end - datetime.timedelta(days=365)
+    with FakeUSGSServer(n_events=args.events, latency=args.latency, max_allowed=args.max_per_window) as server:
+        for workers in args.workers:
+            server.request_log.clear()
+            client = USGSClient(base_url=server.base_url, max_workers=workers, max_per_window=args.max_per_window)
+            started = time.perf_counter()
+            df = client.fetch(start, end, 1.0)
+            elapsed = time.perf_counter() - started
+            print(
+                f"workers={workers:>2}  {elapsed:6.2f}s  행 {len(df):,}  고유 id {df['id'].nunique():,}  "
+                f"count 요청 {server.request_log.count('count')}회, query 요청 {server.request_log.count('query')}회"
+            )
+
+        server.max_allowed = args.events + 1
+        server.latency = 0
+        reference = USGSClient(base_url=server.base_url).query(start, end, 1.0)
+        print(f"한 번에 받은 결과와 일치: {set(reference['id']) == set(df['id'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+원격 이미지 CDN을 흉내 내는 로컬 대체 HTTP 서버입니다.
+/images/<번호>.jpg 는 합성 JPEG, /images/<번호>.gif 는 애니메이션 GIF를 돌려주고,
+/broken/... 은 500 오류를 반환합니다. 요청마다 지연(latency)을 줄 수 있습니다.
+
+    with FakeImageServer(size=(1920, 1080)) as server:
+        url = server.url("images/3.jpg")
+        session = rerouting_session(server)  # 어떤 이미지 URL이든 이 서버로 보냄
+"""
+import io
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+from PIL import Image
+
+
+def sample_jpeg(index, size=(1920, 1080)):
+    """번호마다 다른 색 그라디언트 + 잡음 JPEG (원본 사진과 비슷한 크기가 되도록 잡음을 섞음)"""
+    rng = np.random.default_rng(index)
+    width, height = size
+    base = rng.integers(0, 256, size=3)
+    gradient = np.linspace(0, 1, width)[None, :, None] * np.linspace(0.5, 1, height)[:, None, None]
+    pixels = (base * gradient + rng.normal(0, 20, size=(height, width, 3))).clip(0, 255).astype(np.uint8)
+    output = io.BytesIO()
+    Image.fromarray(pixels).save(output, format="JPEG", quality=90)
+    return output.getvalue()
+
+
+def sample_gif(index, size=(480, 270), frames=12):
+    rng = np.random.default_rng(index)
+    images = [
+        Image.fromarray(rng.integers(0, 256, size=(size[1], size[0], 3), dtype=np.uint8)).convert("P")
+        for _ in range(frames)
+    ]
+    output = io.BytesIO()
+    images[0].save(output, format="GIF", save_all=True, append_images=images[1:], duration=80, loop=0)
+    return output.getvalue()
+
+
+class FakeImageServer:
+    def __init__(self, size=(1920, 1080), latency=0.0):
+        self.size = size
+        self.latency = latency
+        self.request_log = []
+        self._bodies = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def url(self, path):
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def _body(self, name):
+        # 같은 이미지는 한 번만 만들어 둠
+        with self._lock:
+            if name not in self._bodies:
+                stem, _, extension = name.rpartition(".")
+                index = int(stem) if stem.isdigit() else 0
+                if extension == "gif":
+                    self._bodies[name] = (sample_gif(index), "image/gif")
+                else:
+                    self._bodies[name] = (sample_jpeg(index, self.size), "image/jpeg")
+            return self._bodies[name]
+
+    def preload(self, names):
+        """측정 전에 이미지를 미리 만들어 둠 (서버 쪽 생성 시간이 결과에 섞이지 않도록)"""
+        for name in names:
+            self._body(name)
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, body, content_type):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                server.request_log.append(self.path)
+                if server.latency:
+                    time.sleep(server.latency)
+                if self.path.startswith("/images/"):
+                    body, content_type = server._body(self.path.rsplit("/", 1)[-1])
+                    self._send(200, body, content_type)
+                elif self.path.startswith("/broken/"):
+                    self._send(500, b"server error", "text/plain")
+                else:
+                    self._send(404, b"not found", "text/plain")
+
+        return Handler
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class LocalImageAdapter(HTTPAdapter):
+    """
+    모든 요청을 FakeImageServer의 이미지로 돌리는 requests 어댑터입니다.
+    URL마다 항상 같은 이미지(n_images개 중 하나)가 나오고, URL에 .gif가 있으면 애니메이션 GIF를 줍니다.
+    """
+
+    def __init__(self, server, n_images=20):
+        super().__init__()
+        self.server = server
+        self.n_images = n_images
+
+    def image_name(self, url):
+        extension = "gif" if ".gif" in url.lower() else "jpg"
+        return f"{zlib.crc32(url.encode('utf-8')) % self.n_images}.{extension}"
+
+    def send(self, request, **kwargs):
+        request.url = self.server.url(f"images/{self.image_name(request.url)}")
+        return super().send(request, **kwargs)
+
+
+def rerouting_session(server, n_images=20):
+    session = requests.Session()
+    adapter = LocalImageAdapter(server, n_images)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
@@ -0,0 +1,117 @@
+"""
+USGS FDSN event 서비스(/query, /count)를 흉내 내는 로컬 대체 HTTP 서버입니다.
+합성 이벤트를 starttime/endtime/minmagnitude/updatedafter로 걸러서 돌려주고, 결과가 max_allowed를
+넘으면 실제 서비스처럼 400 오류를 반환합니다. 요청마다 지연(latency)을 줄 수 있고,
+처음 fail_requests번의 요청에는 503 오류를 돌려 재시도를 확인할 수 있습니다.
+
+    with FakeUSGSServer(n_events=100_000) as server:
+        client = USGSClient(base_url=server.base_url)
+"""
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+from benchmarks.fixtures import usgs_features
+
+
+def _parse_time(value):
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp() * 1000)
+
+
+class FakeUSGSServer:
+    def __init__(self, n_events=10_000, seed=0, end_ms=None, days=365, latency=0.0,
+                 max_allowed=20000, features=None, fail_requests=0):
+        end_ms = end_ms or int(time.time() * 1000)
+        features = list(features) if features is not None else list(usgs_features(n_events, seed, end_ms, days))
+        self.times = np.array([f["properties"]["time"] for f in features], dtype=np.int64)
+        self.mags = np.array([f["properties"]["mag"] for f in features], dtype=np.float64)
+        self.updated = np.array([f["properties"]["updated"] for f in features], dtype=np.int64)
+        self.encoded = [json.dumps(f, separators=(",", ":")).encode("utf-8") for f in features]
+        self.latency = latency
+        self.max_allowed = max_allowed
+        self.fail_requests = fail_requests
+        self.request_log = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/fdsnws/event/1"
+
+    def _select(self, query):
+        mask = np.ones(len(self.times), dtype=bool)
+        if "starttime" in query:
+            mask &= self.times >= _parse_time(query["starttime"][0])
+        if "endtime" in query:
+            mask &= self.times <= _parse_time(query["endtime"][0])
+        if "updatedafter" in query:
+            mask &= self.updated > _parse_time(query["updatedafter"][0])
+        if "minmagnitude" in query:
+            mask &= self.mags >= float(query["minmagnitude"][0])
+        return np.flatnonzero(mask)
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, body, content_type="application/json"):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                query = parse_qs(url.query)
+                server.request_log.append(url.path.rsplit("/", 1)[-1])
+                if server.latency:
+                    time.sleep(server.latency)
+                with server._lock:
+                    fail = server.fail_requests > 0
+                    server.fail_requests -= fail
+                if fail:
+                    self._send(503, b"service unavailable", "text/plain")
+                    return
+                selected = server._select(query)
+
+                if url.path.endswith("/count"):
+                    body = json.dumps({"count": len(selected), "maxAllowed": server.max_allowed})
+                    self._send(200, body.encode("utf-8"))
+                elif url.path.endswith("/query"):
+                    if len(selected) > server.max_allowed:
+                        message = f"Error 400: {len(selected)} matching events exceeds search limit of {server.max_allowed}."
+                        self._send(400, message.encode("utf-8"), "text/plain")
+                        return
+                    # 실제 서비스와 같이 최신 이벤트부터 반환
+                    order = selected[np.argsort(-server.times[selected], kind="stable")]
+                    body = b'{"type":"FeatureCollection","metadata":{"count":%d},"features":[' % len(order)
+                    body += b",".join(server.encoded[i] for i in order) + b"]}"
+                    self._send(200, body)
+                else:
+                    self._send(404, b"not found", "text/plain")
+
+        return Handler
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
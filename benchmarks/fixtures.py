@@ -0,0 +1,128 @@
+"""
+벤치마크용 오프라인 합성 데이터 생성기입니다. (네트워크 불필요)
+"""
+import json
+import os
+
+import numpy as np
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+_REGIONS = [
+    "Alaska", "California", "Japan", "Indonesia", "Chile", "Tonga", "Hawaii",
+    "Nevada", "Puerto Rico", "Papua New Guinea", "Philippines", "Mexico",
+]
+
+
+def usgs_features(n, seed=0, end_ms=1_750_000_000_000, days=365):
+    """USGS FDSN GeoJSON과 같은 구조의 feature dict를 n개 생성합니다."""
+    rng = np.random.default_rng(seed)
+    times = np.sort(rng.integers(end_ms - days * 86_400_000, end_ms, size=n))[::-1]
+    mags = np.round(1.0 + rng.exponential(0.9, size=n), 2)
+    lons = np.round(rng.uniform(-180, 180, size=n), 4)
+    lats = np.round(rng.uniform(-70, 70, size=n), 4)
+    depths = np.round(rng.exponential(25, size=n), 2)
+    dists = rng.integers(1, 200, size=n)
+    regions = rng.integers(0, len(_REGIONS), size=n)
+    for i in range(n):
+        event_id = f"fx{i:08d}"
+        yield {
+            "type": "Feature",
+            "properties": {
+                "mag": float(mags[i]),
+                "place": f"{dists[i]} km NW of {_REGIONS[regions[i]]}",
+                "time": int(times[i]),
+                "updated": int(times[i]) + 60_000,
+                "url": f"https://earthquake.usgs.gov/earthquakes/eventpage/{event_id}",
+                "detail": f"https://earthquake.usgs.gov/fdsnws/event/1/query?eventid={event_id}&format=geojson",
+                "status": "reviewed",
+                "tsunami": 0,
+                "sig": int(mags[i] * 20),
+                "net": "fx",
+                "code": f"{i:08d}",
+                "magType": "ml",
+                "type": "earthquake",
+                "title": f"M {mags[i]} - {dists[i]} km NW of {_REGIONS[regions[i]]}",
+            },
+            "geometry": {"type": "Point", "coordinates": [float(lons[i]), float(lats[i]), float(depths[i])]},
+            "id": event_id,
+        }
+
+
+def write_usgs_geojson(path, n, seed=0, **kwargs):
+    """합성 feature n개로 USGS 응답 형식의 GeoJSON 파일을 씁니다."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"type":"FeatureCollection","metadata":{"generated":0,"title":"fixture","status":200,')
+        f.write(f'"count":{n}}},"features":[')
+        for i, feature in enumerate(usgs_features(n, seed, **kwargs)):
+            if i:
+                f.write(",")
+            f.write(json.dumps(feature, separators=(",", ":")))
+        f.write('],"bbox":[-180,-70,0,180,70,700]}')
+    return path
+
+
+def usgs_fixture_path(n, seed=0):
+    """fixtures/ 아래에 캐시된 합성 GeoJSON 경로를 반환합니다. 없으면 새로 만듭니다."""
+    path = os.path.join(FIXTURE_DIR, f"usgs_{n}_{seed}.geojson")
+    if not os.path.exists(path):
+        write_usgs_geojson(path, n, seed)
+    return path
+
+
+_PLACE_CITIES = [
+    ("샌프란시스코", 37.77, -122.42), ("로스앤젤레스", 34.05, -118.24), ("샌디에이고", 32.72, -117.16),
+    ("새크라멘토", 38.58, -121.49), ("프레즈노", 36.74, -119.79), ("산타바바라", 34.42, -119.70),
+    ("팜스프링스", 33.83, -116.55), ("나파", 38.30, -122.29), ("몬터레이", 36.60, -121.89),
+    ("레딩", 40.59, -122.39),
+]
+_PLACE_WORDS = [
+    ("와이너리", "Winery"), ("해변", "Beach"), ("전망대", "Overlook"), ("박물관", "Museum"),
+    ("베이커리", "Bakery"), ("국립공원", "National Park"), ("부두", "Pier"), ("정원", "Garden"),
+]
+
+
+PLACE_IMAGE_BASE = "http://images.invalid/images"
+
+
+def places_catalog(n, seed=0, image_base=PLACE_IMAGE_BASE, n_images=50):
+    """
+    data/places.json과 같은 구조의 합성 관광지 dict를 n개 생성합니다. (도시 주변에 흩어진 좌표)
+    이미지 URL은 image_base/<번호>.jpg 이며, 로컬 이미지 서버(fake_images.py) 주소를 넣을 수 있습니다.
+    """
+    rng = np.random.default_rng(seed)
+    cities = rng.integers(0, len(_PLACE_CITIES), size=n)
+    words = rng.integers(0, len(_PLACE_WORDS), size=(n, 3))
+    offsets = np.round(rng.normal(0, 0.25, size=(n, 2)), 4)
+    places = []
+    for i in range(n):
+        city, lat, lon = _PLACE_CITIES[cities[i]]
+        korean, english = _PLACE_WORDS[words[i, 0]]
+        places.append({
+            "name": f"{city} {korean} {i} ({english} {i})",
+            "location": [round(lat + offsets[i, 0], 4), round(lon + offsets[i, 1], 4)],
+            "description": f"{city}의 {korean}입니다. 근처에 {_PLACE_WORDS[words[i, 1]][0]}도 있습니다.",
+            "image": f"{image_base}/{i % n_images}.jpg",
+            "city": city,
+            "hotels": [f"{_PLACE_WORDS[words[i, 2]][1]} Hotel {i}", f"Inn {i}"],
+            "food": [f"{_PLACE_WORDS[words[i, 1]][1]} Cafe {i}", f"Grill {i}"],
+        })
+    return places
+
+
+def write_places_json(path, n, seed=0, **kwargs):
+    """합성 관광지 n개로 data/places.json 형식의 파일을 씁니다."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"metadata": {"description": "fixture"}, "places": places_catalog(n, seed, **kwargs)}, f,
+                  ensure_ascii=False)
+    return path
+
+
+def places_fixture_path(n, seed=0):
+    """fixtures/ 아래에 캐시된 합성 관광지 JSON 경로를 반환합니다. 없으면 새로 만듭니다."""
+    path = os.path.join(FIXTURE_DIR, f"places_{n}_{seed}.json")
+    if not os.path.exists(path):
+        write_places_json(path, n, seed)
+    return path
@@ -0,0 +1 @@
+# 여러 페이지에서 함께 쓰는 데이터/계산 모듈 모음
@@ -0,0 +1,126 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+
+TRADING_DAYS = 252  # 연환산에 쓰는 1년 거래일 수
+
+
+def _values(df):
+    # 모든 계산은 float32 배열 하나로 한 번에 처리 (컬럼별 파이썬 루프/복사 없음)
+    return df.to_numpy(dtype=np.float32, na_value=np.nan)
+
+
+def _frame(values, df):
+    return pd.DataFrame(values, index=df.index, columns=df.columns)
+
+
+def rebase(df, base=100.0):
+    """각 컬럼을 첫 유효값 대비 base(기본 100%)로 정규화합니다. 유효값이 없거나 0인 컬럼은 전부 NaN이 됩니다."""
+    values = _values(df)
+    valid = ~np.isnan(values)
+    first_idx = valid.argmax(axis=0)
+    first = values[first_idx, np.arange(values.shape[1])]
+    first[~valid.any(axis=0) | (first == 0)] = np.nan
+    return _frame(values / first * np.float32(base), df)
+
+
+def daily_returns(df):
+    """일간 단순 수익률 (첫 행은 NaN)."""
+    values = _values(df)
+    out = np.full_like(values, np.nan)
+    out[1:] = values[1:] / values[:-1] - 1
+    return _frame(out, df)
+
+
+def log_returns(df):
+    """일간 로그 수익률 (첫 행은 NaN)."""
+    values = _values(df)
+    out = np.full_like(values, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[1:] = np.log(values[1:] / values[:-1])
+    return _frame(out, df)
+
+
+def rolling_volatility(df, window=21, annualize=True):
+    """
+    로그 수익률의 이동 표준편차(표본)입니다. 창 안에 NaN이 하나라도 있으면 NaN입니다.
+    누적합으로 계산하므로 창 크기와 관계없이 O(행 x 열)입니다.
+    """
+    returns = log_returns(df).to_numpy()
+    valid = ~np.isnan(returns)
+    # 누적합은 정밀도를 위해 float64로 계산한 뒤 float32로 되돌림
+    filled = np.where(valid, returns, 0).astype(np.float64)
+    zeros = np.zeros((1, returns.shape[1]))
+    csum = np.vstack([zeros, np.cumsum(filled, axis=0)])
+    csq = np.vstack([zeros, np.cumsum(filled ** 2, axis=0)])
+    ccount = np.vstack([zeros, np.cumsum(valid, axis=0)])
+
+    out = np.full(returns.shape, np.nan, dtype=np.float32)
+    if window > 1 and len(returns) >= window:
+        s = csum[window:] - csum[:-window]
+        sq = csq[window:] - csq[:-window]
+        n = ccount[window:] - ccount[:-window]
+        var = np.maximum((sq - s ** 2 / window) / (window - 1), 0)
+        std = np.where(n == window, np.sqrt(var), np.nan)
+        if annualize:
+            std *= np.sqrt(TRADING_DAYS)
+        out[window - 1:] = std
+    return _frame(out, df)
+
+
+def drawdown(df):
+    """직전 고점 대비 하락률 (0 이하, 고점 갱신 시 0)."""
+    values = _values(df)
+    running_max = np.fmax.accumulate(values, axis=0)
+    return _frame(values / running_max - 1, df)
+
+
+def correlation(df):
+    """
+    일간 로그 수익률의 상관계수 행렬입니다.
+    결측은 쌍별로 제외하되 평균은 컬럼 전체 평균을 써서 행렬곱 몇 번으로 계산합니다. (결측이 없으면 피어슨 상관계수와 같음)
+    """
+    returns = log_returns(df).to_numpy()[1:]
+    valid = ~np.isnan(returns)
+    with warnings.catch_warnings():
+        # 값이 전혀 없는 컬럼의 nanmean 경고는 무시 (해당 컬럼은 NaN 상관계수가 됨)
+        warnings.simplefilter("ignore", RuntimeWarning)
+        centered = np.where(valid, returns - np.nanmean(returns, axis=0), 0).astype(np.float32)
+    mask = valid.astype(np.float32)
+    squared = centered ** 2
+
+    cov = centered.T @ centered
+    var_i = squared.T @ mask   # [i, j]: j가 유효한 행에서 i의 제곱합
+    var_j = mask.T @ squared   # [i, j]: i가 유효한 행에서 j의 제곱합
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = cov / np.sqrt(var_i * var_j)
+    np.fill_diagonal(corr, np.where(np.diag(var_i) > 0, 1, np.nan))
+    return pd.DataFrame(np.clip(corr, -1, 1), index=df.columns, columns=df.columns)
+
+
+def summary(df):
+    """컬럼별 누적/연환산 수익률, 연환산 변동성, 최대 낙폭 요약표입니다."""
+    values = _values(df)
+    rebased = rebase(df, base=1.0).to_numpy()
+    valid = ~np.isnan(values)
+    last_idx = len(values) - 1 - valid[::-1].argmax(axis=0)
+    total = rebased[last_idx, np.arange(values.shape[1])] - 1
+    periods = np.maximum(last_idx - valid.argmax(axis=0), 1)
+
+    returns = log_returns(df).to_numpy()
+    with warnings.catch_warnings(), np.errstate(invalid="ignore"):
+        warnings.simplefilter("ignore", RuntimeWarning)
+        annual_return = (1 + total) ** (TRADING_DAYS / periods) - 1
+        annual_vol = np.nanstd(returns, axis=0, ddof=1) * np.sqrt(TRADING_DAYS)
+        max_drawdown = np.nanmin(drawdown(df).to_numpy(), axis=0)
+
+    return pd.DataFrame(
+        {
+            "누적 수익률": total,
+            "연환산 수익률": annual_return,
+            "연환산 변동성": annual_vol,
+            "최대 낙폭": max_drawdown,
+        },
+        index=df.columns,
+    )
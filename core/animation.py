@@ -0,0 +1,119 @@
+from functools import lru_cache
+
+import numpy as np
+import plotly.graph_objects as go
+
+from core.drag import simulate
+from core.projectile import G, vacuum_trajectory
+
+FRAME_DURATION_MS = 50
+
+
+@lru_cache(maxsize=512)
+def trajectory(speed, angle_deg, k=0.0, g=G, num=200):
+    """
+    (속도, 각도, 항력 계수 k)별 궤적 (t, x, y)를 메모이제이션합니다.
+    같은 조건으로 돌아오면 다시 적분하지 않고 바로 꺼냅니다. 반환 배열은 읽기 전용입니다.
+    진공은 해석해, k > 0이면 core.drag.simulate의 기록 궤적을 같은 시간 간격의 num개 점으로 다시 샘플링합니다.
+    """
+    if k > 0:
+        result = simulate(speed, angle_deg, k, g=g, record=True)
+        px, py = result["paths"][0]
+        t = np.linspace(0, float(result["flight_time"]), num)
+        step_times = result["path_times"][0]
+        x, y = np.interp(t, step_times, px), np.interp(t, step_times, py)
+    else:
+        t, x, y, _ = vacuum_trajectory(speed, angle_deg, g, num=num)
+    for values in (t, x, y):
+        values.setflags(write=False)
+    return t, x, y
+
+
+def _playback_layout(frame_names, labels, prefix):
+    """재생/정지 버튼과 프레임 슬라이더. 재생과 스크러빙은 브라우저에서만 일어납니다."""
+    still = dict(mode="immediate", frame=dict(duration=0, redraw=False), transition=dict(duration=0))
+    play = dict(frame=dict(duration=FRAME_DURATION_MS, redraw=False), fromcurrent=True, transition=dict(duration=0))
+    return dict(
+        updatemenus=[dict(
+            type="buttons", direction="left", showactive=False, x=0, y=-0.12, xanchor="left", yanchor="top",
+            buttons=[
+                dict(label="▶ 재생", method="animate", args=[None, play]),
+                dict(label="⏸ 정지", method="animate", args=[[None], still]),
+            ]
+        )],
+        sliders=[dict(
+            active=0, x=0.15, len=0.85, y=-0.05, currentvalue=dict(prefix=prefix),
+            steps=[dict(method="animate", label=label, args=[[name], still]) for name, label in zip(frame_names, labels)]
+        )]
+    )
+
+
+def angle_sweep_animation(speed, angles_deg, k=0.0, g=G):
+    """같은 속도에서 발사 각도를 바꿔 가며 궤적을 보여주는 프레임 애니메이션 (각도당 프레임 1개)"""
+    paths = [trajectory(float(speed), float(angle), float(k), g) for angle in angles_deg]
+    paths = [(t, x.round(3), y.round(3)) for t, x, y in paths]
+    x_max = max(float(np.max(x)) for _, x, _ in paths)
+    y_max = max(float(np.max(y)) for _, _, y in paths)
+
+    def frame_data(x, y):
+        return [
+            go.Scatter(x=x, y=y, mode="lines", line=dict(color="#1f77b4", width=3)),
+            go.Scatter(x=[x[-1]], y=[y[-1]], mode="markers", marker=dict(color="red", size=10)),
+        ]
+
+    names = [f"{angle:g}" for angle in angles_deg]
+    fig = go.Figure(
+        data=frame_data(paths[0][1], paths[0][2]),
+        frames=[go.Frame(name=name, data=frame_data(x, y), traces=[0, 1]) for name, (_, x, y) in zip(names, paths)],
+    )
+    fig.update_layout(
+        title=f"초기 속도 {speed} m/s, 발사 각도별 궤적",
+        xaxis=dict(title="거리 (m)", range=[0, x_max * 1.05 + 1e-6]),
+        yaxis=dict(title="높이 (m)", range=[0, y_max * 1.1 + 1e-6]),
+        showlegend=False,
+        height=550,
+        **_playback_layout(names, [f"{name}°" for name in names], "발사 각도: "),
+    )
+    return fig
+
+
+def flight_animation(speed, angle_deg, k=0.0, g=G, n_frames=80):
+    """
+    한 번의 발사를 시간에 따라 재생하는 프레임 애니메이션입니다. (지나온 궤적 + 현재 위치)
+    공기 저항이 있으면 같은 조건의 진공 궤적을 점선으로 함께 그립니다.
+    """
+    t, x, y = trajectory(float(speed), float(angle_deg), float(k), g)
+    points = np.unique(np.linspace(0, len(t) - 1, n_frames).round().astype(int))
+    # 프레임마다 지나온 궤적을 통째로 다시 보내므로, 재생 시점의 점들만 쓰고 mm 단위로 반올림해 전송량을 줄임
+    trail_x, trail_y = x[points].round(3), y[points].round(3)
+
+    def frame_data(j):
+        return [
+            go.Scatter(x=trail_x[:j + 1], y=trail_y[:j + 1], mode="lines", line=dict(color="#1f77b4", width=3),
+                       name="궤적"),
+            go.Scatter(x=[trail_x[j]], y=[trail_y[j]], mode="markers", marker=dict(color="red", size=12),
+                       name="현재 위치"),
+        ]
+
+    x_max, y_max = float(np.max(x)), float(np.max(y))
+    data = frame_data(0)
+    if k > 0:
+        _, vacuum_x, vacuum_y = trajectory(float(speed), float(angle_deg), 0.0, g)
+        data.append(go.Scatter(x=vacuum_x, y=vacuum_y, mode="lines", line=dict(color="gray", dash="dash"),
+                               name="진공 궤적"))
+        x_max, y_max = max(x_max, float(np.max(vacuum_x))), max(y_max, float(np.max(vacuum_y)))
+
+    names = [str(i) for i in points]
+    fig = go.Figure(
+        data=data,
+        frames=[go.Frame(name=name, data=frame_data(j), traces=[0, 1]) for j, name in enumerate(names)],
+    )
+    fig.update_layout(
+        title=f"초기 속도 {speed} m/s, 각도 {angle_deg}° 비행",
+        xaxis=dict(title="거리 (m)", range=[0, x_max * 1.05 + 1e-6]),
+        yaxis=dict(title="높이 (m)", range=[0, y_max * 1.1 + 1e-6]),
+        showlegend=k > 0,
+        height=550,
+        **_playback_layout(names, [f"{t[i]:.2f}s" for i in points], "시간: "),
+    )
+    return fig
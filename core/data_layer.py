@@ -0,0 +1,315 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from datetime import date, timedelta
+
+# 이 모듈 자체는 표준 라이브러리만 import합니다. pandas, yfinance, requests, pyarrow 등은
+# 실제로 데이터를 읽거나 받을 때, 또는 예열 스레드 안에서 불러오므로 예열을 시작해도 페이지는 기다리지 않습니다.
+
+# --- 글로벌 시총 TOP 10 기업 티커 (2025년 6월 현재 기준 예상) ---
+# 실제 시총 순위는 변동되므로, 최신 정보를 반영하여 필요시 업데이트하세요.
+# 안정적인 시각화를 위해 Berkshire Hathaway는 B클래스(BRK-B)를 사용합니다.
+TOP_10_TICKERS = {
+    "Microsoft": "MSFT",
+    "Apple": "AAPL",
+    "NVIDIA": "NVDA",
+    "Amazon": "AMZN",
+    "Alphabet (Google)": "GOOGL",
+    "Meta Platforms": "META",
+    "Berkshire Hathaway (B)": "BRK-B", # BRK-A는 가격이 너무 높아 시각화가 어려움
+    "Eli Lilly and Company": "LLY",
+    "TSMC": "TSM",
+    "Johnson & Johnson": "JNJ"
+}
+
+STOCK_HISTORY_DAYS = 3 * 365  # 주식 페이지: 최근 3년
+DEFAULT_QUAKE_DAYS = 30  # 지진 페이지 기본 기간
+STOCK_TTL = 3600  # 초. 이보다 오래된 주가는 (예전 값을 보여주면서) 백그라운드에서 다시 받음
+QUAKE_TTL = 600  # 초. QuakeDayCache의 기본 refresh_interval과 같음
+REFRESH_AHEAD = 0.8  # 예열 스레드는 TTL의 80%가 지나면 만료 전에 미리 갱신
+KEEP_WARM = 2 * 3600  # 사용자가 요청한 키는 마지막 요청 후 이 시간(초) 동안 계속 미리 갱신하고, 지나면 메모리에서 지움
+STOCK_MAX_ENTRIES = 8  # 메모리에 둘 종목 조합 수 (종가 프레임은 종목 수에 비례해 커짐)
+QUAKE_MAX_ENTRIES = 32  # 메모리에 둘 지진 조회 기간 수 (값은 파티션 캐시에 있고 여기는 표시만 둠)
+WARMUP_POLL = 30  # 예열 스레드가 갱신할 키를 확인하는 간격(초)
+WARMUP_ENV = "APP_WARMUP"  # "0"이면 예열 스레드를 띄우지 않음 (벤치마크 등)
+
+
+class StaleWhileRevalidate:
+    """
+    키별 마지막 값을 메모리에 두고 기다리지 않고 돌려주는 캐시입니다. (stale-while-revalidate)
+    - 값이 ttl(초)보다 오래됐으면 예전 값을 그대로 돌려주고 백그라운드 스레드에서 새로 받습니다.
+    - 메모리에 없으면 stored(key)로 디스크 저장본을 찾아 돌려주고 역시 백그라운드에서 갱신합니다.
+    - 어디에도 없을 때만 호출한 스레드가 load(key)를 직접 실행하며 기다립니다.
+    같은 키의 갱신은 한 번에 하나만 돌고, 그동안 들어온 요청은 같은 작업을 공유합니다.
+    백그라운드 갱신이 실패하면 예전 값을 계속 쓰고 errors[key]에 예외를 남깁니다.
+    고정되지 않은 키는 keep_warm초 동안 요청이 없으면 지우고, max_entries개를 넘으면 가장 오래 안 쓴 키부터 지웁니다.
+    """
+
+    def __init__(self, load, ttl, stored=None, max_entries=32, keep_warm=KEEP_WARM):
+        self.load = load
+        self.ttl = ttl
+        self.stored = stored
+        self.max_entries = max_entries
+        self.keep_warm = keep_warm
+        self.errors = {}
+        self.pinned = set()  # 요청이 없어도 계속 미리 갱신할 키 (예열 대상, 지우지 않음)
+        self._values = OrderedDict()  # key -> (값, 받은 시각 monotonic), 최근에 쓴 키가 뒤쪽
+        self._used = {}  # key -> 마지막 요청 시각
+        self._pending = {}  # key -> Future
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        now = time.monotonic()
+        with self._lock:
+            self._used[key] = now
+            entry = self._values.get(key)
+            if entry is not None:
+                self._values.move_to_end(key)
+        if entry is None and self.stored is not None:
+            value = self.stored(key)
+            if value is not None:
+                with self._lock:
+                    # 디스크 저장본은 언제 받은 것인지 모르므로 바로 갱신 대상으로 둠
+                    entry = self._values.setdefault(key, (value, float("-inf")))
+                    self._evict(now)
+        if entry is None:
+            return self.refresh(key, wait=True).result()
+        if now - entry[1] >= self.ttl:
+            self.refresh(key)
+        return entry[0]
+
+    def refresh(self, key, wait=False):
+        """
+        key를 다시 받는 작업(Future)을 반환합니다. 이미 받는 중이면 그 작업을 돌려줍니다.
+        새로 시작할 때 wait=True이면 호출한 스레드에서 바로 실행하고, 아니면 백그라운드 스레드를 띄웁니다.
+        """
+        with self._lock:
+            future = self._pending.get(key)
+            if future is not None:
+                return future
+            future = self._pending[key] = Future()
+        if wait:
+            self._run(key, future)
+        else:
+            threading.Thread(target=self._run, args=(key, future), name=f"swr-refresh-{key!r:.40}", daemon=True).start()
+        return future
+
+    def _run(self, key, future):
+        try:
+            value = self.load(key)
+        except Exception as e:
+            with self._lock:
+                self.errors[key] = e
+                del self._pending[key]
+            future.set_exception(e)
+        else:
+            with self._lock:
+                self._values[key] = (value, time.monotonic())
+                self._values.move_to_end(key)
+                self.errors.pop(key, None)
+                del self._pending[key]
+                self._evict(time.monotonic())
+            future.set_result(value)
+
+    def _evict(self, now):
+        # self._lock을 잡은 상태에서 부름
+        for key in list(self._used):
+            if key not in self.pinned and now - self._used[key] > self.keep_warm:
+                self._forget(key)
+        unpinned = [key for key in self._values if key not in self.pinned]
+        for key in unpinned[:max(0, len(self._values) - self.max_entries)]:
+            self._forget(key)
+
+    def _forget(self, key):
+        self._values.pop(key, None)
+        self._used.pop(key, None)
+        self.errors.pop(key, None)
+
+    def refreshing(self, key):
+        with self._lock:
+            return key in self._pending
+
+    def due(self, ahead=REFRESH_AHEAD):
+        """만료 전에 미리 갱신할 키: TTL의 ahead 비율이 지났고, 고정됐거나 최근 keep_warm초 안에 요청된 키"""
+        now = time.monotonic()
+        with self._lock:
+            self._evict(now)
+            return [
+                key for key, (_, loaded) in self._values.items()
+                if now - loaded >= self.ttl * ahead
+                and key not in self._pending
+                and (key in self.pinned or now - self._used.get(key, float("-inf")) <= self.keep_warm)
+            ]
+
+
+class DataLayer:
+    """
+    주식/지진 페이지가 함께 쓰는 데이터 계층입니다.
+    가격 저장소, USGS 클라이언트, 지진 파티션 캐시를 프로세스 안에서 하나씩만 만들어 페이지와 예열 스레드가 공유하고,
+    두 데이터 모두 StaleWhileRevalidate로 감싸 사용자 요청이 네트워크를 기다리지 않게 합니다.
+    """
+
+    def __init__(self, stock_ttl=STOCK_TTL, quake_ttl=QUAKE_TTL):
+        self._lock = threading.Lock()
+        self._price_stores = {}
+        self._quake_cache = None
+        self.stocks = StaleWhileRevalidate(
+            self._load_stocks, stock_ttl, stored=self._stored_stocks, max_entries=STOCK_MAX_ENTRIES
+        )
+        self.quakes = StaleWhileRevalidate(
+            self._load_quakes, quake_ttl, stored=self._stored_quakes, max_entries=QUAKE_MAX_ENTRIES
+        )
+        self.warm = threading.Event()  # 예열 스레드가 기본 데이터를 다 채우면 설정됨
+        self._stop = threading.Event()
+        self._warmup = None
+
+    # --- 공유 저장소 ---
+    def price_store(self, provider_key):
+        # 제공자별로 저장소를 분리해서 합성 데이터가 실제 데이터와 섞이지 않게 함
+        from core import price_store
+
+        with self._lock:
+            if provider_key not in self._price_stores:
+                self._price_stores[provider_key] = price_store.PriceStore(
+                    os.path.join(price_store.DEFAULT_STORE_DIR, provider_key)
+                )
+            return self._price_stores[provider_key]
+
+    def quake_cache(self):
+        # UTC 하루 단위 파티션 캐시 (세션 = keep-alive 연결 풀은 모든 요청이 공유)
+        from core.quake_cache import QuakeDayCache
+        from core.usgs_fetch import USGSClient
+
+        with self._lock:
+            if self._quake_cache is None:
+                self._quake_cache = QuakeDayCache(USGSClient())
+            return self._quake_cache
+
+    # --- 주가 ---
+    @staticmethod
+    def _window(days):
+        # 날짜 단위로 자르므로 같은 날에는 같은 구간
+        end = date.today()
+        return end - timedelta(days=days), end
+
+    def _load_stocks(self, key):
+        from functools import partial
+
+        from core.price_provider import PROVIDERS, fetch_close_chunked
+
+        tickers, provider_key, days = key
+        start, end = self._window(days)
+        # 종목이 많으면 청크로 나누어 스레드 풀에서 동시에 받아옴 (청크별 재시도 포함)
+        fetch_close = partial(fetch_close_chunked, PROVIDERS[provider_key](), chunk_size=50, max_workers=8)
+        return self.price_store(provider_key).refresh(list(tickers), start, end, fetch_close)
+
+    def _stored_stocks(self, key):
+        tickers, provider_key, days = key
+        start, end = self._window(days)
+        store = self.price_store(provider_key)
+        if not store.covers(tickers, start):
+            return None
+        return store.read_close(list(tickers), start, end), {}
+
+    def stock_key(self, tickers, provider_key="yahoo", days=STOCK_HISTORY_DAYS):
+        return tuple(tickers), provider_key, days
+
+    def stock_close(self, tickers, provider_key="yahoo", days=STOCK_HISTORY_DAYS):
+        """
+        최근 days일 종가 DataFrame(컬럼 = 티커)과 실패 내역 dict를 반환합니다.
+        메모리나 로컬 저장소에 값이 있으면 바로 돌려주고, 오래됐으면 최근 구간만 백그라운드에서 받습니다.
+        반환값은 다른 요청과 공유되므로 고치지 말고 복사해서 쓰세요.
+        """
+        return self.stocks.get(self.stock_key(tickers, provider_key, days))
+
+    # --- 지진 ---
+    def _load_quakes(self, days):
+        # 예열 스레드가 만료 전에 부르므로, 확정되지 않은 날짜는 TTL보다 조금 일찍 다시 받음
+        max_age = timedelta(seconds=self.quakes.ttl * REFRESH_AHEAD)
+        self.quake_cache().refresh(days, max_age=max_age)
+        return True
+
+    def _stored_quakes(self, days):
+        return True if self.quake_cache().covers(days) else None
+
+    def quake_events(self, days, min_magnitude):
+        """
+        최근 days일, 규모 min_magnitude 이상의 지진을 시간 역순 DataFrame으로 반환합니다.
+        저장된 파티션이 모두 있으면 바로 답하고 갱신은 백그라운드에서 합니다. 처음 받는 날짜가 있을 때만 기다립니다.
+        """
+        self.quakes.get(days)
+        return self.quake_cache().query(days, min_magnitude)
+
+    # --- 예열 ---
+    def start_warmup(self, stock_keys=None, quake_days=(DEFAULT_QUAKE_DAYS,), poll=WARMUP_POLL):
+        """
+        예열 스레드를 프로세스당 한 번 띄웁니다. (이미 떠 있으면 그대로 반환, APP_WARMUP=0이면 띄우지 않음)
+        갱신에 쓰는 모듈을 불러오고 기본 주가/지진 데이터를 채운 뒤, 만료 전에 계속 갱신합니다.
+        호출한 스크립트 스레드는 스레드만 띄우고 바로 돌아갑니다.
+        """
+        if os.environ.get(WARMUP_ENV) == "0":
+            return None
+        if stock_keys is None:
+            stock_keys = [self.stock_key(TOP_10_TICKERS.values())]
+        with self._lock:
+            if self._warmup is None:
+                self._warmup = threading.Thread(
+                    target=self._warmup_loop, args=(list(stock_keys), list(quake_days), poll),
+                    name="data-warmup", daemon=True
+                )
+                self._warmup.start()
+            return self._warmup
+
+    def stop_warmup(self):
+        self._stop.set()
+
+    @staticmethod
+    def _import_loaders():
+        # 예열 스레드 안에서 부름. 같은 모듈을 스크립트 스레드가 동시에 import하면 import 시스템의
+        # 모듈별 잠금으로 한쪽이 끝날 때까지 기다리므로 반쯤 초기화된 모듈을 보지 않음
+        # (실패하면 예외가 스레드 밖으로 나가 서버 로그에 남음)
+        import pyarrow.parquet  # noqa: F401  (가격 저장소/지진 파티션 읽기)
+        import yfinance  # noqa: F401  (YahooProvider가 청크 스레드 안에서 불러옴)
+
+        import core.price_provider  # noqa: F401
+        import core.price_store  # noqa: F401
+        import core.quake_cache  # noqa: F401
+        import core.usgs_fetch  # noqa: F401
+
+    def _warmup_loop(self, stock_keys, quake_days, poll):
+        self._import_loaders()
+
+        # 기본 데이터는 고정해 두고 최신 값으로 채움 (실패하면 errors에 남고, 다음 주기에 다시 시도)
+        for cache, keys in ((self.quakes, quake_days), (self.stocks, stock_keys)):
+            for key in keys:
+                cache.pinned.add(key)
+                try:
+                    cache.refresh(key, wait=True).result()
+                except Exception:
+                    pass
+        self.warm.set()
+
+        while not self._stop.wait(poll):
+            for cache, keys in ((self.quakes, quake_days), (self.stocks, stock_keys)):
+                # 한 번도 받지 못한 고정 키(예: 서버 시작 때 네트워크 오류)도 다시 시도
+                retry = [key for key in keys if key in cache.errors]
+                for key in dict.fromkeys(cache.due() + retry):
+                    try:
+                        cache.refresh(key, wait=True).result()
+                    except Exception:
+                        pass
+
+
+_layer = None
+_layer_lock = threading.Lock()
+
+
+def get_data_layer():
+    """프로세스 전체에서 하나뿐인 DataLayer (모든 페이지와 세션이 공유)"""
+    global _layer
+    with _layer_lock:
+        if _layer is None:
+            _layer = DataLayer()
+        return _layer
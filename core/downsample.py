@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+
+# 화면 1px당 2점 정도면 선 모양이 원본과 구분되지 않음
+POINTS_PER_PIXEL = 2
+# 그려야 할 점이 이보다 많으면 SVG 대신 WebGL(Scattergl)로 그림
+WEBGL_THRESHOLD = 20_000
+
+
+def max_points_for_width(width_px, points_per_pixel=POINTS_PER_PIXEL):
+    """차트 가로 크기(px)에 맞는 트레이스당 최대 점 개수입니다."""
+    return max(int(width_px * points_per_pixel), 3)
+
+
+def lttb_indices(x, Y, n_out):
+    """
+    Largest-Triangle-Three-Buckets로 고른 인덱스를 (n_out, 컬럼 수) 배열로 반환합니다.
+    x는 모든 컬럼이 공유하는 (n,) 배열, Y는 (n, m) 배열이며 컬럼마다 다른 점을 고릅니다.
+    버킷 루프 안에서 모든 컬럼을 한 번에 계산하므로 트레이스 수가 늘어도 파이썬 반복 횟수는 n_out으로 고정됩니다.
+    NaN 점은 (버킷 전체가 NaN이 아닌 한) 고르지 않습니다.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    Y = np.asarray(Y, dtype=np.float64)
+    if Y.ndim == 1:
+        Y = Y[:, None]
+    n, m = Y.shape
+    if n_out >= n or n_out < 3:
+        return np.repeat(np.arange(n)[:, None], m, axis=1)
+
+    x = x - x[0]  # 큰 값(나노초 타임스탬프)끼리 곱할 때의 정밀도 손실 방지
+    cols = np.arange(m)
+
+    # 처음/끝 점을 제외한 구간을 n_out - 2개의 버킷으로 나눔
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    starts = edges[:-1]
+    valid = ~np.isnan(Y)
+    counts = np.add.reduceat(valid[:n - 1], starts, axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        y_means = np.add.reduceat(np.where(valid, Y, 0)[:n - 1], starts, axis=0) / counts
+    x_means = np.add.reduceat(x[:n - 1], starts) / np.diff(edges)
+
+    idx = np.empty((n_out, m), dtype=np.int64)
+    idx[0] = 0
+    idx[-1] = n - 1
+    ax = np.zeros(m)
+    ay = Y[0]
+    n_buckets = len(starts)
+    for i in range(n_buckets):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 1 < n_buckets:
+            cx, cy = x_means[i + 1], y_means[i + 1]
+        else:
+            cx, cy = x[-1], Y[-1]
+        xs = x[lo:hi, None]
+        with np.errstate(invalid="ignore"):
+            area = np.abs((ax - cx) * (Y[lo:hi] - ay) - (ax - xs) * (cy - ay))
+        # NaN 점은 -1로 제외하고, 기준점이 NaN이라 넓이를 못 구한 유효한 점은 0으로 둬서 NaN보다 우선 선택
+        area = np.where(np.isnan(Y[lo:hi]), -1.0, np.nan_to_num(area, nan=0.0))
+        pick = lo + area.argmax(axis=0)
+        idx[i + 1] = pick
+        # 고른 점이 유효할 때만 다음 버킷의 기준점으로 사용
+        picked = Y[pick, cols]
+        ok = ~np.isnan(picked)
+        ax = np.where(ok, x[pick], ax)
+        ay = np.where(ok, picked, ay)
+    return idx
+
+
+def downsample_frame(df, max_points):
+    """
+    날짜 인덱스 DataFrame의 각 컬럼을 최대 max_points개 점으로 줄여
+    [(컬럼 이름, x 인덱스, y 배열), ...] 목록으로 반환합니다. 점이 충분히 적으면 원본 그대로입니다.
+    """
+    # 모든 컬럼에 값이 없는 행은 미리 제거 (휴장일 등)
+    df = df.dropna(how="all")
+    if len(df) <= max_points:
+        return [(col, df.index, df[col].to_numpy()) for col in df.columns]
+
+    index = df.index
+    x = index.asi8 if isinstance(index, pd.DatetimeIndex) else index.to_numpy()
+    Y = df.to_numpy(dtype=np.float64, na_value=np.nan)
+    idx = lttb_indices(x, Y, max_points)
+    return [(col, index[idx[:, j]], Y[idx[:, j], j]) for j, col in enumerate(df.columns)]
+
+
+def figure_payload_bytes(fig):
+    """브라우저로 전송되는 Plotly figure JSON의 크기(바이트)입니다."""
+    return len(fig.to_json().encode("utf-8"))
@@ -0,0 +1,159 @@
+import warnings
+
+import numpy as np
+
+from core.projectile import G
+
+AIR_DENSITY = 1.225  # 해수면 공기 밀도 (kg/m³)
+
+
+def drag_factor(cd, diameter, mass, rho=AIR_DENSITY):
+    """
+    이차 항력 가속도 a = -k |v| v 의 계수 k (1/m)를 계산합니다.
+    k = ρ Cd A / (2m), A = 원형 단면적
+    """
+    area = np.pi * (np.asarray(diameter, dtype=np.float64) / 2) ** 2
+    return rho * np.asarray(cd, dtype=np.float64) * area / (2 * np.asarray(mass, dtype=np.float64))
+
+
+def _acceleration(vx, vy, k, wind, g):
+    # 공기에 대한 상대 속도로 항력을 계산 (바람은 수평 방향, +x가 뒷바람)
+    rel_x = vx - wind
+    speed = np.sqrt(rel_x**2 + vy**2)
+    return -k * speed * rel_x, -g - k * speed * vy
+
+
+def _hermite(p0, v0, p1, v1, dt, s):
+    """구간 [0, dt]에서 위치/속도 끝값으로 만든 3차 에르미트 보간의 s(0~1) 지점 값"""
+    s2, s3 = s * s, s * s * s
+    return (
+        (2 * s3 - 3 * s2 + 1) * p0
+        + (s3 - 2 * s2 + s) * dt * v0
+        + (-2 * s3 + 3 * s2) * p1
+        + (s3 - s2) * dt * v1
+    )
+
+
+def _ground_fraction(y0, vy0, y1, vy1, dt, iterations=30):
+    """스텝 안에서 y = 0이 되는 지점을 에르미트 보간 위에서 이분법으로 찾아 스텝 비율(0~1)로 반환합니다."""
+    lo = np.zeros_like(y0)
+    hi = np.ones_like(y0)
+    for _ in range(iterations):
+        mid = (lo + hi) / 2
+        above = _hermite(y0, vy0, y1, vy1, dt, mid) > 0
+        lo = np.where(above, mid, lo)
+        hi = np.where(above, hi, mid)
+    return (lo + hi) / 2
+
+
+def simulate(speed, angle_deg, k=0.0, wind=0.0, height=0.0, g=G, steps_per_flight=200, max_steps=20000,
+             record=False):
+    """
+    이차 공기 저항, 수평 바람, 발사 높이를 반영해 여러 발사체를 NumPy 배열로 함께 적분합니다. (고정 스텝 RK4)
+    발사체마다 진공 비행 시간을 steps_per_flight로 나눈 스텝 크기를 쓰고,
+    지면(y = 0)을 통과한 스텝에서는 에르미트 보간 위의 근을 찾아 정확한 착지 시각/위치를 구합니다.
+    착지한 발사체는 활성 집합에서 빠지므로 이후 스텝에서는 계산하지 않습니다.
+    max_steps 스텝 안에 착지하지 못한 발사체는 결과를 NaN으로 두고 RuntimeWarning을 냅니다.
+
+    인자는 모두 브로드캐스팅 가능한 스칼라/배열입니다.
+    반환: {'range', 'flight_time', 'max_height', 'impact_speed'} 배열과, record=True이면
+    발사체별 궤적 [(x 배열, y 배열), ...]이 담긴 'paths'와 각 점의 시각 [t 배열, ...]이 담긴 'path_times'
+    """
+    speed, angle_deg, k, wind, height = np.broadcast_arrays(
+        *(np.asarray(a, dtype=np.float64) for a in (speed, angle_deg, k, wind, height))
+    )
+    n = speed.size
+    angle = np.radians(angle_deg.ravel())
+    vx = speed.ravel() * np.cos(angle)
+    vy = speed.ravel() * np.sin(angle)
+    x = np.zeros(n)
+    y = height.ravel().copy()
+    k, wind = k.ravel(), wind.ravel()
+
+    # 진공 비행 시간 기준의 스텝 크기 (정확도의 기준 시간 척도)
+    # 발사 높이가 있거나 뒷바람이 불면 항력 때문에 하강이 느려져 실제 비행이 진공보다 길 수 있음.
+    # 그때는 스텝 수가 steps_per_flight보다 많아지고, max_steps를 다 써도 착지하지 못하면 NaN으로 남김
+    t_vacuum = (vy + np.sqrt(np.maximum(vy**2 + 2 * g * y, 0))) / g
+    dt = np.maximum(t_vacuum, 1e-6) / steps_per_flight
+
+    result = {
+        "range": np.zeros(n),
+        "flight_time": np.zeros(n),
+        "max_height": y.copy(),
+        "impact_speed": np.hypot(vx, vy),
+    }
+    paths = [[(0.0, 0.0, yi)] for yi in y] if record else None
+
+    # 활성 발사체의 상태만 압축된 배열로 유지하고, 착지하면 결과에 기록한 뒤 배열에서 뺍니다.
+    active = np.flatnonzero(t_vacuum > 0)
+    x, y, vx, vy = x[active], y[active], vx[active], vy[active]
+    k, wind, dt = k[active], wind[active], dt[active]
+    t = np.zeros(active.size)
+    top = y.copy()
+    for _ in range(max_steps):
+        if active.size == 0:
+            break
+        h = dt
+
+        # --- RK4 한 스텝 ---
+        ax1, ay1 = _acceleration(vx, vy, k, wind, g)
+        vx2, vy2 = vx + 0.5 * h * ax1, vy + 0.5 * h * ay1
+        ax2, ay2 = _acceleration(vx2, vy2, k, wind, g)
+        vx3, vy3 = vx + 0.5 * h * ax2, vy + 0.5 * h * ay2
+        ax3, ay3 = _acceleration(vx3, vy3, k, wind, g)
+        vx4, vy4 = vx + h * ax3, vy + h * ay3
+        ax4, ay4 = _acceleration(vx4, vy4, k, wind, g)
+        nvx = vx + h / 6 * (ax1 + 2 * ax2 + 2 * ax3 + ax4)
+        nvy = vy + h / 6 * (ay1 + 2 * ay2 + 2 * ay3 + ay4)
+        nx = x + h / 6 * (vx + 2 * vx2 + 2 * vx3 + vx4)
+        ny = y + h / 6 * (vy + 2 * vy2 + 2 * vy3 + vy4)
+
+        # 최고점: 스텝 안에서 vy 부호가 바뀌면 vy를 선형 보간한 정점 높이로 갱신
+        apex = (vy > 0) & (nvy <= 0)
+        if apex.any():
+            top[apex] = np.maximum(top[apex], y[apex] + 0.5 * h[apex] * vy[apex] ** 2 / (vy[apex] - nvy[apex]))
+        np.maximum(top, ny, out=top)
+
+        # --- 지면 충돌: 이번 스텝에서 y가 0 아래로 내려간 발사체 ---
+        landed = ny <= 0
+        if landed.any():
+            s = _ground_fraction(y[landed], vy[landed], ny[landed], nvy[landed], h[landed])
+            idx = active[landed]
+            result["range"][idx] = _hermite(x[landed], vx[landed], nx[landed], nvx[landed], h[landed], s)
+            result["flight_time"][idx] = t[landed] + s * h[landed]
+            result["max_height"][idx] = top[landed]
+            result["impact_speed"][idx] = np.hypot(
+                vx[landed] + s * (nvx[landed] - vx[landed]), vy[landed] + s * (nvy[landed] - vy[landed])
+            )
+            if record:
+                for i, ti, xi in zip(idx, result["flight_time"][idx], result["range"][idx]):
+                    paths[i].append((ti, xi, 0.0))
+
+            # 착지한 발사체는 활성 집합에서 제외
+            still = ~landed
+            active = active[still]
+            x, y, vx, vy = nx[still], ny[still], nvx[still], nvy[still]
+            k, wind, dt, t, top = k[still], wind[still], dt[still], t[still] + h[still], top[still]
+        else:
+            x, y, vx, vy = nx, ny, nvx, nvy
+            t = t + h
+        if record:
+            for i, ti, xi, yi in zip(active, t, x, y):
+                paths[i].append((ti, xi, yi))
+
+    if active.size:
+        # 스텝을 다 쓸 때까지 착지하지 못함: 0이 아니라 NaN으로 두어 실제 값 0과 구분
+        for key in result:
+            result[key][active] = np.nan
+        warnings.warn(
+            f"발사체 {active.size:,}개가 max_steps={max_steps:,} 스텝 안에 착지하지 않아 결과를 NaN으로 둡니다.",
+            RuntimeWarning,
+            stacklevel=2
+        )
+
+    result = {key: value.reshape(speed.shape) for key, value in result.items()}
+    if record:
+        columns = [np.array(path).reshape(-1, 3).T for path in paths]
+        result["paths"] = [(px, py) for _, px, py in columns]
+        result["path_times"] = [pt for pt, _, _ in columns]
+    return result
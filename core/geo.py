@@ -0,0 +1,31 @@
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def unit_vectors(lat, lon):
+    """위경도(도)를 3차원 단위 벡터로 바꿉니다. 벡터 사이 직선(현) 거리가 작을수록 구면 거리도 작습니다."""
+    lat = np.radians(np.asarray(lat, dtype=np.float64))
+    lon = np.radians(np.asarray(lon, dtype=np.float64))
+    cos_lat = np.cos(lat)
+    return np.column_stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)])
+
+
+def chord_to_km(chord):
+    """단위 구의 현 길이를 지표면 대원 거리(km)로 바꿉니다."""
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.clip(np.asarray(chord) / 2, 0, 1))
+
+
+def haversine_matrix(lat1, lon1, lat2=None, lon2=None):
+    """
+    두 위치 목록 사이의 대원 거리 행렬(km)을 브로드캐스팅으로 한 번에 계산합니다.
+    lat2/lon2를 생략하면 첫 번째 목록끼리의 (n, n) 행렬입니다.
+    """
+    if lat2 is None:
+        lat2, lon2 = lat1, lon1
+    lat1 = np.radians(np.asarray(lat1, dtype=np.float64))[:, None]
+    lon1 = np.radians(np.asarray(lon1, dtype=np.float64))[:, None]
+    lat2 = np.radians(np.asarray(lat2, dtype=np.float64))[None, :]
+    lon2 = np.radians(np.asarray(lon2, dtype=np.float64))[None, :]
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
@@ -0,0 +1,145 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+
+import numpy as np
+
+from core.drag import drag_factor, simulate
+from core.projectile import G
+
+DEFAULT_CHUNK_SIZE = 50_000
+BAND_PERCENTILES = (5, 50, 95)
+
+
+def launch_spec(speed, speed_sd, angle, angle_sd, azimuth_sd=0.0, drag=False, cd=0.47, cd_sd=0.0,
+                diameter=0.22, mass=0.43, wind=0.0, height=0.0, g=G, steps_per_flight=100):
+    """
+    몬테카를로 한 번의 실행 조건입니다. (평균과 표준편차, 공기 저항 여부와 공 제원)
+    프로세스 풀로 넘길 수 있도록 기본 자료형만 담은 dict로 만듭니다.
+    공기 저항 적분은 표본 오차보다 충분히 작은 비행당 100스텝(사거리 상대 오차 ~1e-3 이하)을 씁니다.
+    """
+    return {
+        "speed": float(speed), "speed_sd": float(speed_sd),
+        "angle": float(angle), "angle_sd": float(angle_sd),
+        "azimuth_sd": float(azimuth_sd),
+        "drag": bool(drag), "cd": float(cd), "cd_sd": float(cd_sd),
+        "diameter": float(diameter), "mass": float(mass),
+        "wind": float(wind), "height": float(height),
+        "g": float(g), "steps_per_flight": int(steps_per_flight),
+    }
+
+
+def sample_launches(spec, n, rng):
+    """정규분포로 속도/각도/항력 계수/방위각 표본을 뽑습니다. 물리적으로 불가능한 값은 경계로 자릅니다."""
+    cd_sd = spec["cd_sd"] if spec["drag"] else 0.0
+    return {
+        "speed": np.maximum(rng.normal(spec["speed"], spec["speed_sd"], n), 0.0),
+        "angle": np.clip(rng.normal(spec["angle"], spec["angle_sd"], n), 0.0, 90.0),
+        "cd": np.maximum(rng.normal(spec["cd"], cd_sd, n), 0.0),
+        "azimuth": rng.normal(0.0, spec["azimuth_sd"], n),
+    }
+
+
+def _chunk_rng(seed, chunk_index):
+    # 청크마다 독립적이고 재현 가능한 난수열 (작업자 수나 완료 순서와 무관)
+    return np.random.default_rng([seed, chunk_index])
+
+
+def landing_chunk(spec, n, seed, chunk_index):
+    """
+    표본 n개의 착지점을 계산합니다. 사거리 방향(down)과 좌우 방향(cross) 좌표, 비행 시간을 반환합니다.
+    진공이면 닫힌 해로, 공기 저항이 있으면 core.drag.simulate로 한 번에 적분합니다.
+    """
+    samples = sample_launches(spec, n, _chunk_rng(seed, chunk_index))
+    if spec["drag"]:
+        k = drag_factor(samples["cd"], spec["diameter"], spec["mass"])
+        result = simulate(samples["speed"], samples["angle"], k, spec["wind"], spec["height"], spec["g"],
+                          steps_per_flight=spec["steps_per_flight"])
+        range_, flight_time = result["range"], result["flight_time"]
+    else:
+        angle = np.radians(samples["angle"])
+        vx, vy = samples["speed"] * np.cos(angle), samples["speed"] * np.sin(angle)
+        flight_time = (vy + np.sqrt(vy**2 + 2 * spec["g"] * spec["height"])) / spec["g"]
+        range_ = vx * flight_time
+    azimuth = np.radians(samples["azimuth"])
+    return {
+        "down": range_ * np.cos(azimuth),
+        "cross": range_ * np.sin(azimuth),
+        "flight_time": flight_time,
+    }
+
+
+def run_monte_carlo(spec, n_samples, chunk_size=DEFAULT_CHUNK_SIZE, workers=1, seed=0):
+    """
+    n_samples개의 착지점을 청크 단위로 계산하면서, 청크가 끝날 때마다 (완료 개수, 지금까지의 결과)를 내보냅니다.
+    화면은 이 값으로 차트를 갱신해 수렴하는 추정치를 보여줄 수 있습니다.
+    workers > 1이고 공기 저항이 있으면 청크를 프로세스 풀에 나눠 맡깁니다. (진공은 닫힌 해라 한 프로세스로 충분)
+    """
+    chunks = [(i, min(chunk_size, n_samples - lo)) for i, lo in enumerate(range(0, n_samples, chunk_size))]
+    arrays = {name: np.empty(n_samples) for name in ("down", "cross", "flight_time")}
+    done = 0
+
+    def collect(part):
+        nonlocal done
+        size = len(part["down"])
+        for name, values in part.items():
+            arrays[name][done:done + size] = values
+        done += size
+        return done, {name: values[:done] for name, values in arrays.items()}
+
+    if workers > 1 and spec["drag"] and len(chunks) > 1:
+        # fork는 스레드가 도는 서버 프로세스에서 안전하지 않으므로 spawn으로 작업자를 띄움
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), mp_context=get_context("spawn")) as pool:
+            futures = [pool.submit(landing_chunk, spec, n, seed, i) for i, n in chunks]
+            for future in as_completed(futures):
+                yield collect(future.result())
+    else:
+        for i, n in chunks:
+            yield collect(landing_chunk(spec, n, seed, i))
+
+
+def available_workers():
+    return max(1, os.cpu_count() or 1)
+
+
+def dispersion(down, cross):
+    """
+    착지점 분산 통계입니다.
+    CEP는 평균 착지점을 중심으로 표본의 50%(CEP90은 90%)가 들어가는 원의 반지름입니다.
+    """
+    center_down, center_cross = float(np.mean(down)), float(np.mean(cross))
+    miss = np.hypot(down - center_down, cross - center_cross)
+    p_low, p_mid, p_high = np.percentile(down, BAND_PERCENTILES)
+    return {
+        "center_down": center_down,
+        "center_cross": center_cross,
+        "cep50": float(np.median(miss)),
+        "cep90": float(np.percentile(miss, 90)),
+        "range_p5": float(p_low),
+        "range_p50": float(p_mid),
+        "range_p95": float(p_high),
+        "range_sd": float(np.std(down)),
+    }
+
+
+def trajectory_bands(spec, n=200, seed=0, num=200):
+    """
+    표본 n개의 궤적을 공통 거리 격자 위에 보간해, 거리별 높이의 백분위(5/50/95%) 띠를 계산합니다.
+    이미 착지한 표본은 그 거리에서 높이 0으로 봅니다.
+    반환: (x 격자, {백분위: 높이 배열})
+    """
+    # 착지점 청크들과 겹치지 않는 별도의 난수열
+    samples = sample_launches(spec, n, np.random.default_rng([seed, 0, 1]))
+    k = drag_factor(samples["cd"], spec["diameter"], spec["mass"]) if spec["drag"] else 0.0
+    wind = spec["wind"] if spec["drag"] else 0.0
+    result = simulate(samples["speed"], samples["angle"], k, wind, spec["height"], spec["g"],
+                      steps_per_flight=spec["steps_per_flight"], record=True)
+
+    x_max = max(float(np.max(result["range"])), 1e-6)
+    x_grid = np.linspace(0, x_max, num)
+    heights = np.empty((n, num))
+    for row, (px, py) in enumerate(result["paths"]):
+        # 강한 맞바람에서 x가 되돌아가는 경우를 막기 위해 단조 증가로 맞춤
+        heights[row] = np.interp(x_grid, np.maximum.accumulate(px), py, right=0.0)
+    bands = dict(zip(BAND_PERCENTILES, np.percentile(heights, BAND_PERCENTILES, axis=0)))
+    return x_grid, bands
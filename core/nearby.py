@@ -0,0 +1,108 @@
+import numpy as np
+from scipy.spatial import cKDTree
+
+from core.geo import EARTH_RADIUS_KM, chord_to_km, haversine_matrix, unit_vectors
+
+
+class NearbyIndex:
+    """
+    관광지 좌표의 근접 검색 인덱스입니다.
+    좌표를 단위 벡터로 바꿔 cKDTree에 넣으므로 현 길이 순서가 곧 구면 거리 순서입니다.
+    """
+
+    def __init__(self, lat, lon):
+        self.lat = np.asarray(lat, dtype=np.float64)
+        self.lon = np.asarray(lon, dtype=np.float64)
+        self._tree = cKDTree(unit_vectors(self.lat, self.lon))
+
+    def __len__(self):
+        return len(self.lat)
+
+    def nearest(self, lat, lon, k=5, exclude=None):
+        """(lat, lon)에서 가까운 장소 k개의 번호와 거리(km)를 가까운 순서로 반환합니다. exclude 번호는 뺍니다."""
+        k_query = min(k + (exclude is not None), len(self))
+        if k_query == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        chord, idx = self._tree.query(unit_vectors([lat], [lon]), k=k_query)
+        chord, idx = np.atleast_1d(chord[0]), np.atleast_1d(idx[0])
+        keep = idx != exclude if exclude is not None else np.ones(len(idx), dtype=bool)
+        return idx[keep][:k], chord_to_km(chord[keep][:k])
+
+    def within(self, lat, lon, radius_km):
+        """(lat, lon)에서 radius_km 안의 장소 번호와 거리(km)를 가까운 순서로 반환합니다."""
+        chord_radius = 2 * np.sin(min(radius_km / EARTH_RADIUS_KM, np.pi) / 2)
+        idx = np.asarray(self._tree.query_ball_point(unit_vectors([lat], [lon])[0], chord_radius), dtype=np.int64)
+        distance = haversine_matrix([lat], [lon], self.lat[idx], self.lon[idx])[0]
+        order = np.argsort(distance, kind="stable")
+        return idx[order], distance[order]
+
+    def distance_matrix(self, indices):
+        """고른 장소들 사이의 거리 행렬(km)"""
+        indices = np.asarray(indices, dtype=np.int64)
+        return haversine_matrix(self.lat[indices], self.lon[indices])
+
+
+def route_length(route, dist, closed=False):
+    route = np.asarray(route)
+    total = dist[route[:-1], route[1:]].sum()
+    if closed and len(route) > 1:
+        total += dist[route[-1], route[0]]
+    return float(total)
+
+
+def nearest_neighbour_route(dist, start=0):
+    """출발점에서 매번 가장 가까운 미방문 장소로 가는 순서"""
+    n = len(dist)
+    visited = np.zeros(n, dtype=bool)
+    route = [start]
+    visited[start] = True
+    for _ in range(n - 1):
+        candidates = np.where(visited, np.inf, dist[route[-1]])
+        nxt = int(np.argmin(candidates))
+        route.append(nxt)
+        visited[nxt] = True
+    return route
+
+
+def two_opt(route, dist, closed=False, max_passes=50):
+    """
+    구간 뒤집기(2-opt)로 경로를 줄입니다. 출발점(route[0])은 고정합니다.
+    i마다 가능한 모든 j의 거리 변화를 한 번에 계산해 가장 좋은 뒤집기를 적용하고,
+    더 줄지 않을 때까지 반복합니다. 열린 경로는 모든 곳까지 거리 0인 가상의 끝점을 붙여 같은 식으로 다룹니다.
+    """
+    route = np.asarray(route, dtype=np.int64).copy()
+    n = len(route)
+    if n < 3:
+        return route.tolist()
+    padded = np.zeros((len(dist) + 1, len(dist) + 1))
+    padded[:-1, :-1] = dist
+    tail = route[0] if closed else len(dist)
+
+    for _ in range(max_passes):
+        improved = False
+        for i in range(1, n - 1):
+            extended = np.append(route, tail)
+            j = np.arange(i + 1, n)
+            a, b = extended[i - 1], extended[i]
+            c, e = extended[j], extended[j + 1]
+            delta = padded[a, c] + padded[b, e] - padded[a, b] - padded[c, e]
+            best = int(np.argmin(delta))
+            if delta[best] < -1e-9:
+                route[i:j[best] + 1] = route[i:j[best] + 1][::-1]
+                improved = True
+        if not improved:
+            break
+    return route.tolist()
+
+
+def plan_route(dist, start=0, closed=False):
+    """
+    거리 행렬 위에서 방문 순서를 정합니다. (최근접 이웃으로 시작해 2-opt로 개선)
+    반환: (방문 순서 [행렬 번호], 총 거리 km, 최근접 이웃만 썼을 때의 거리 km)
+    """
+    dist = np.asarray(dist, dtype=np.float64)
+    if len(dist) == 0:
+        return [], 0.0, 0.0
+    greedy = nearest_neighbour_route(dist, start)
+    route = two_opt(greedy, dist, closed)
+    return route, route_length(route, dist, closed), route_length(greedy, dist, closed)
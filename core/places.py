@@ -0,0 +1,58 @@
+import json
+import os
+
+import numpy as np
+
+DEFAULT_PLACES_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "places.json"
+)
+
+
+class PlaceCatalog:
+    """
+    파일(JSON)에 저장된 관광지 목록과 조회용 인덱스입니다.
+    - 도시 인덱스: 도시 이름 -> 장소 번호 배열
+    - 위도/경도 배열: 지도 범위와 근접 검색(core.nearby)에 씀
+    장소 번호는 파일에 적힌 순서이며, records()로 원래 dict를 꺼냅니다.
+    """
+
+    def __init__(self, places, version=""):
+        self.places = [dict(place, location=tuple(place["location"])) for place in places]
+        self.version = version
+        locations = np.array([place["location"] for place in self.places], dtype=np.float64).reshape(-1, 2)
+        self.lat = locations[:, 0]
+        self.lon = locations[:, 1]
+
+        city_names = np.array([place["city"] for place in self.places], dtype=object)
+        self.cities = sorted(set(city_names))
+        self._by_city = {city: np.flatnonzero(city_names == city) for city in self.cities}
+
+    @classmethod
+    def load(cls, path=DEFAULT_PLACES_PATH):
+        with open(path, encoding="utf-8") as f:
+            places = json.load(f)["places"]
+        stat = os.stat(path)
+        # 파일이 바뀌면 달라지는 값이라 화면 쪽 캐시 키로 씀
+        return cls(places, version=f"{stat.st_mtime_ns}-{stat.st_size}")
+
+    def __len__(self):
+        return len(self.places)
+
+    def indices(self, city=None):
+        """도시 이름으로 장소 번호를 찾습니다. city가 None이면 전체입니다."""
+        if city is None:
+            return np.arange(len(self.places))
+        return self._by_city.get(city, np.empty(0, dtype=np.int64))
+
+    def records(self, indices):
+        return [self.places[i] for i in indices]
+
+    def bounds(self, indices):
+        """장소들을 모두 담는 [[남, 서], [북, 동]] (지도 fit_bounds용)"""
+        if len(indices) == 0:
+            return None
+        indices = np.asarray(indices)
+        return [
+            [float(self.lat[indices].min()), float(self.lon[indices].min())],
+            [float(self.lat[indices].max()), float(self.lon[indices].max())],
+        ]
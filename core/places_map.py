@@ -0,0 +1,71 @@
+import folium
+from folium.plugins import FastMarkerCluster
+
+CALIFORNIA_CENTER = [36.7783, -119.4179]
+FAST_CLUSTER_THRESHOLD = 300  # 이보다 많으면 개별 Marker 대신 FastMarkerCluster
+FIT_MAX_ZOOM = 12  # 필터로 고른 장소에 맞춰 확대할 때의 최대 확대 수준 (장소가 하나뿐일 때 지나치게 확대되지 않게)
+
+# FastMarkerCluster는 [위도, 경도, 이름] 배열만 보내고 마커는 브라우저에서 만듦
+_FAST_MARKER_CALLBACK = """
+function (row) {
+    var marker = L.marker(new L.LatLng(row[0], row[1]));
+    marker.bindTooltip(row[2]);
+    marker.bindPopup(row[2]);
+    return marker;
+}
+"""
+
+
+def add_route_layer(m, catalog, route, closed=False):
+    """여행 경로(장소 번호 순서)를 선과 방문 순서 번호 마커로 그립니다."""
+    points = [[float(catalog.lat[i]), float(catalog.lon[i])] for i in route]
+    bounds = catalog.bounds(route)
+    if closed and len(points) > 1:
+        points.append(points[0])
+    layer = folium.FeatureGroup(name="여행 경로")
+    folium.PolyLine(points, color="#e63946", weight=4, opacity=0.8).add_to(layer)
+    for order, i in enumerate(route, start=1):
+        folium.Marker(
+            location=points[order - 1],
+            tooltip=f"{order}. {catalog.places[i]['name']}",
+            icon=folium.DivIcon(
+                html=(
+                    '<div style="background:#e63946;color:white;border-radius:50%;width:24px;height:24px;'
+                    f'line-height:24px;text-align:center;font-weight:bold;">{order}</div>'
+                ),
+                icon_size=(24, 24),
+                icon_anchor=(12, 12),
+            ),
+        ).add_to(layer)
+    layer.add_to(m)
+    m.fit_bounds(bounds)
+
+
+def build_places_map(catalog, indices, cluster_threshold=FAST_CLUSTER_THRESHOLD, route=(), closed=False):
+    """
+    선택된 장소들로 folium 지도를 만듭니다.
+    장소가 cluster_threshold개 이하이면 기존처럼 개별 Marker를, 그보다 많으면 FastMarkerCluster를 씁니다.
+    도시/검색 필터로 일부만 골랐으면 그 장소들이 보이도록 확대하고,
+    route(장소 번호 순서)가 있으면 여행 경로를 함께 그려 경로에 맞춥니다.
+    """
+    m = folium.Map(location=CALIFORNIA_CENTER, zoom_start=6)
+    if 0 < len(indices) < len(catalog):
+        m.fit_bounds(catalog.bounds(indices), max_zoom=FIT_MAX_ZOOM)
+    if len(indices) > cluster_threshold:
+        rows = [[float(catalog.lat[i]), float(catalog.lon[i]), catalog.places[i]["name"]] for i in indices]
+        FastMarkerCluster(rows, callback=_FAST_MARKER_CALLBACK, name="관광지").add_to(m)
+    else:
+        for place in catalog.records(indices):
+            folium.Marker(
+                location=place["location"],
+                popup=place["name"],
+                tooltip=place["name"]
+            ).add_to(m)
+    if len(route) > 0:
+        add_route_layer(m, catalog, route, closed)
+    return m
+
+
+def render_map_html(m):
+    """지도를 완성된 HTML 문서 문자열로 렌더링합니다. (캐시해 두고 그대로 화면에 넣을 수 있음)"""
+    return m.get_root().render()
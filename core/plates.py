@@ -0,0 +1,106 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+from core.geo import EARTH_RADIUS_KM, chord_to_km, unit_vectors
+
+DEFAULT_BOUNDARY_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "plate_boundaries.geojson"
+)
+
+BOUNDARY_TYPE_LABELS = {
+    "convergent": "수렴형 (섭입대/충돌대)",
+    "divergent": "발산형 (해령/열곡)",
+    "transform": "변환 단층",
+}
+BOUNDARY_TYPE_COLORS = {
+    "convergent": "#d62828",
+    "divergent": "#2a9d8f",
+    "transform": "#f4a261",
+}
+
+
+def _densify(coords, step_km):
+    """경계선 꼭짓점 사이를 대원(great circle)을 따라 step_km 이하 간격의 점으로 채웁니다."""
+    coords = np.asarray(coords, dtype=np.float64)
+    vertices = unit_vectors(coords[:, 1], coords[:, 0])
+    points = [vertices[:1]]
+    for a, b in zip(vertices[:-1], vertices[1:]):
+        angle = np.arccos(np.clip(a @ b, -1, 1))
+        n = max(int(np.ceil(angle * EARTH_RADIUS_KM / step_km)), 1)
+        t = np.arange(1, n + 1)[:, None] / n
+        if angle < 1e-12:
+            points.append(np.repeat(b[None], n, axis=0))
+            continue
+        # 구면 선형 보간 (slerp)
+        points.append((np.sin((1 - t) * angle) * a + np.sin(t * angle) * b) / np.sin(angle))
+    return np.vstack(points)
+
+
+def _categorical(values, index):
+    # 경계별 값(values)을 경계 번호(index)로 펼친 Categorical (중복 값은 하나의 카테고리로 합침)
+    categories, codes = np.unique(values, return_inverse=True)
+    return pd.Categorical.from_codes(codes[index], categories)
+
+
+class PlateBoundaryIndex:
+    """
+    판 경계선에 대한 공간 인덱스입니다.
+    경계선을 step_km 간격의 점으로 나눈 뒤 단위 구 위의 3차원 좌표로 KD-트리를 만들어 두고,
+    지진 전체의 가장 가까운 경계와 거리를 한 번의 질의로 계산합니다. (현 길이와 대원 거리는 단조 관계)
+    경계점 간격이 step_km이므로 거리 오차는 step_km / 2 이하입니다.
+    """
+
+    def __init__(self, geojson, step_km=10.0):
+        self.geojson = geojson
+        self.plate_names = geojson.get("metadata", {}).get("plates", {})
+        features = geojson["features"]
+        self.names = np.array([f["properties"]["name"] for f in features])
+        self.types = np.array([f["properties"]["type"] for f in features])
+        self.plates = np.array([f["properties"]["plates"] for f in features])
+
+        points, owners = [], []
+        for i, feature in enumerate(features):
+            dense = _densify(feature["geometry"]["coordinates"], step_km)
+            points.append(dense)
+            owners.append(np.full(len(dense), i, dtype=np.int32))
+        self._tree = cKDTree(np.vstack(points))
+        self._owners = np.concatenate(owners)
+
+    @classmethod
+    def load(cls, path=DEFAULT_BOUNDARY_PATH, **kwargs):
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f), **kwargs)
+
+    def nearest(self, lat, lon):
+        """각 위치에서 가장 가까운 경계까지의 거리(km, float32)와 경계 번호를 반환합니다."""
+        if len(lat) == 0:
+            return np.empty(0, dtype=np.float32), np.empty(0, dtype=np.int32)
+        chord, point_idx = self._tree.query(unit_vectors(lat, lon))
+        distance = chord_to_km(chord)
+        return distance.astype(np.float32), self._owners[point_idx]
+
+    def annotate(self, df):
+        """지진 DataFrame에 가장 가까운 경계의 거리/이름/유형/판 컬럼을 붙인 복사본을 반환합니다."""
+        distance, boundary = self.nearest(df["latitude"].to_numpy(), df["longitude"].to_numpy())
+        return df.assign(
+            boundary_distance_km=distance,
+            boundary_name=_categorical(self.names, boundary),
+            boundary_type=_categorical(self.types, boundary),
+            boundary_plates=_categorical(self.plates, boundary),
+        )
+
+    def plate_counts(self, annotated, max_distance_km):
+        """경계에서 max_distance_km 이내의 지진을 경계 양쪽 판에 하나씩 세어 판별 지진 수를 반환합니다."""
+        near = annotated.loc[annotated["boundary_distance_km"] <= max_distance_km, "boundary_plates"]
+        pair_counts = near.value_counts()
+        counts = {}
+        for pair, n in pair_counts.items():
+            for code in pair.split("-"):
+                counts[code] = counts.get(code, 0) + int(n)
+        result = pd.Series(counts, dtype="int64").sort_values(ascending=False)
+        result.index = [f"{self.plate_names.get(code, code)} ({code})" for code in result.index]
+        return result
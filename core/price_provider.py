@@ -0,0 +1,153 @@
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+NO_DATA = "데이터 없음"  # 요청은 성공했지만 응답에 티커의 값이 하나도 없을 때의 실패 사유
+
+
+class PriceProvider:
+    """
+    가격 데이터 제공자 인터페이스입니다.
+    fetch_close(tickers, start, end)는 [start, end] 구간(양 끝 포함)의 종가를
+    티커별 컬럼, 날짜 인덱스의 DataFrame으로 반환해야 합니다.
+    데이터가 없는 티커는 컬럼을 생략하면 되고, 요청 자체가 실패하면 예외를 던집니다.
+    """
+
+    name = "base"
+
+    def fetch_close(self, tickers, start, end):
+        raise NotImplementedError
+
+
+class YahooProvider(PriceProvider):
+    """yfinance 기반 제공자입니다."""
+
+    name = "Yahoo Finance"
+
+    def fetch_close(self, tickers, start, end):
+        import yfinance as yf
+
+        # 청크 안의 티커는 yf.download가 threads=True로 동시에 받음
+        # (yfinance 1.7부터 download는 호출마다 상태를 따로 두므로 여러 청크를 동시에 불러도 섞이지 않음)
+        # yfinance의 end는 해당 날짜를 포함하지 않으므로 하루를 더해서 요청
+        data = yf.download(
+            list(tickers), start=start, end=end + timedelta(days=1), auto_adjust=False,
+            threads=True, progress=False, group_by="column", multi_level_index=True
+        )
+        if data is None or data.empty or "Close" not in data.columns.get_level_values(0):
+            return pd.DataFrame()
+        # 받지 못한 티커는 값이 모두 비어 있는 컬럼으로 오므로 뺌 (fetch_close_chunked가 사유를 기록)
+        close = data["Close"].dropna(axis=1, how="all")
+        if close.index.tz is not None:
+            close.index = close.index.tz_localize(None)
+        close.index = close.index.normalize()
+        return close
+
+
+class FixtureProvider(PriceProvider):
+    """
+    네트워크 없이 합성 OHLC 데이터를 돌려주는 오프라인 제공자입니다.
+    티커 이름으로 난수 시드를 정하므로 같은 티커는 청크 구성과 관계없이 항상 같은 값을 받습니다.
+    latency(초)를 주면 요청마다 지연을 흉내 내어 동시성/처리량 벤치마크에 쓸 수 있고,
+    fail_tickers에 들어 있는 티커가 포함된 요청은 실패합니다.
+    """
+
+    name = "오프라인 합성 데이터"
+
+    def __init__(self, latency=0.0, fail_tickers=(), history_start="2015-01-01"):
+        self.latency = latency
+        self.fail_tickers = set(fail_tickers)
+        self.history_start = pd.Timestamp(history_start)
+
+    def fetch_ohlc(self, tickers, start, end):
+        """yf.download와 같은 ('Open'|'High'|'Low'|'Close', 티커) 2단 컬럼의 DataFrame을 반환합니다."""
+        if self.latency:
+            time.sleep(self.latency)
+        failed = self.fail_tickers.intersection(tickers)
+        if failed:
+            raise ConnectionError(f"fixture 실패 티커: {', '.join(sorted(failed))}")
+
+        # 같은 날짜의 값이 요청 구간과 무관하도록 고정된 시작일부터 경로를 만든 뒤 잘라냄
+        dates = pd.bdate_range(self.history_start, end)
+        keep = dates >= pd.Timestamp(start)
+        frames = {}
+        for ticker in tickers:
+            # 값마다 따로 난수열을 써야 end가 달라져도 앞쪽 날짜의 값이 바뀌지 않음
+            seed = zlib.crc32(ticker.encode("utf-8"))
+            level, walk, gap, wick = (np.random.default_rng([seed, i]) for i in range(4))
+            close = level.uniform(20, 500) * np.exp(np.cumsum(walk.normal(0.0004, 0.018, size=len(dates))))
+            open_ = close * np.exp(gap.normal(0, 0.005, size=len(dates)))
+            spread = np.abs(wick.normal(0, 0.01, size=len(dates)))
+            frames[ticker] = pd.DataFrame(
+                {
+                    "Open": open_,
+                    "High": np.maximum(open_, close) * (1 + spread),
+                    "Low": np.minimum(open_, close) * (1 - spread),
+                    "Close": close,
+                },
+                index=dates,
+            )[keep]
+        ohlc = pd.concat(frames, axis=1)
+        return ohlc.swaplevel(axis=1).sort_index(axis=1)
+
+    def fetch_close(self, tickers, start, end):
+        return self.fetch_ohlc(tickers, start, end)["Close"]
+
+
+def _chunks(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def _fetch_chunk(provider, chunk, start, end, retries, backoff):
+    for attempt in range(retries + 1):
+        try:
+            return provider.fetch_close(chunk, start, end)
+        except Exception:
+            if attempt == retries:
+                raise
+            time.sleep(backoff * (2 ** attempt))
+
+
+def fetch_close_chunked(provider, tickers, start, end, chunk_size=50, max_workers=8, retries=2, backoff=0.5):
+    """
+    티커 목록을 chunk_size 단위로 나누어 최대 max_workers개의 스레드에서 동시에 받아옵니다.
+    실패한 청크는 retries번까지 지수 백오프로 다시 시도합니다.
+    합쳐진 종가 DataFrame과 끝내 실패한 티커의 사유 dict(티커 -> 사유)를 반환합니다.
+    요청은 성공했지만 응답에 값이 없는 티커의 사유는 NO_DATA입니다.
+    """
+    tickers = list(tickers)
+    chunks = list(_chunks(tickers, chunk_size))
+    frames = []
+    failures = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as executor:
+        futures = {
+            executor.submit(_fetch_chunk, provider, chunk, start, end, retries, backoff): chunk
+            for chunk in chunks
+        }
+        for future in as_completed(futures):
+            try:
+                frame = future.result()
+            except Exception as e:
+                for ticker in futures[future]:
+                    failures[ticker] = f"다운로드 실패: {e}"
+                continue
+            for ticker in futures[future]:
+                if ticker not in frame.columns or frame[ticker].isna().all():
+                    failures[ticker] = NO_DATA
+            if not frame.empty:
+                frames.append(frame)
+
+    close_data = pd.concat(frames, axis=1) if frames else pd.DataFrame()
+    return close_data.sort_index(), failures
+
+
+# 페이지에서 선택할 수 있는 제공자 목록 (키 -> 클래스). 키는 로컬 저장소 하위 폴더 이름으로도 쓰입니다.
+PROVIDERS = {
+    "yahoo": YahooProvider,
+    "fixture": FixtureProvider,
+}
@@ -0,0 +1,178 @@
+import json
+import os
+import threading
+from datetime import date, datetime
+
+import pandas as pd
+
+from core import profiling
+from core.price_provider import NO_DATA
+
+# 저장 위치: 저장소 루트의 .cache/prices (티커별 Parquet 파일 + manifest.json)
+DEFAULT_STORE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "prices"
+)
+
+
+def _to_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return pd.Timestamp(value).date()
+
+
+def _normalize_index(index):
+    # yfinance가 돌려주는 인덱스(타임존 포함 여부가 버전마다 다름)를 날짜 단위로 통일
+    index = pd.DatetimeIndex(pd.to_datetime(index))
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.normalize()
+
+
+class PriceStore:
+    """
+    티커별 종가를 로컬 디스크에 보관하는 저장소입니다.
+    티커마다 Parquet 파일 하나를 두고, manifest.json에 티커별 저장 구간(시작일/마지막 저장일)을 기록합니다.
+    refresh()는 마지막 저장일 이후의 부족한 구간만 받아와 기존 데이터에 병합합니다.
+    """
+
+    def __init__(self, root=DEFAULT_STORE_DIR):
+        self.root = root
+        self._lock = threading.Lock()
+        os.makedirs(self.root, exist_ok=True)
+        self._manifest_path = os.path.join(self.root, "manifest.json")
+        self._manifest = self._load_manifest()
+
+    # --- manifest ---
+    def _load_manifest(self):
+        try:
+            with open(self._manifest_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self):
+        tmp_path = self._manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._manifest, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self._manifest_path)
+
+    def _path(self, ticker):
+        safe_name = ticker.replace("/", "_").replace("^", "_")
+        return os.path.join(self.root, f"{safe_name}.parquet")
+
+    def last_date(self, ticker):
+        """저장된 마지막 거래일을 반환합니다. 저장된 데이터가 없으면 None."""
+        meta = self._manifest.get(ticker)
+        return date.fromisoformat(meta["last"]) if meta else None
+
+    def covers(self, tickers, start):
+        """모든 티커가 start부터 저장되어 있어 네트워크 없이 (최신이 아닐 수는 있지만) 답할 수 있는지 여부입니다."""
+        return all(
+            ticker in self._manifest and date.fromisoformat(self._manifest[ticker]["from"]) <= _to_date(start)
+            for ticker in tickers
+        )
+
+    # --- 읽기/쓰기 ---
+    def read(self, ticker, start=None, end=None):
+        """저장된 종가를 Series로 반환합니다. 저장된 데이터가 없으면 빈 Series."""
+        path = self._path(ticker)
+        if not os.path.exists(path):
+            return pd.Series(index=pd.DatetimeIndex([], name="date"), dtype="float64", name=ticker)
+        series = pd.read_parquet(path)["close"].rename(ticker)
+        if start is not None:
+            series = series[series.index >= pd.Timestamp(_to_date(start))]
+        if end is not None:
+            series = series[series.index <= pd.Timestamp(_to_date(end))]
+        return series
+
+    def write(self, ticker, series, covered_from=None):
+        """새로 받은 종가를 기존 데이터와 병합해 저장합니다. 같은 날짜는 새 값이 우선합니다."""
+        with self._lock:
+            if self._merge(ticker, series, covered_from):
+                self._save_manifest()
+
+    def _merge(self, ticker, series, covered_from):
+        series = series.dropna()
+        series.index = _normalize_index(series.index)
+        existing = self.read(ticker)
+        merged = pd.concat([existing, series])
+        merged = merged[~merged.index.duplicated(keep="last")].sort_index()
+        if merged.empty:
+            return False
+        merged.index.name = "date"
+
+        path = self._path(ticker)
+        tmp_path = path + ".tmp"
+        merged.astype("float64").to_frame("close").to_parquet(tmp_path)
+        os.replace(tmp_path, path)
+
+        meta = self._manifest.get(ticker, {})
+        first = _to_date(covered_from) if covered_from is not None else merged.index[0].date()
+        if "from" in meta:
+            first = min(first, date.fromisoformat(meta["from"]))
+        self._manifest[ticker] = {
+            "from": first.isoformat(),
+            "last": merged.index[-1].date().isoformat(),
+            "updated": datetime.now().isoformat(timespec="seconds"),
+        }
+        return True
+
+    # --- 증분 갱신 ---
+    def _fetch_start(self, ticker, start):
+        meta = self._manifest.get(ticker)
+        if meta is None or date.fromisoformat(meta["from"]) > start:
+            # 저장본이 없거나 요청 구간이 더 과거로 넓어진 경우 전체 구간을 받음
+            return start
+        # 마지막 저장일은 장중에 받은 값일 수 있으므로 그날부터 다시 받아 덮어씀
+        return max(date.fromisoformat(meta["last"]), start)
+
+    def refresh(self, tickers, start, end, fetch_close):
+        """
+        [start, end] 구간에서 부족한 부분만 받아와 병합한 뒤,
+        저장소에서 읽은 종가 DataFrame(컬럼 = 티커)과 실패 내역 dict(티커 -> 사유)를 반환합니다.
+        fetch_close(tickers, start, end)는 (종가 DataFrame, 실패 내역 dict)를 반환해야 합니다.
+        사유가 NO_DATA(응답에 값 없음)인 티커는 저장본이 있으면 실패로 보지 않습니다.
+        업스트림 호출이 실패해도 저장된 데이터로 결과를 만들어 반환합니다.
+        """
+        start, end = _to_date(start), _to_date(end)
+
+        # 같은 시작일이 필요한 티커끼리 묶어서 한 번에 요청
+        groups = {}
+        for ticker in tickers:
+            groups.setdefault(self._fetch_start(ticker, start), []).append(ticker)
+
+        failures = {}
+        for fetch_from, group in groups.items():
+            try:
+                with profiling.timer(f"시세 다운로드 ({len(group)}종목)"):
+                    fetched, fetch_failures = fetch_close(group, fetch_from, end)
+            except Exception as e:
+                fetched, fetch_failures = pd.DataFrame(), {ticker: f"다운로드 실패: {e}" for ticker in group}
+            failures.update(fetch_failures)
+
+            with self._lock:
+                changed = False
+                for ticker in group:
+                    reason = fetch_failures.get(ticker)
+                    if reason not in (None, NO_DATA):
+                        continue
+                    if ticker in fetched.columns and fetched[ticker].notna().any():
+                        changed |= self._merge(ticker, fetched[ticker], fetch_from)
+                    elif self.last_date(ticker) is None:
+                        failures[ticker] = NO_DATA
+                    else:
+                        # 증분 구간(주말/휴장일)이 비어 있는 것은 정상이므로, 저장본이 있으면 실패로 보지 않음
+                        failures.pop(ticker, None)
+                if changed:
+                    self._save_manifest()
+
+        return self.read_close(tickers, start, end), failures
+
+    def read_close(self, tickers, start, end):
+        """저장된 종가만으로 [start, end] 구간의 DataFrame(컬럼 = 티커)을 만듭니다."""
+        with profiling.timer("저장소 읽기"):
+            close_data = pd.DataFrame({ticker: self.read(ticker, start, end) for ticker in tickers})
+        close_data.index.name = "Date"
+        return close_data
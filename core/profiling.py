@@ -0,0 +1,296 @@
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+
+# 기록 위치: 저장소 루트의 .cache/profile/profile.jsonl (실행 한 번 = JSON 한 줄)
+DEFAULT_LOG_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "profile", "profile.jsonl"
+)
+QUERY_PARAM = "profile"  # ?profile=1 이면 화면에 타이밍 표를 보이고 로그에 기록, ?profile=0 이면 끔
+ENV_ENABLE = "APP_PROFILE"  # "1"이면 화면 표시 없이 모든 실행을 로그에 기록
+ENV_LOG_PATH = "APP_PROFILE_LOG"
+
+# 스크립트 실행(세션 스레드)마다 따로 잡히는 현재 프로파일. 없으면 모든 계측이 아무것도 하지 않음
+_current = ContextVar("page_profile", default=None)
+_log_lock = threading.Lock()
+
+
+class PageProfile:
+    """
+    페이지 스크립트 한 번 실행 동안의 단계별 시간, 캐시 적중/미스, 브라우저 전송 크기를 모읍니다.
+    단계는 시작 순서대로 (이름, 깊이, 초)로 쌓이므로 중첩된 타이머가 들여쓰기 표로 그대로 보입니다.
+    """
+
+    def __init__(self, page, show=False):
+        self.page = page
+        self.show = show
+        self.slot = None
+        self.started = time.perf_counter()
+        self.stages = []
+        self.caches = {}  # 함수 이름 -> {"kind", "calls", "misses"}
+        self.payloads = []
+        self.overhead = 0.0  # 전송 크기를 재느라 쓴 시간 (합계에서 뺌)
+        self._depth = 0
+
+    @contextmanager
+    def timer(self, name):
+        stage = [name, self._depth, 0.0]
+        self.stages.append(stage)
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            yield stage
+        finally:
+            stage[2] = time.perf_counter() - start
+            self._depth -= 1
+
+    def cache_call(self, name, kind):
+        entry = self.caches.setdefault(name, {"kind": kind, "calls": 0, "misses": 0})
+        entry["calls"] += 1
+        return entry
+
+    def add_payload(self, name, obj):
+        start = time.perf_counter()
+        nbytes, kind = payload_size(obj)
+        self.payloads.append({"name": name, "kind": kind, "bytes": nbytes})
+        self.overhead += time.perf_counter() - start
+        return nbytes
+
+    def total_seconds(self):
+        return time.perf_counter() - self.started - self.overhead
+
+    def to_record(self):
+        return {
+            "ts": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            "page": self.page,
+            "total_ms": round(self.total_seconds() * 1000, 2),
+            "overhead_ms": round(self.overhead * 1000, 2),
+            "stages": [{"name": name, "depth": depth, "ms": round(seconds * 1000, 2)} for name, depth, seconds in self.stages],
+            "caches": [{"name": name, **entry} for name, entry in self.caches.items()],
+            "payloads": self.payloads,
+        }
+
+
+def current():
+    """지금 실행 중인 페이지의 프로파일 (프로파일링이 꺼져 있으면 None)"""
+    return _current.get()
+
+
+@contextmanager
+def timer(name):
+    """
+    구간 시간을 현재 페이지 프로파일에 기록합니다. 프로파일링이 꺼져 있으면 아무 일도 하지 않습니다.
+    with profiling.timer("차트 생성"): ... 처럼 쓰거나 @profiling.timer("차트 생성") 데코레이터로 씁니다.
+    """
+    profile = _current.get()
+    if profile is None:
+        yield None
+        return
+    with profile.timer(name) as stage:
+        yield stage
+
+
+def _counted(st_decorator, kind):
+    """st.cache_data / st.cache_resource를 감싸 호출 수와 미스(함수 본문 실행) 수를 세는 데코레이터를 만듭니다."""
+
+    def decorator(func=None, **cache_kwargs):
+        def decorate(func):
+            name = func.__name__
+
+            # 캐시 미스일 때만 본문이 실행되므로 여기서 미스를 셈 (functools.wraps로 Streamlit 캐시 키는 원래 함수 기준)
+            @functools.wraps(func)
+            def body(*args, **kwargs):
+                profile = _current.get()
+                if profile is not None and name in profile.caches:
+                    profile.caches[name]["misses"] += 1
+                return func(*args, **kwargs)
+
+            cached = st_decorator(**cache_kwargs)(body)
+
+            @functools.wraps(func)
+            def call(*args, **kwargs):
+                profile = _current.get()
+                if profile is None:
+                    return cached(*args, **kwargs)
+                entry = profile.cache_call(name, kind)
+                misses = entry["misses"]
+                with profile.timer(name) as stage:
+                    try:
+                        return cached(*args, **kwargs)
+                    finally:
+                        stage[0] = f"{name} ({'미스' if entry['misses'] > misses else '적중'})"
+
+            call.clear = cached.clear
+            return call
+
+        return decorate(func) if func is not None else decorate
+
+    return decorator
+
+
+def cache_data(func=None, **cache_kwargs):
+    """st.cache_data와 같지만 프로파일에 호출/미스 수와 소요 시간을 남깁니다."""
+    import streamlit as st
+    return _counted(st.cache_data, "cache_data")(func, **cache_kwargs)
+
+
+def cache_resource(func=None, **cache_kwargs):
+    """st.cache_resource와 같지만 프로파일에 호출/미스 수와 소요 시간을 남깁니다."""
+    import streamlit as st
+    return _counted(st.cache_resource, "cache_resource")(func, **cache_kwargs)
+
+
+def payload_size(obj):
+    """Plotly figure(JSON), folium 지도(HTML), 문자열/바이트가 브라우저로 갈 때의 크기(바이트)와 종류입니다."""
+    if isinstance(obj, (bytes, bytearray)):
+        return len(obj), "bytes"
+    if isinstance(obj, str):
+        return len(obj.encode("utf-8")), "html"
+    if hasattr(obj, "get_root"):  # folium.Map
+        return len(obj.get_root().render().encode("utf-8")), "folium"
+    if hasattr(obj, "to_json"):  # plotly.graph_objects.Figure
+        return len(obj.to_json().encode("utf-8")), "plotly"
+    raise TypeError(f"전송 크기를 잴 수 없는 객체입니다: {type(obj).__name__}")
+
+
+def record_payload(name, obj):
+    """브라우저로 보낼 객체의 크기를 현재 프로파일에 기록합니다. (꺼져 있으면 크기를 재지 않음)"""
+    profile = _current.get()
+    return None if profile is None else profile.add_payload(name, obj)
+
+
+def plotly_chart(fig, name=None, container=None, **kwargs):
+    """st.plotly_chart와 같지만, 전송(직렬화) 시간과 figure 크기를 프로파일에 남깁니다."""
+    import streamlit as st
+    name = name or fig.layout.title.text or "Plotly 차트"
+    record_payload(name, fig)
+    with timer(f"전송: {name}"):
+        return (container or st).plotly_chart(fig, **kwargs)
+
+
+# --- 페이지 시작/끝 ---
+def start_page(page):
+    """
+    페이지 스크립트 앞부분에서 호출합니다.
+    ?profile=1 을 한 번 붙이면 같은 세션의 모든 페이지에서 타이밍 표가 보이고(?profile=0 으로 끔),
+    APP_PROFILE=1 환경 변수가 있으면 화면 표시 없이 로그에만 남깁니다.
+    """
+    import streamlit as st
+    flag = st.query_params.get(QUERY_PARAM)
+    if flag is not None:
+        st.session_state["_profile"] = flag == "1"
+    show = st.session_state.get("_profile", False)
+    if not show and os.environ.get(ENV_ENABLE) != "1":
+        _current.set(None)
+        return None
+
+    profile = PageProfile(page, show=show)
+    if show:
+        # 표는 스크립트가 끝나야 완성되므로, 페이지 위쪽에 자리만 잡아 둠
+        profile.slot = st.container()
+    _current.set(profile)
+    return profile
+
+
+def finish_page():
+    """페이지 스크립트 끝에서 호출합니다. 기록을 로그 파일에 덧붙이고, ?profile=1이면 표를 그립니다."""
+    profile = _current.get()
+    if profile is None:
+        return None
+    _current.set(None)
+    record = profile.to_record()
+    append_log(record)
+    if profile.show:
+        _render(profile, record)
+    return record
+
+
+def log_path():
+    return os.environ.get(ENV_LOG_PATH, DEFAULT_LOG_PATH)
+
+
+def append_log(record, path=None):
+    """기록 한 건을 JSON 한 줄로 덧붙입니다. (여러 세션이 동시에 써도 줄이 섞이지 않게 잠금)"""
+    path = path or log_path()
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    line = json.dumps(record, ensure_ascii=False) + "\n"
+    with _log_lock, open(path, "a", encoding="utf-8") as f:
+        f.write(line)
+
+
+def _render(profile, record):
+    import pandas as pd
+    import streamlit as st
+
+    total_ms = record["total_ms"]
+    with profile.slot.expander(f"⏱️ 프로파일: {profile.page} · {total_ms:,.0f} ms", expanded=False):
+        stages = pd.DataFrame({
+            "단계": ["　" * stage["depth"] + stage["name"] for stage in record["stages"]],
+            "시간 (ms)": [stage["ms"] for stage in record["stages"]],
+            "비율": [stage["ms"] / total_ms if total_ms else 0.0 for stage in record["stages"]],
+        })
+        st.dataframe(
+            stages.style.format({"시간 (ms)": "{:,.1f}", "비율": "{:.1%}"}),
+            use_container_width=True,
+            hide_index=True
+        )
+        if record["caches"]:
+            st.markdown("**캐시 적중/미스**")
+            st.dataframe(
+                pd.DataFrame({
+                    "함수": [entry["name"] for entry in record["caches"]],
+                    "종류": [entry["kind"] for entry in record["caches"]],
+                    "호출": [entry["calls"] for entry in record["caches"]],
+                    "적중": [entry["calls"] - entry["misses"] for entry in record["caches"]],
+                    "미스": [entry["misses"] for entry in record["caches"]],
+                }),
+                use_container_width=True,
+                hide_index=True
+            )
+        if record["payloads"]:
+            st.markdown("**브라우저 전송 크기**")
+            st.dataframe(
+                pd.DataFrame({
+                    "항목": [payload["name"] for payload in record["payloads"]],
+                    "종류": [payload["kind"] for payload in record["payloads"]],
+                    "크기 (KB)": [payload["bytes"] / 1024 for payload in record["payloads"]],
+                }).style.format({"크기 (KB)": "{:,.1f}"}),
+                use_container_width=True,
+                hide_index=True
+            )
+        st.caption(f"합계에서 전송 크기 측정 시간 {record['overhead_ms']:,.0f} ms 제외 · 로그: {log_path()}")
+
+
+# --- 로그 집계 ---
+def summarize_log(path=None):
+    """
+    JSON-lines 로그를 페이지/단계별로 묶어 호출 수와 p50/p95 시간(ms)을 담은 DataFrame으로 반환합니다.
+    캐시 단계 이름의 (적중)/(미스)는 그대로 두어 두 경우를 따로 봅니다.
+    """
+    import pandas as pd
+
+    rows = []
+    with open(path or log_path(), encoding="utf-8") as f:
+        for line in f:
+            record = json.loads(line)
+            rows.append({"page": record["page"], "stage": "(전체)", "ms": record["total_ms"]})
+            rows.extend({"page": record["page"], "stage": stage["name"], "ms": stage["ms"]} for stage in record["stages"])
+    if not rows:
+        return pd.DataFrame(columns=["page", "stage", "count", "p50_ms", "p95_ms"])
+    grouped = pd.DataFrame(rows).groupby(["page", "stage"], sort=False)["ms"]
+    return pd.DataFrame({
+        "count": grouped.size(),
+        "p50_ms": grouped.quantile(0.5),
+        "p95_ms": grouped.quantile(0.95),
+    }).reset_index()
+
+
+if __name__ == "__main__":
+    # python -m core.profiling [로그 경로]
+    print(summarize_log(sys.argv[1] if len(sys.argv) > 1 else None).to_string(index=False))
@@ -0,0 +1,74 @@
+import numpy as np
+
+G = 9.81  # 중력 가속도
+
+
+def vacuum_trajectory(speed, angle_deg, g=G, num=300):
+    """진공 포물선 운동 궤적 (t, x, y)과 비행 시간을 반환합니다."""
+    angle_rad = np.radians(angle_deg)
+    t_flight = 2 * speed * np.sin(angle_rad) / g
+    t = np.linspace(0, t_flight, num=num)
+    x = speed * np.cos(angle_rad) * t
+    y = speed * np.sin(angle_rad) * t - 0.5 * g * t**2
+    return t, x, y, t_flight
+
+
+def vacuum_metrics(speeds, angles_deg, g=G):
+    """
+    진공에서의 사거리, 최대 높이, 비행 시간을 반환합니다.
+    speeds와 angles_deg는 NumPy 브로드캐스팅 규칙을 따르는 배열이면 됩니다.
+    """
+    speeds = np.asarray(speeds, dtype=np.float32)
+    angle_rad = np.radians(np.asarray(angles_deg, dtype=np.float32))
+    sin_a = np.sin(angle_rad)
+    range_ = speeds**2 * np.sin(2 * angle_rad) / g
+    max_height = speeds**2 * sin_a**2 / (2 * g)
+    flight_time = 2 * speeds * sin_a / g
+    return range_, max_height, flight_time
+
+
+def sweep(speeds, angles_deg, g=G, max_chunk_elements=1_000_000):
+    """
+    속도 x 각도 격자 전체를 한 번의 브로드캐스팅 계산으로 평가합니다.
+    중간 배열이 max_chunk_elements를 넘지 않도록 속도 축을 나누어 계산하고 결과 배열(float32)에 채웁니다.
+    반환: {'range', 'max_height', 'flight_time'} -> (len(speeds), len(angles)) 배열
+    """
+    speeds = np.asarray(speeds, dtype=np.float32)
+    angles_deg = np.asarray(angles_deg, dtype=np.float32)
+    shape = (len(speeds), len(angles_deg))
+    result = {name: np.empty(shape, dtype=np.float32) for name in ("range", "max_height", "flight_time")}
+
+    rows_per_chunk = max(1, max_chunk_elements // max(len(angles_deg), 1))
+    for lo in range(0, len(speeds), rows_per_chunk):
+        hi = lo + rows_per_chunk
+        range_, max_height, flight_time = vacuum_metrics(speeds[lo:hi, None], angles_deg[None, :], g)
+        result["range"][lo:hi] = range_
+        result["max_height"][lo:hi] = max_height
+        result["flight_time"][lo:hi] = flight_time
+    return result
+
+
+def optimal_angles(range_grid, angles_deg):
+    """각 속도(행)에서 사거리가 최대가 되는 각도를 반환합니다."""
+    return np.asarray(angles_deg)[np.argmax(range_grid, axis=1)]
+
+
+def trajectory_fan(speed, angles_deg, g=G, num=200):
+    """
+    같은 속도로 여러 각도에서 발사한 궤적들을 (각도 수, num) 배열 x, y로 한 번에 계산합니다.
+    함께 반환하는 포락선(안전 포물선) y = v²/2g - g x²/2v² 은 이 속도로 닿을 수 있는 영역의 경계입니다.
+    """
+    angle_rad = np.radians(np.asarray(angles_deg, dtype=np.float64))[:, None]
+    t_flight = 2 * speed * np.sin(angle_rad) / g
+    t = t_flight * np.linspace(0, 1, num)[None, :]
+    x = speed * np.cos(angle_rad) * t
+    y = speed * np.sin(angle_rad) * t - 0.5 * g * t**2
+
+    envelope_x = np.linspace(0, speed**2 / g, num)
+    envelope_y = speed**2 / (2 * g) - g * envelope_x**2 / (2 * speed**2)
+    return x, y, envelope_x, envelope_y
+
+
+def display_stride(n, max_cells):
+    """히트맵으로 보낼 때 축 하나를 max_cells 이하로 줄이기 위한 간격입니다."""
+    return max(1, int(np.ceil(n / max_cells)))
@@ -0,0 +1,186 @@
+import json
+import os
+import threading
+from datetime import datetime, time, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+
+from core import profiling
+from core.quake_parser import empty_quake_frame
+
+# 저장 위치: 저장소 루트의 .cache/quakes (UTC 하루당 Parquet 파일 하나 + manifest.json)
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "quakes"
+)
+# 슬라이더의 최솟값과 같은 규모로 저장해 두면 모든 규모 필터를 로컬에서 처리할 수 있음
+BASE_MAGNITUDE = 1.0
+
+
+def utc_now():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _day_start(day):
+    return datetime.combine(day, time.min)
+
+
+def _contiguous_runs(days):
+    """정렬된 날짜 목록을 연속 구간 [(시작일, 마지막일), ...]으로 묶습니다."""
+    runs = []
+    for day in days:
+        if runs and runs[-1][1] + timedelta(days=1) == day:
+            runs[-1][1] = day
+        else:
+            runs.append([day, day])
+    return [tuple(run) for run in runs]
+
+
+class QuakeDayCache:
+    """
+    지진 데이터를 UTC 하루 단위 Parquet 파티션으로 보관하는 캐시입니다.
+    모든 파티션은 BASE_MAGNITUDE 이상으로 받아 두므로, 기간/규모 슬라이더가 바뀌면
+    저장된 파티션을 걸러서 답하고 네트워크는 부족한 날짜와 아직 확정되지 않은 날짜(오늘, 어제)에만 씁니다.
+    확정되지 않은 날짜는 updatedafter 조건부 요청으로 마지막 갱신 이후 바뀐 이벤트만 받아 병합합니다.
+    """
+
+    def __init__(self, client, root=DEFAULT_CACHE_DIR, base_magnitude=BASE_MAGNITUDE,
+                 refresh_interval=timedelta(minutes=10)):
+        self.client = client
+        self.root = root
+        self.base_magnitude = base_magnitude
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()  # 파티션/manifest 읽기·쓰기
+        self._refresh_lock = threading.Lock()  # 갱신은 한 번에 하나만 (네트워크 요청 동안 잡고 있음)
+        self._frames = {}
+        os.makedirs(self.root, exist_ok=True)
+        self._manifest_path = os.path.join(self.root, "manifest.json")
+        self._manifest = self._load_manifest()
+
+    # --- manifest ---
+    def _load_manifest(self):
+        try:
+            with open(self._manifest_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self):
+        tmp_path = self._manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._manifest, f, indent=1)
+        os.replace(tmp_path, self._manifest_path)
+
+    def _path(self, day):
+        return os.path.join(self.root, f"{day.isoformat()}.parquet")
+
+    def _fetched_at(self, day):
+        meta = self._manifest.get(day.isoformat())
+        return datetime.fromisoformat(meta["fetched"]) if meta else None
+
+    def _is_final(self, day):
+        # 다음 날이 끝난 뒤(= 이틀 뒤 0시 이후)에 받은 파티션은 더 바뀌지 않는 것으로 봄
+        fetched = self._fetched_at(day)
+        return fetched is not None and fetched >= _day_start(day + timedelta(days=2))
+
+    # --- 파티션 읽기/쓰기 ---
+    def _read(self, day):
+        if day not in self._frames:
+            path = self._path(day)
+            self._frames[day] = pd.read_parquet(path) if os.path.exists(path) else empty_quake_frame()
+        return self._frames[day]
+
+    def _write(self, day, frame, fetched):
+        frame = frame.reset_index(drop=True)
+        tmp_path = self._path(day) + ".tmp"
+        frame.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, self._path(day))
+        self._frames[day] = frame
+        self._manifest[day.isoformat()] = {"fetched": fetched.isoformat(timespec="seconds"), "count": len(frame)}
+
+    def _split_by_day(self, df):
+        days = df["time"].dt.floor("D").dt.date
+        return {day: group for day, group in df.groupby(days, sort=False, observed=True)}
+
+    # --- 갱신 ---
+    def _days(self, days, now):
+        first_day = (now - timedelta(days=days)).date()
+        return [first_day + timedelta(days=i) for i in range((now.date() - first_day).days + 1)]
+
+    def covers(self, days, now=None):
+        """최근 days일의 파티션이 모두 저장되어 있어 네트워크 없이 답할 수 있는지 여부입니다. (오래됐을 수는 있음)"""
+        now = now or utc_now()
+        with self._lock:
+            return all(self._fetched_at(day) is not None for day in self._days(days, now))
+
+    def refresh(self, days, now=None, max_age=None):
+        """
+        최근 days일을 덮는 파티션 중 없는 날짜는 새로 받고, 확정되지 않은 날짜는
+        max_age(기본 refresh_interval)가 지났을 때만 조건부 요청으로 갱신합니다.
+        요청이 실패하면 예외를 그대로 던지며, 그 전까지 받은 파티션은 저장된 채로 남습니다.
+        네트워크 요청 중에는 읽기 잠금을 잡지 않으므로, 백그라운드에서 갱신하는 동안에도 query()는 바로 답합니다.
+        """
+        now = now or utc_now()
+        max_age = self.refresh_interval if max_age is None else max_age
+        all_days = self._days(days, now)
+
+        with self._refresh_lock:
+            # 1) 저장된 적 없는 날짜: 연속 구간별로 한 번에 받아 하루 단위로 나눠 저장
+            with self._lock:
+                missing = [day for day in all_days if self._fetched_at(day) is None]
+            for run_start, run_end in _contiguous_runs(missing):
+                end = min(_day_start(run_end + timedelta(days=1)), now)
+                fetched = self.client.fetch(_day_start(run_start), end, self.base_magnitude)
+                by_day = self._split_by_day(fetched)
+                with self._lock:
+                    for i in range((run_end - run_start).days + 1):
+                        day = run_start + timedelta(days=i)
+                        self._write(day, by_day.get(day, empty_quake_frame()), now)
+                    self._save_manifest()
+
+            # 2) 확정되지 않은 날짜: 마지막으로 받은 이후 추가/수정된 이벤트만 받아 병합
+            with self._lock:
+                stale = [
+                    day for day in all_days
+                    if not self._is_final(day) and now - self._fetched_at(day) >= max_age
+                ]
+                since = min(self._fetched_at(day) for day in stale) - timedelta(minutes=1) if stale else None
+            if stale:
+                changed = self.client.fetch(_day_start(stale[0]), now, self.base_magnitude, updated_after=since)
+                by_day = self._split_by_day(changed)
+                with self._lock:
+                    for day in stale:
+                        frame = self._read(day)
+                        if day in by_day:
+                            frame = pd.concat([frame, by_day[day]], ignore_index=True)
+                            frame = frame.drop_duplicates(subset="id", keep="last")
+                            frame["place"] = frame["place"].astype("category")
+                        self._write(day, frame, now)
+                    self._save_manifest()
+
+    # --- 조회 ---
+    def partitions(self, days, now=None):
+        """최근 days일을 덮는 저장된 파티션을 [(날짜, 버전, DataFrame), ...]으로 반환합니다. 버전은 마지막 갱신 시각입니다."""
+        now = now or utc_now()
+        with self._lock:
+            result = []
+            for day in self._days(days, now):
+                meta = self._manifest.get(day.isoformat())
+                result.append((day, meta["fetched"] if meta else None, self._read(day)))
+        return result
+
+    def query(self, days, min_magnitude, now=None):
+        """저장된 파티션만으로 최근 days일, 규모 min_magnitude 이상의 지진을 시간 역순으로 반환합니다."""
+        now = now or utc_now()
+        start = now - timedelta(days=days)
+        with profiling.timer("파티션 읽기"):
+            frames = [frame for _, _, frame in self.partitions(days, now) if not frame.empty]
+        if not frames:
+            return empty_quake_frame()
+
+        with profiling.timer("파티션 병합/필터"):
+            df = pd.concat(frames, ignore_index=True)
+            # magnitude는 float32이므로 기준값도 float32로 맞춰야 경계값(예: 2.6)이 빠지지 않음
+            df = df[(df["time"] >= start) & (df["magnitude"] >= np.float32(min_magnitude))]
+            df = df.astype({"place": "category"})
+            return df.sort_values("time", ascending=False, ignore_index=True)
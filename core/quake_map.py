@@ -0,0 +1,200 @@
+import folium
+import numpy as np
+import pandas as pd
+from branca.element import MacroElement
+from folium.plugins import HeatMap
+from jinja2 import Template
+
+from core.plates import BOUNDARY_TYPE_COLORS, BOUNDARY_TYPE_LABELS
+
+# 규모 구간 경계와 색상 클래스 (get_magnitude_color와 같은 기준)
+MAGNITUDE_BINS = np.array([3.0, 4.0, 5.0, 6.0, 7.0, 8.0])
+MAGNITUDE_CLASSES = ["lightblue", "beige", "lightred", "darkorange", "orange", "red", "darkred"]
+# 'lightred' 같은 이름은 CSS 색상이 아니므로 브라우저에서 쓸 실제 색상값을 따로 둠
+CLASS_HEX = {
+    "lightblue": "#8ecae6",
+    "beige": "#e9d8a6",
+    "lightred": "#ff8a80",
+    "darkorange": "#ff8c00",
+    "orange": "#ffa500",
+    "red": "#e63946",
+    "darkred": "#8b0000",
+    "gray": "#9e9e9e",
+}
+# 이 개수를 넘으면 점 대신 격자 집계 히트맵으로 그림
+DEFAULT_POINT_LIMIT = 5000
+# 히트맵 모드에서 보낼 최대 격자 칸 수
+DEFAULT_MAX_CELLS = 3000
+
+
+def get_magnitude_color(magnitude):
+    if magnitude is None or magnitude != magnitude: # None/NaN 값 처리
+        return 'gray'
+    return MAGNITUDE_CLASSES[int(np.digitize(magnitude, MAGNITUDE_BINS))]
+
+
+def magnitude_class_codes(magnitudes):
+    """규모 배열 전체의 색상 클래스 번호(MAGNITUDE_CLASSES 인덱스)를 한 번에 계산합니다. NaN은 -1."""
+    magnitudes = np.asarray(magnitudes, dtype=np.float64)
+    codes = np.digitize(magnitudes, MAGNITUDE_BINS)
+    return np.where(np.isnan(magnitudes), -1, codes)
+
+
+class QuakePointLayer(MacroElement):
+    """
+    지진 전체를 GeoJSON 레이어 하나로 보내고, 원의 크기/색상과 팝업 HTML은 브라우저에서 만듭니다.
+    feature 속성은 짧은 키(m: 규모, c: 색상 클래스, d: 깊이, t: epoch ms, p: 장소, i: event id)만 씁니다.
+    원은 canvas 렌더러로 그려서 점이 많아도 DOM 요소가 늘지 않습니다.
+    bins=True이면 격자 집계 결과용으로, 팝업에 장소(p) 문자열만 보여줍니다.
+    """
+
+    _template = Template("""
+        {% macro script(this, kwargs) %}
+        var {{ this.get_name() }} = (function() {
+            var colors = {{ this.colors|tojson }};
+            var renderer = L.canvas({padding: 0.5});
+            return L.geoJSON({{ this.data|tojson }}, {
+                pointToLayer: function(feature, latlng) {
+                    var p = feature.properties;
+                    var color = p.c >= 0 ? colors[p.c] : {{ this.gray|tojson }};
+                    return L.circleMarker(latlng, {
+                        renderer: renderer, radius: Math.max(p.m * 2, 2), color: color,
+                        fillColor: color, fillOpacity: 0.7, weight: 1
+                    });
+                },
+                onEachFeature: function(feature, layer) {
+                    // 팝업 HTML은 클릭해서 열 때 만듦
+                    layer.bindPopup(function() {
+                        var p = feature.properties;
+                        {% if this.bins %}return p.p;{% endif %}
+                        var time = new Date(p.t).toISOString().replace('T', ' ').slice(0, 19);
+                        return '<b>장소:</b> ' + p.p + '<br>' +
+                            '<b>규모:</b> ' + p.m.toFixed(1) + '<br>' +
+                            '<b>시간:</b> ' + time + ' (UTC)<br>' +
+                            '<b>깊이:</b> ' + (p.d === null ? '정보 없음' : p.d.toFixed(1) + ' km') + '<br>' +
+                            '<b>정보:</b> <a href="{{ this.event_url }}' + p.i + '" target="_blank">자세히 보기</a>';
+                    }, {maxWidth: 300});
+                }
+            }).addTo({{ this._parent.get_name() }});
+        })();
+        {% endmacro %}
+    """)
+
+    def __init__(self, df, event_url, bins=False):
+        super().__init__()
+        self.bins = bins
+        self._name = "QuakePointLayer"
+        self.colors = [CLASS_HEX[name] for name in MAGNITUDE_CLASSES]
+        self.gray = CLASS_HEX["gray"]
+        self.event_url = event_url.format("")
+        self.data = quake_feature_collection(df)
+
+
+def _rounded(values, decimals):
+    values = np.round(np.asarray(values, dtype=np.float64), decimals)
+    return [None if v != v else v for v in values.tolist()]
+
+
+def quake_feature_collection(df):
+    """지진 DataFrame을 짧은 속성 키의 GeoJSON FeatureCollection dict로 바꿉니다."""
+    columns = zip(
+        _rounded(df["longitude"], 4),
+        _rounded(df["latitude"], 4),
+        _rounded(df["magnitude"], 2),
+        magnitude_class_codes(df["magnitude"]).tolist(),
+        _rounded(df["depth"], 1),
+        df["time"].to_numpy().astype("datetime64[ms]").astype(np.int64).tolist(),
+        df["place"].astype(str).tolist(),
+        df["id"].astype(str).tolist(),
+    )
+    features = [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [lon, lat]},
+            "properties": {"m": mag, "c": code, "d": depth, "t": t, "p": place, "i": event_id},
+        }
+        for lon, lat, mag, code, depth, t, place, event_id in columns
+    ]
+    return {"type": "FeatureCollection", "features": features}
+
+
+def grid_bins(df, cell_deg=1.0):
+    """
+    위경도 격자(cell_deg 단위)별 지진 수, 최대 규모, 평균 위치를 계산합니다.
+    결과 크기는 이벤트 수가 아니라 격자 칸 수로 제한됩니다.
+    """
+    lat = df["latitude"].to_numpy(dtype=np.float64)
+    lon = df["longitude"].to_numpy(dtype=np.float64)
+    mag = df["magnitude"].to_numpy(dtype=np.float64)
+    n_cols = int(np.ceil(360 / cell_deg))
+    row = np.floor((np.clip(lat, -90, 89.999) + 90) / cell_deg).astype(np.int64)
+    col = np.floor((np.clip(lon, -180, 179.999) + 180) / cell_deg).astype(np.int64)
+    cells, inverse, counts = np.unique(row * n_cols + col, return_inverse=True, return_counts=True)
+
+    max_mag = np.full(len(cells), -np.inf)
+    np.maximum.at(max_mag, inverse, np.nan_to_num(mag, nan=-np.inf))
+    mean_lat = np.bincount(inverse, weights=lat) / counts
+    mean_lon = np.bincount(inverse, weights=lon) / counts
+    return mean_lat, mean_lon, counts, max_mag
+
+
+def add_quake_layer(m, df, event_url, point_limit=DEFAULT_POINT_LIMIT, max_cells=DEFAULT_MAX_CELLS):
+    """
+    지진 수가 point_limit 이하이면 점 레이어를, 넘으면 격자 집계 히트맵과 격자별 요약 원을 지도에 추가합니다.
+    격자 칸은 0.5°에서 시작해 채워진 칸이 max_cells 이하가 될 때까지 두 배씩 키우므로,
+    지진이 아무리 많아도 브라우저로 보내는 데이터 크기는 max_cells로 제한됩니다.
+    사용한 모드 이름('points' 또는 'heatmap')을 반환합니다.
+    """
+    if len(df) <= point_limit:
+        QuakePointLayer(df, event_url).add_to(m)
+        return "points"
+
+    cell_deg = 0.5
+    mean_lat, mean_lon, counts, max_mag = grid_bins(df, cell_deg)
+    while len(counts) > max_cells:
+        cell_deg *= 2
+        mean_lat, mean_lon, counts, max_mag = grid_bins(df, cell_deg)
+    weights = np.log1p(counts) / np.log1p(counts.max())
+    HeatMap(
+        np.column_stack([mean_lat, mean_lon, weights]).round(4).tolist(),
+        name="지진 밀도",
+        radius=12,
+        blur=15,
+        min_opacity=0.3,
+    ).add_to(m)
+
+    # 격자 칸 요약도 같은 점 레이어 형식으로 보냄 (크기/색 = 칸의 최대 규모, 팝업 = 지진 수)
+    summary = pd.DataFrame({
+        "longitude": mean_lon,
+        "latitude": mean_lat,
+        "magnitude": max_mag,
+        "depth": np.nan,
+        "time": np.zeros(len(counts), dtype="datetime64[ms]"),
+        "place": [f"격자 {cell_deg:g}° 칸: 지진 {n:,}건, 최대 규모 {mag:.1f}" for n, mag in zip(counts, max_mag)],
+        "id": "",
+    })
+    QuakePointLayer(summary, event_url, bins=True).add_to(m)
+    return "heatmap"
+
+
+def html_size(m):
+    """folium 지도를 HTML로 렌더링했을 때의 크기(바이트)입니다."""
+    return len(m.get_root().render().encode("utf-8"))
+
+
+def add_boundary_layer(m, boundary_index):
+    """판 경계선을 유형별 색상으로 지도에 겹쳐 그립니다. (경계선 수가 적어 folium.GeoJson으로 충분)"""
+    def style(feature):
+        return {"color": BOUNDARY_TYPE_COLORS[feature["properties"]["type"]], "weight": 2.5, "opacity": 0.8}
+
+    features = [
+        {**feature, "properties": {**feature["properties"],
+                                   "type_label": BOUNDARY_TYPE_LABELS[feature["properties"]["type"]]}}
+        for feature in boundary_index.geojson["features"]
+    ]
+    folium.GeoJson(
+        {"type": "FeatureCollection", "features": features},
+        name="판 경계",
+        style_function=style,
+        tooltip=folium.GeoJsonTooltip(fields=["name", "plates", "type_label"], aliases=["경계", "판", "유형"]),
+    ).add_to(m)
@@ -0,0 +1,147 @@
+import codecs
+import json
+from array import array
+
+import numpy as np
+import pandas as pd
+
+QUAKE_COLUMNS = ["id", "place", "magnitude", "time", "longitude", "latitude", "depth"]
+USGS_EVENT_URL = "https://earthquake.usgs.gov/earthquakes/eventpage/{}"
+_WHITESPACE = " \t\n\r"
+
+
+class _TextStream:
+    """바이트 청크를 UTF-8로 이어 붙이며 필요한 만큼만 버퍼에 유지하는 읽기 도우미입니다."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        """청크를 하나 더 읽습니다. 더 읽을 것이 없으면 False."""
+        if self.eof:
+            return False
+        # 이미 처리한 앞부분은 버려서 버퍼가 응답 전체 크기로 커지지 않게 함
+        self.buf = self.buf[self.pos:]
+        self.pos = 0
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+            if text:
+                self.buf += text
+                return True
+        self.buf += self._decoder.decode(b"", final=True)
+        self.eof = True
+        return False
+
+    def peek(self):
+        """공백을 건너뛴 다음 문자를 반환합니다. (입력 끝이면 빈 문자열)"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"GeoJSON 형식 오류: '{char}' 위치에 '{self.peek()}'")
+        self.pos += 1
+
+    def value(self, decoder):
+        """현재 위치의 JSON 값 하나를 디코딩합니다. 값이 버퍼 경계에 걸리면 더 읽어서 다시 시도합니다."""
+        self.peek()
+        while True:
+            try:
+                obj, end = decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # 숫자는 버퍼 끝에서 잘려도 디코딩에 성공하므로, 끝에 닿았으면 더 읽어서 확인
+            if end == len(self.buf) and not self.eof and self.fill():
+                continue
+            self.pos = end
+            return obj
+
+
+class _Columns:
+    """이벤트를 타입이 정해진 컬럼 배열에 바로 쌓습니다. (이벤트별 dict/행 객체를 남기지 않음)"""
+
+    def __init__(self):
+        self.ids = []
+        self.place_codes = array("i")
+        self.place_lookup = {}
+        self.magnitude = array("f")
+        self.time_ms = array("q")
+        self.longitude = array("f")
+        self.latitude = array("f")
+        self.depth = array("f")
+
+    def add(self, feature):
+        props = feature.get("properties") or {}
+        geo = feature.get("geometry") or {}
+        coords = geo.get("coordinates")
+        mag = props.get("mag")
+        # 필요한 모든 데이터가 있는지 확인
+        if not coords or mag is None:
+            return
+        place = props.get("place") or "장소 정보 없음"
+        code = self.place_lookup.setdefault(place, len(self.place_lookup))
+        depth = coords[2] if len(coords) > 2 and coords[2] is not None else float("nan")
+
+        self.ids.append(feature.get("id") or "")
+        self.place_codes.append(code)
+        self.magnitude.append(mag)
+        self.time_ms.append(props.get("time") or 0)  # 'time' 키가 없을 경우 0으로 처리
+        self.longitude.append(coords[0])
+        self.latitude.append(coords[1])
+        self.depth.append(depth)
+
+    def frame(self):
+        categories = list(self.place_lookup)
+        return pd.DataFrame({
+            "id": pd.array(self.ids, dtype=object),
+            "place": pd.Categorical.from_codes(np.frombuffer(self.place_codes, dtype=np.int32), categories),
+            "magnitude": np.frombuffer(self.magnitude, dtype=np.float32),
+            # epoch ms를 한 번에 datetime64로 변환 (USGS 시각은 UTC)
+            "time": np.frombuffer(self.time_ms, dtype=np.int64).astype("datetime64[ms]"),
+            "longitude": np.frombuffer(self.longitude, dtype=np.float32),
+            "latitude": np.frombuffer(self.latitude, dtype=np.float32),
+            "depth": np.frombuffer(self.depth, dtype=np.float32),
+        }, columns=QUAKE_COLUMNS)
+
+
+def parse_geojson_stream(chunks):
+    """
+    USGS GeoJSON 응답을 바이트(또는 문자열) 청크 단위로 읽으면서 지진 DataFrame을 만듭니다.
+    전체 응답을 메모리에 올리지 않고 feature를 하나씩 디코딩해 바로 컬럼 배열에 기록합니다.
+    컬럼: id, place(category), magnitude/longitude/latitude/depth(float32), time(datetime64[ms], UTC)
+    """
+    stream = _TextStream(chunks)
+    decoder = json.JSONDecoder()
+    columns = _Columns()
+
+    stream.expect("{")
+    while stream.peek() not in ("}", ""):
+        key = stream.value(decoder)
+        stream.expect(":")
+        if key != "features":
+            stream.value(decoder)  # metadata, bbox 등은 건너뜀
+        else:
+            stream.expect("[")
+            while stream.peek() != "]":
+                columns.add(stream.value(decoder))
+                if stream.peek() == ",":
+                    stream.pos += 1
+            stream.pos += 1
+        if stream.peek() == ",":
+            stream.pos += 1
+    return columns.frame()
+
+
+def empty_quake_frame():
+    return _Columns().frame()
@@ -0,0 +1,154 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+# 규모 구간: 1.0부터 0.1 간격 (슬라이더 간격과 같아서 최소 규모 필터를 구간 단위로 정확히 적용 가능)
+MAG_MIN = 1.0
+MAG_STEP = 0.1
+N_MAG = 90  # 1.0 ~ 10.0
+# 깊이 구간: 0 ~ 700 km, 10 km 간격 (범위 밖은 양 끝 구간에 포함)
+DEPTH_STEP = 10
+N_DEPTH = 70
+
+
+def magnitude_bin(magnitudes):
+    """규모를 0.1 간격 구간 번호로 바꿉니다. float32 반올림 오차로 경계값이 아래 구간에 떨어지지 않게 보정합니다."""
+    scaled = np.round((np.asarray(magnitudes, dtype=np.float64) - MAG_MIN) / MAG_STEP, 3)
+    return np.clip(np.floor(scaled).astype(np.int64), 0, N_MAG - 1)
+
+
+def magnitude_bin_centers():
+    return MAG_MIN + MAG_STEP * (np.arange(N_MAG) + 0.5)
+
+
+def parse_regions(places):
+    """
+    'place' 문자열에서 지역 이름을 뽑습니다. ('10 km NW of Town, Alaska' -> 'Alaska')
+    Categorical이면 고유한 카테고리만 파싱한 뒤 코드로 펼치므로 행 수와 무관하게 빠릅니다.
+    """
+    places = pd.Categorical(places)
+    categories = pd.Series(places.categories, dtype=object)
+    regions = categories.str.rsplit(",", n=1).str[-1].str.strip()
+    # 쉼표가 없으면 'of' 뒤의 이름을 사용 ('100 km S of Fiji Islands' -> 'Fiji Islands')
+    no_comma = ~categories.str.contains(",")
+    regions[no_comma] = categories[no_comma].str.split(" of ", n=1).str[-1].str.strip()
+    region_names, category_to_region = np.unique(regions.to_numpy(dtype=str), return_inverse=True)
+    codes = np.where(places.codes >= 0, category_to_region[places.codes], -1)
+    return pd.Categorical.from_codes(codes, region_names)
+
+
+class PartitionStats:
+    """
+    하루치 파티션의 히스토그램 묶음입니다. 모든 값이 규모 구간별 개수라서
+    여러 날을 합칠 때는 더하기만 하면 되고, 최소 규모 필터는 규모 축을 잘라서 적용합니다.
+    """
+
+    def __init__(self, df):
+        n = len(df)
+        mag_bin = magnitude_bin(df["magnitude"].to_numpy())
+        self.mag_counts = np.bincount(mag_bin, minlength=N_MAG)
+
+        depth = df["depth"].to_numpy(dtype=np.float64)
+        has_depth = ~np.isnan(depth)
+        depth_bin = np.clip((depth[has_depth] // DEPTH_STEP).astype(np.int64), 0, N_DEPTH - 1)
+        self.depth_mag = np.bincount(
+            depth_bin * N_MAG + mag_bin[has_depth], minlength=N_DEPTH * N_MAG
+        ).reshape(N_DEPTH, N_MAG)
+
+        hours = df["time"].dt.hour.to_numpy() if n else np.empty(0, dtype=np.int64)
+        self.hour_mag = np.bincount(hours * N_MAG + mag_bin, minlength=24 * N_MAG).reshape(24, N_MAG)
+
+        regions = parse_regions(df["place"])
+        self.regions = list(regions.categories)
+        self.region_mag = np.bincount(
+            regions.codes.astype(np.int64) * N_MAG + mag_bin, minlength=len(self.regions) * N_MAG
+        ).reshape(len(self.regions), N_MAG)
+
+
+def fit_gutenberg_richter(mag_counts):
+    """
+    규모별 개수로 구텐베르크-리히터 관계 log10 N(>=M) = a - bM를 맞춥니다.
+    완전성 규모 Mc는 최대 곡률법(가장 많은 구간)으로, b값은 Aki(1965) 최대우도 추정으로 구합니다.
+    반환: (a, b, Mc). 데이터가 부족하면 NaN.
+    """
+    mag_counts = np.asarray(mag_counts, dtype=np.float64)
+    if mag_counts.sum() < 10:
+        return np.nan, np.nan, np.nan
+    centers = magnitude_bin_centers()
+    mc_bin = int(mag_counts.argmax())
+    above = mag_counts[mc_bin:]
+    mc = MAG_MIN + MAG_STEP * mc_bin
+    mean_mag = (centers[mc_bin:] * above).sum() / above.sum()
+    b = np.log10(np.e) / (mean_mag - mc)
+    a = np.log10(above.sum()) + b * mc
+    return a, b, mc
+
+
+class QuakeStatsEngine:
+    """
+    날짜 파티션별 통계를 (파티션 버전과 함께) 캐시해 두고, 요청 범위의 파티션 통계를 더해서 결과를 만듭니다.
+    새 날짜가 추가되거나 오늘/어제 파티션이 갱신되면 그 파티션만 다시 계산합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cache = {}
+
+    def _partition_stats(self, day, version, frame):
+        with self._lock:
+            cached = self._cache.get(day)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+        stats = PartitionStats(frame)
+        with self._lock:
+            self._cache[day] = (version, stats)
+        return stats
+
+    def summarize(self, partitions, start, min_magnitude, top_n=10):
+        """
+        partitions: [(날짜, 버전, DataFrame), ...] (QuakeDayCache.partitions의 결과)
+        start 이후, 규모 min_magnitude 이상의 지진에 대한 통계 dict를 반환합니다.
+        """
+        k = int(magnitude_bin([min_magnitude])[0])
+        mag_counts = np.zeros(N_MAG, dtype=np.int64)
+        depth_mag = np.zeros((N_DEPTH, N_MAG), dtype=np.int64)
+        hour_mag = np.zeros((24, N_MAG), dtype=np.int64)
+        region_index, region_rows = {}, []
+        per_day = {}
+
+        for day, version, frame in partitions:
+            if day == start.date():
+                # 기간의 첫날은 일부 시간만 포함되므로 캐시하지 않고 바로 계산
+                stats = PartitionStats(frame[frame["time"] >= start])
+            else:
+                stats = self._partition_stats(day, version, frame)
+            mag_counts += stats.mag_counts
+            depth_mag += stats.depth_mag
+            hour_mag += stats.hour_mag
+            per_day[day] = int(stats.mag_counts[k:].sum())
+            for region, row in zip(stats.regions, stats.region_mag):
+                if region not in region_index:
+                    region_index[region] = len(region_rows)
+                    region_rows.append(np.zeros(N_MAG, dtype=np.int64))
+                region_rows[region_index[region]] += row
+
+        filtered = mag_counts.copy()
+        filtered[:k] = 0
+        a, b, mc = fit_gutenberg_richter(filtered)
+        region_totals = pd.Series(
+            [row[k:].sum() for row in region_rows], index=list(region_index), dtype="int64"
+        )
+        centers = magnitude_bin_centers()
+        return {
+            "total": int(filtered.sum()),
+            "magnitude_counts": pd.Series(filtered[k:], index=np.round(centers[k:] - MAG_STEP / 2, 1)),
+            "cumulative_counts": pd.Series(filtered[::-1].cumsum()[::-1][k:], index=np.round(centers[k:] - MAG_STEP / 2, 1)),
+            "gr_a": a,
+            "gr_b": b,
+            "gr_mc": mc,
+            "depth_counts": pd.Series(depth_mag[:, k:].sum(axis=1), index=np.arange(N_DEPTH) * DEPTH_STEP),
+            "hour_counts": pd.Series(hour_mag[:, k:].sum(axis=1), index=np.arange(24)),
+            "day_counts": pd.Series(per_day, dtype="int64").sort_index(),
+            "top_regions": region_totals[region_totals > 0].nlargest(top_n),
+        }
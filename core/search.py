@@ -0,0 +1,98 @@
+import bisect
+import re
+from collections import defaultdict
+
+import numpy as np
+
+# 검색 대상 필드와 가중치 (이름에서 맞으면 설명보다 높게)
+SEARCH_FIELDS = {"name": 3.0, "city": 2.0, "description": 1.0, "hotels": 1.5, "food": 1.5}
+BM25_K1 = 1.2
+BM25_B = 0.75
+MIN_PREFIX_LENGTH = 3  # 영어 검색어는 이 길이 이상이면 접두어로도 찾음 (Disney -> disneyland)
+
+_TOKEN_RE = re.compile(r"[가-힣]+|[a-z0-9]+")
+
+
+def tokenize(text):
+    """
+    검색용 토큰으로 나눕니다.
+    한글은 띄어쓰기와 조사가 붙어도 찾을 수 있도록 글자 2-gram으로 (한 글자 단어는 그대로),
+    영어/숫자는 소문자 단어로 자릅니다.
+    """
+    tokens = []
+    for run in _TOKEN_RE.findall(text.lower()):
+        if "가" <= run[0] <= "힣":
+            tokens.extend([run] if len(run) == 1 else [run[i:i + 2] for i in range(len(run) - 1)])
+        else:
+            tokens.append(run)
+    return tokens
+
+
+def hangul_unigrams(text):
+    """두 글자 이상 한글 단어 안의 글자들 (한 글자 검색어용. 한 글자 단어는 tokenize가 이미 그대로 냄)"""
+    return [char for run in _TOKEN_RE.findall(text.lower()) if "가" <= run[0] <= "힣" and len(run) > 1 for char in run]
+
+
+def field_text(value):
+    return " ".join(value) if isinstance(value, (list, tuple)) else str(value)
+
+
+class SearchIndex:
+    """
+    관광지 이름/도시/설명/숙소/음식점의 역색인입니다. (토큰 -> 문서 번호 배열, 가중 빈도 배열)
+    점수는 필드 가중치를 곱한 빈도로 계산하는 BM25이며, 검색어 토큰별 점수를 문서 배열에 한 번에 더합니다.
+    한글은 2-gram 외에 글자 하나짜리 토큰도 색인해 한 글자 검색어("차")도 찾습니다. (문서 길이에는 넣지 않음)
+    """
+
+    def __init__(self, places, fields=SEARCH_FIELDS):
+        postings = defaultdict(lambda: defaultdict(float))
+        doc_length = np.zeros(len(places), dtype=np.float64)
+        for doc, place in enumerate(places):
+            for field, weight in fields.items():
+                text = field_text(place.get(field, ""))
+                tokens = tokenize(text)
+                doc_length[doc] += weight * len(tokens)
+                for token in tokens + hangul_unigrams(text):
+                    postings[token][doc] += weight
+
+        self.n_docs = len(places)
+        self.doc_length = doc_length
+        self.avg_length = float(doc_length.mean()) if len(places) else 0.0
+        self.postings = {
+            token: (np.fromiter(docs.keys(), dtype=np.int64, count=len(docs)),
+                    np.fromiter(docs.values(), dtype=np.float64, count=len(docs)))
+            for token, docs in postings.items()
+        }
+        self.vocabulary = sorted(self.postings)
+
+    def _expand(self, token):
+        """영어 토큰은 같은 접두어로 시작하는 색인 토큰까지 넓힘 (정확히 같은 토큰이 첫 번째)"""
+        if "가" <= token[0] <= "힣" or len(token) < MIN_PREFIX_LENGTH:
+            return [token] if token in self.postings else []
+        start = bisect.bisect_left(self.vocabulary, token)
+        end = bisect.bisect_left(self.vocabulary, token + "￿")
+        return self.vocabulary[start:end]
+
+    def scores(self, query):
+        """모든 문서의 BM25 점수 배열 (맞는 토큰이 없는 문서는 0)"""
+        scores = np.zeros(self.n_docs, dtype=np.float64)
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * self.doc_length / max(self.avg_length, 1e-9))
+        for query_token in dict.fromkeys(tokenize(query)):
+            # 접두어로 넓힌 토큰들은 한 검색어로 보고 문서별로 빈도를 합침
+            matched = self._expand(query_token)
+            if not matched:
+                continue
+            docs = np.concatenate([self.postings[t][0] for t in matched])
+            freqs = np.concatenate([self.postings[t][1] for t in matched])
+            docs, inverse = np.unique(docs, return_inverse=True)
+            tf = np.bincount(inverse, weights=freqs)
+            idf = np.log(1 + (self.n_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+            scores[docs] += idf * tf * (BM25_K1 + 1) / (tf + norm[docs])
+        return scores
+
+    def search(self, query, limit=None):
+        """검색어와 맞는 문서 번호를 점수 높은 순서로 반환합니다. (동점이면 원래 순서)"""
+        scores = self.scores(query)
+        matched = np.flatnonzero(scores > 0)
+        ranked = matched[np.argsort(-scores[matched], kind="stable")]
+        return ranked if limit is None else ranked[:limit]
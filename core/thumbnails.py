@@ -0,0 +1,169 @@
+import hashlib
+import io
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import requests
+from PIL import Image, ImageDraw, ImageOps
+
+# 저장 위치: 저장소 루트의 .cache/thumbnails (원본 URL의 해시 이름으로 된 WebP 파일)
+DEFAULT_THUMBNAIL_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "thumbnails"
+)
+THUMBNAIL_SIZE = (960, 540)
+MAX_CACHE_BYTES = 200 * 1024 * 1024
+MAX_SOURCE_BYTES = 30 * 1024 * 1024  # 이보다 큰 원본은 받지 않음
+FAILURE_RETRY_SECONDS = 600  # 실패한 호스트는 이 시간 동안 다시 시도하지 않고 바로 대체 이미지를 씀
+
+
+def _key(url, size):
+    return hashlib.sha1(f"{size[0]}x{size[1]}:{url}".encode("utf-8")).hexdigest()
+
+
+class ThumbnailCache:
+    """
+    원격 이미지를 한 번만 내려받아 줄인 WebP로 디스크에 보관하는 캐시입니다.
+    - 총 크기가 max_bytes를 넘으면 가장 오래 쓰지 않은 파일부터 지웁니다. (파일 mtime을 마지막 사용 시각으로 씀)
+    - 받기에 실패한 URL(응답 오류)과 호스트(연결 실패/시간 초과)는 retry_seconds 동안 기억해 두고,
+      그동안은 기다리지 않고 바로 대체 이미지 경로를 돌려줍니다.
+    - 애니메이션 GIF는 모든 프레임을 줄여 애니메이션 WebP로 저장합니다.
+    """
+
+    def __init__(self, root=DEFAULT_THUMBNAIL_DIR, size=THUMBNAIL_SIZE, max_bytes=MAX_CACHE_BYTES,
+                 timeout=(3, 10), retry_seconds=FAILURE_RETRY_SECONDS, session=None, max_workers=8):
+        self.root = root
+        self.size = tuple(size)
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.retry_seconds = retry_seconds
+        self.session = session or requests.Session()
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._failed = {}  # URL 또는 호스트 -> 실패 시각
+        self.stats = {"hits": 0, "downloads": 0, "failures": 0, "evictions": 0}
+        os.makedirs(root, exist_ok=True)
+        self._sizes = {
+            entry.path: entry.stat().st_size for entry in os.scandir(root) if entry.name.endswith(".webp")
+        }
+
+    def path_for(self, url):
+        return os.path.join(self.root, _key(url, self.size) + ".webp")
+
+    @property
+    def placeholder(self):
+        """원본을 받지 못했을 때 대신 보여줄 회색 이미지 (한 번 만들어 캐시 폴더에 둠)"""
+        path = os.path.join(self.root, "placeholder.png")
+        if not os.path.exists(path):
+            image = Image.new("RGB", self.size, (224, 224, 224))
+            draw = ImageDraw.Draw(image)
+            draw.text((self.size[0] // 2, self.size[1] // 2), "image unavailable", fill=(120, 120, 120), anchor="mm")
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            image.save(tmp_path, format="PNG")
+            os.replace(tmp_path, path)
+        return path
+
+    def get(self, url):
+        """썸네일 파일 경로를 반환합니다. 처음 보는 URL이면 내려받아 만들고, 실패하면 대체 이미지 경로를 반환합니다."""
+        path = self.path_for(url)
+        try:
+            os.utime(path)  # LRU: 마지막 사용 시각 갱신
+        except FileNotFoundError:
+            pass  # 처음 보는 URL이거나, 다른 스레드의 정리(_evict)로 방금 지워진 파일이면 새로 받음
+        else:
+            with self._lock:
+                self.stats["hits"] += 1
+            return path
+
+        host = urlparse(url).netloc
+        now = time.monotonic()
+        with self._lock:
+            failed_at = max(self._failed.get(url, -1e18), self._failed.get(host, -1e18))
+        if now - failed_at < self.retry_seconds:
+            return self.placeholder
+
+        try:
+            data = self._download(url)
+            self._write(path, data)
+        except (requests.ConnectionError, requests.Timeout):
+            # 호스트 자체가 응답하지 않으면 같은 호스트의 다른 이미지도 기다리지 않음
+            self._record_failure(host)
+            return self.placeholder
+        except (requests.RequestException, OSError, ValueError, Image.DecompressionBombError):
+            self._record_failure(url)
+            return self.placeholder
+        with self._lock:
+            self.stats["downloads"] += 1
+        return path
+
+    def _record_failure(self, key):
+        with self._lock:
+            self._failed[key] = time.monotonic()
+            self.stats["failures"] += 1
+
+    def prefetch(self, urls):
+        """여러 URL을 동시에 준비합니다. 반환: {url: 썸네일 또는 대체 이미지 경로}"""
+        urls = list(dict.fromkeys(urls))
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(urls)))) as pool:
+            return dict(zip(urls, pool.map(self.get, urls)))
+
+    def _download(self, url):
+        with self.session.get(url, timeout=self.timeout, stream=True) as response:
+            response.raise_for_status()
+            chunks, total = [], 0
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                total += len(chunk)
+                if total > MAX_SOURCE_BYTES:
+                    raise ValueError(f"image too large: {url}")
+                chunks.append(chunk)
+        return b"".join(chunks)
+
+    def _encode(self, data):
+        """원본 바이트를 self.size 안에 들어가도록 줄인 WebP 바이트로 바꿉니다."""
+        image = Image.open(io.BytesIO(data))
+        output = io.BytesIO()
+        if getattr(image, "n_frames", 1) > 1:
+            frames, durations = [], []
+            for index in range(image.n_frames):
+                image.seek(index)
+                frame = image.convert("RGBA")
+                frame.thumbnail(self.size)
+                frames.append(frame)
+                durations.append(image.info.get("duration", 100))
+            frames[0].save(output, format="WEBP", save_all=True, append_images=frames[1:], duration=durations,
+                           loop=0, quality=75)
+        else:
+            image = ImageOps.exif_transpose(image)
+            image = image.convert("RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB")
+            image.thumbnail(self.size)
+            image.save(output, format="WEBP", quality=80, method=4)
+        return output.getvalue()
+
+    def _write(self, path, data):
+        encoded = self._encode(data)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(encoded)
+        os.replace(tmp_path, path)
+        with self._lock:
+            self._sizes[path] = len(encoded)
+            self._evict(keep=path)
+
+    def _evict(self, keep):
+        # 호출 전에 self._lock을 잡고 있어야 함. 방금 만든 파일(keep)은 지우지 않음
+        total = sum(self._sizes.values())
+        if total <= self.max_bytes:
+            return
+        candidates = [p for p in self._sizes if p != keep]
+        by_age = sorted(candidates, key=lambda p: os.path.getmtime(p) if os.path.exists(p) else 0)
+        for path in by_age:
+            if total <= self.max_bytes:
+                break
+            total -= self._sizes.pop(path)
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self.stats["evictions"] += 1
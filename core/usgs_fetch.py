@@ -0,0 +1,125 @@
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from core import profiling
+from core.quake_parser import empty_quake_frame, parse_geojson_stream
+
+USGS_FDSN_URL = "https://earthquake.usgs.gov/fdsnws/event/1"
+# USGS FDSN 서비스가 쿼리 하나에 허용하는 최대 이벤트 수
+USGS_MAX_ALLOWED = 20000
+_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+
+def make_session(pool_size=8, retries=3, backoff=0.5):
+    """연결을 재사용(keep-alive)하고 일시적 오류는 지수 백오프로 재시도하는 세션을 만듭니다."""
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET",),
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class USGSClient:
+    """
+    USGS FDSN event 서비스 클라이언트입니다.
+    긴 기간은 count로 이벤트 수를 먼저 확인해 한도 이하가 될 때까지 구간을 반으로 나누고,
+    나눈 구간들을 동시에 받아 event id로 중복을 제거한 뒤 합칩니다.
+    base_url을 바꾸면 로컬 대체 서버로도 테스트할 수 있습니다.
+    """
+
+    def __init__(self, base_url=USGS_FDSN_URL, session=None, max_workers=8,
+                 max_per_window=USGS_MAX_ALLOWED, min_window=datetime.timedelta(minutes=10), timeout=60):
+        self.base_url = base_url.rstrip("/")
+        self.max_workers = max_workers
+        self.session = session or make_session(pool_size=max_workers)
+        self.max_per_window = max_per_window
+        self.min_window = min_window
+        self.timeout = timeout
+
+    def _params(self, start, end, min_magnitude, updated_after=None):
+        params = {
+            "format": "geojson",
+            "starttime": start.strftime(_TIME_FORMAT),
+            "endtime": end.strftime(_TIME_FORMAT),
+            "minmagnitude": min_magnitude,
+        }
+        if updated_after is not None:
+            # 조건부 요청: 이 시각 이후 새로 생기거나 수정된 이벤트만 받음
+            params["updatedafter"] = updated_after.strftime(_TIME_FORMAT)
+        return params
+
+    def count(self, start, end, min_magnitude, updated_after=None):
+        """[start, end] 구간의 이벤트 수를 반환합니다."""
+        response = self.session.get(
+            f"{self.base_url}/count", params=self._params(start, end, min_magnitude, updated_after),
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        return int(response.json()["count"])
+
+    def query(self, start, end, min_magnitude, updated_after=None):
+        """[start, end] 구간을 한 번에 받아 DataFrame으로 반환합니다."""
+        with self.session.get(
+            f"{self.base_url}/query", params=self._params(start, end, min_magnitude, updated_after),
+            stream=True, timeout=self.timeout
+        ) as response:
+            response.raise_for_status()
+            return parse_geojson_stream(response.iter_content(chunk_size=1 << 16))
+
+    def plan_windows(self, start, end, min_magnitude, executor, updated_after=None):
+        """
+        이벤트 수가 max_per_window 이하가 될 때까지 구간을 반으로 나눈 목록을 반환합니다.
+        min_window까지 좁혀도 한도를 넘는 구간이 있으면 (그대로 요청하면 400이 나므로) ValueError를 던집니다.
+        """
+        windows = []
+        pending = [(start, end)]
+        while pending:
+            counts = executor.map(lambda w: self.count(w[0], w[1], min_magnitude, updated_after), pending)
+            next_pending = []
+            for (w_start, w_end), n in zip(pending, counts):
+                if n == 0:
+                    continue
+                if n <= self.max_per_window:
+                    windows.append((w_start, w_end))
+                elif w_end - w_start <= self.min_window:
+                    raise ValueError(
+                        f"구간 {w_start.isoformat()} ~ {w_end.isoformat()}의 이벤트 {n:,}건이 "
+                        f"min_window({self.min_window})까지 나눠도 한도 {self.max_per_window:,}건을 넘습니다."
+                    )
+                else:
+                    # 밀도가 높은 구간은 다시 반으로 나눔
+                    middle = w_start + (w_end - w_start) / 2
+                    next_pending += [(w_start, middle), (middle, w_end)]
+            pending = next_pending
+        return sorted(windows)
+
+    def fetch(self, start, end, min_magnitude, updated_after=None):
+        """
+        [start, end] 구간의 지진을 구간 분할 + 동시 요청으로 받아 시간 역순 DataFrame으로 반환합니다.
+        updated_after를 주면 그 이후 추가/수정된 이벤트만 받습니다.
+        """
+        # 응답은 받는 대로 스트리밍 파싱되므로 요청과 파싱은 한 단계로 잼
+        with profiling.timer("USGS 요청/파싱"), ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            windows = self.plan_windows(start, end, min_magnitude, executor, updated_after)
+            frames = list(executor.map(lambda w: self.query(w[0], w[1], min_magnitude, updated_after), windows))
+
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return empty_quake_frame()
+        # 구간 경계에 걸친 이벤트는 양쪽 구간에 모두 들어올 수 있으므로 event id로 중복 제거
+        with profiling.timer("구간 병합"):
+            merged = pd.concat(frames, ignore_index=True)
+            merged["place"] = merged["place"].astype("category")
+            merged = merged.drop_duplicates(subset="id", keep="first")
+            return merged.sort_values("time", ascending=False, ignore_index=True)
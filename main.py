@@ -1,144 +1,199 @@
+import numpy as np
 import streamlit as st
-import folium
-from streamlit_folium import st_folium
+
+from core import profiling
+from core.data_layer import get_data_layer
+from core.places import PlaceCatalog
+from core.search import SearchIndex
+from core.thumbnails import ThumbnailCache
+
+CARDS_PER_PAGE = 10  # 상세 안내 카드를 한 번에 보여줄 개수 ("더 보기"로 이어서 표시)
 
 # 페이지 기본 설정
 st.set_page_config(page_title="캘리포니아 여행 가이드", layout="wide")
+profiling.start_page("여행 가이드")  # ?profile=1 이면 단계별 시간 표시
+# 서버가 뜬 뒤 첫 실행에서 한 번: 주식/지진 페이지의 기본 데이터를 백그라운드에서 미리 받아 둠
+get_data_layer().start_warmup()
 
 st.title("🌴 캘리포니아 여행 가이드")
 
 # 상단 GIF 추가 (즐겁게 달리는 강아지 GIF - Google Cloud Storage)
 # 이 GIF는 제가 직접 GCS에 업로드하여 퍼블릭으로 설정한 링크입니다.
-st.image("https://th.bing.com/th/id/R.125f7da5afdcf8bb45462bb1a9b57668?rik=mVKE%2b2UMRQeQxQ&riu=http%3a%2f%2fetorrent.co.kr%2fdata%2fmw.cheditor%2f160223%2fd1c355b5df2b7e59228348de1be779a5_pQJlzA1vDRWfSzNbFA57zJfpelG9NRgG.gif&ehk=dCurPtppIJKrbPgYWQfkYtKv7oYdhWaAnTtijlYjG1M%3d&risl=&pid=ImgRaw&r=0", use_container_width=True, caption="귀여운 강아지와 함께 즐거운 여행을 시작해 볼까요?")
+HEADER_GIF = "https://th.bing.com/th/id/R.125f7da5afdcf8bb45462bb1a9b57668?rik=mVKE%2b2UMRQeQxQ&riu=http%3a%2f%2fetorrent.co.kr%2fdata%2fmw.cheditor%2f160223%2fd1c355b5df2b7e59228348de1be779a5_pQJlzA1vDRWfSzNbFA57zJfpelG9NRgG.gif&ehk=dCurPtppIJKrbPgYWQfkYtKv7oYdhWaAnTtijlYjG1M%3d&risl=&pid=ImgRaw&r=0"
+
+
+# 원격 이미지는 한 번만 받아 줄인 WebP로 .cache/thumbnails에 보관하고, 받을 수 없으면 대체 이미지를 씀
+@profiling.cache_resource
+def get_thumbnail_cache():
+    return ThumbnailCache()
+
+
+thumbnails = get_thumbnail_cache()
+with profiling.timer("헤더 이미지"):
+    header_image = thumbnails.get(HEADER_GIF)
+st.image(header_image, use_container_width=True, caption="귀여운 강아지와 함께 즐거운 여행을 시작해 볼까요?")
 
 st.markdown("""
 캘리포니아는 아름다운 자연과 도시 문화가 공존하는 미국 최고의 여행지입니다.
 아래에서 명소, 지도, 호텔/식당 정보, 그리고 검색 필터를 확인해 보세요.
 """)
 
-# 관광지 데이터 정의 (모든 이미지 링크를 Google Cloud Storage로 수정)
-places = [
-    {
-        "name": "금문교 (Golden Gate Bridge)",
-        "location": (37.8199, -122.4783),
-        "description": "샌프란시스코의 상징적인 붉은 현수교. 멋진 전망과 사진 명소로 유명합니다.",
-        "image": "https://cdn.pixabay.com/photo/2016/08/15/18/41/golden-gate-bridge-1596161_960_720.jpg",
-        "city": "샌프란시스코",
-        "hotels": ["Hotel Nikko", "Fairmont SF"],
-        "food": ["Boudin Bakery", "Tartine Bakery"]
-    },
-    {
-        "name": "요세미티 국립공원 (Yosemite National Park)",
-        "location": (37.8651, -119.5383),
-        "description": "절경의 폭포, 바위, 숲이 있는 미국 최고의 국립공원 중 하나입니다.",
-        "image": "https://th.bing.com/th/id/OIP.CghOP-oqzwz-p7AiGvT1ZAHaEK?rs=1&pid=ImgDetMain",
-        "city": "요세미티",
-        "hotels": ["The Ahwahnee", "Yosemite Valley Lodge"],
-        "food": ["Degnan's Kitchen", "The Mountain Room"]
-    },
-    {
-        "name": "디즈니랜드 (Disneyland)",
-        "location": (33.8121, -117.9190),
-        "description": "세계 최초 디즈니 테마파크로 가족 여행에 최적입니다.",
-        "image": "https://d2mgzmtdeipcjp.cloudfront.net/files/good/2023/02/07/16757579128783.jpg",
-        "city": "애너하임",
-        "hotels": ["Disneyland Hotel", "Best Western Plus Park Place"],
-        "food": ["Blue Bayou", "Plaza Inn"]
-    },
-    {
-        "name": "산타모니카 피어 (Santa Monica Pier)",
-        "location": (34.0094, -118.4973),
-        "description": "놀이공원, 레스토랑, 바다가 어우러진 활기찬 부두입니다.",
-        "image": "https://www.travelinusa.us/wp-content/uploads/sites/3/2017/08/Santa-Monica-Pier-Cosa-Vedere-scaled-1.jpg",
-        "city": "로스앤젤레스",
-        "hotels": ["Shutters on the Beach", "Loews Santa Monica"],
-        "food": ["The Lobster", "Blue Plate Taco"]
-    },
-    {
-        "name": "할리우드 사인 (Hollywood Sign)",
-        "location": (34.1341, -118.3215),
-        "description": "로스앤젤레스 언덕 위에 위치한 세계적인 상징물입니다.",
-        "image": "https://media.timeout.com/images/100541963/image.jpg",
-        "city": "로스앤젤레스",
-        "hotels": ["Hollywood Roosevelt", "Dream Hollywood"],
-        "food": ["Musso & Frank Grill", "In-N-Out Burger"]
-    },
-    {
-        "name": "빅서 (Big Sur)",
-        "location": (36.3615, -121.8563),
-        "description": "장대한 해안 절벽과 드라이브 코스로 유명한 절경 지역입니다.",
-        "image": "https://th.bing.com/th/id/OIP.eH2EpvP3uebaB2VY2BEe_gHaEK?rs=1&pid=ImgDetMain",
-        "city": "빅서",
-        "hotels": ["Post Ranch Inn", "Ventana Big Sur"],
-        "food": ["Nepenthe", "Big Sur Bakery"]
-    },
-    {
-        "name": "타호 호수 (Lake Tahoe)",
-        "location": (39.0968, -120.0324),
-        "description": "여름엔 수상스포츠, 겨울엔 스키로 유명한 다용도 휴양지입니다.",
-        "image": "https://www.worldatlas.com/r/w1200-q80/upload/b9/b5/1f/lake-tahoe-california-nevada-us-nkneidlphoto.jpg",
-        "city": "타호",
-        "hotels": ["The Ritz-Carlton", "Edgewood Tahoe"],
-        "food": ["Base Camp Pizza", "The Boathouse on the Pier"]
-    },
-    {
-        "name": "샌디에이고 동물원 (San Diego Zoo)",
-        "location": (32.7353, -117.1490),
-        "description": "세계적인 규모와 다양한 동물종을 자랑하는 샌디에이고 동물원입니다.",
-        "image": "https://d2mgzmtdeipcjp.cloudfront.net/files/good/2022/03/15/16473139741350.png",
-        "city": "샌디에이고",
-        "hotels": ["Hotel del Coronado", "Pendry San Diego"],
-        "food": ["The Prado", "Hodad's"]
-    },
-    {
-        "name": "데스 밸리 국립공원 (Death Valley National Park)",
-        "location": (36.5054, -117.0794),
-        "description": "미국에서 가장 건조하고 뜨거운 국립공원입니다. 지형이 매우 독특합니다.",
-        "image": "https://th.bing.com/th/id/OIP.ZkC7FjgTj_rSo_edyDOAtQHaE2?rs=1&pid=ImgDetMain",
-        "city": "데스 밸리",
-        "hotels": ["The Oasis at Death Valley", "Panamint Springs Resort"],
-        "food": ["Timbisha Tacos", "Badwater Saloon"]
-    },
-    {
-        "name": "나파 밸리 (Napa Valley)",
-        "location": (38.5025, -122.2654),
-        "description": "세계적으로 유명한 와인 산지로 고급 와이너리 투어가 가능합니다.",
-        "image": "https://cdn.pixabay.com/photo/2016/08/12/23/49/vineyards-1590014_640.jpg",
-        "city": "나파",
-        "hotels": ["Auberge du Soleil", "Carneros Resort"],
-        "food": ["Bouchon Bistro", "The French Laundry"]
-    }
-]
+# 관광지 데이터 (data/places.json)와 도시 인덱스는 서버에서 한 번만 읽음
+@profiling.cache_resource
+def get_place_catalog():
+    return PlaceCatalog.load()
+
+
+# 필터별로 완성된 지도 HTML을 캐시해 두면, 도시를 바꿀 때 지도를 다시 만들지 않고 꺼내기만 함
+# (catalog_version이 바뀌면, 즉 데이터 파일이 수정되면 새로 만듦)
+@profiling.cache_data(max_entries=256)
+def get_map_html(city, query, catalog_version, route=(), closed=False):
+    # folium은 지도를 처음 만들 때 불러옴 (첫 화면을 늦추지 않도록)
+    from core.places_map import build_places_map, render_map_html
+
+    catalog = get_place_catalog()
+    indices = select_places(city, query, catalog_version)
+    with profiling.timer("지도 생성"):
+        m = build_places_map(catalog, indices, route=route, closed=closed)
+    with profiling.timer("HTML 렌더링"):
+        return render_map_html(m)
+
+
+# 이름/설명/숙소/음식점 역색인은 관광지 목록당 한 번만 만듦
+@profiling.cache_resource
+def get_search_index(catalog_version):
+    return SearchIndex(get_place_catalog().places)
+
+
+def select_places(city, query, catalog_version):
+    """도시 필터와 검색어로 장소 번호를 고릅니다. 검색어가 있으면 관련도 순서입니다."""
+    indices = get_place_catalog().indices(city)
+    if query:
+        with profiling.timer("검색"):
+            ranked = get_search_index(catalog_version).search(query)
+        indices = ranked[np.isin(ranked, indices)]
+    return indices
+
+
+# 근접 검색 인덱스(cKDTree)는 관광지 목록당 한 번만 만듦
+@profiling.cache_resource
+def get_nearby_index(catalog_version):
+    from core.nearby import NearbyIndex  # scipy는 여기서 처음 불러옴
+
+    catalog = get_place_catalog()
+    return NearbyIndex(catalog.lat, catalog.lon)
+
+
+# 고른 장소 조합별 방문 순서 (거리 행렬 + 최근접 이웃 + 2-opt)
+@profiling.cache_data(max_entries=256)
+def get_route(stops, start, closed, catalog_version):
+    from core.nearby import plan_route
+
+    dist = get_nearby_index(catalog_version).distance_matrix(stops)
+    order, total_km, greedy_km = plan_route(dist, stops.index(start), closed)
+    return [stops[i] for i in order], total_km, greedy_km
+
+
+catalog = get_place_catalog()
 
 # 지역 필터
-cities = sorted(list(set([place["city"] for place in places])))
-selected_city = st.selectbox("🔎 도시 필터", ["전체 보기"] + cities)
-
-# 지도 초기화
-m = folium.Map(location=[36.7783, -119.4179], zoom_start=6)
-
-# 마커 추가
-for place in places:
-    if selected_city != "전체 보기" and place["city"] != selected_city:
-        continue
-    folium.Marker(
-        location=place["location"],
-        popup=place["name"],
-        tooltip=place["name"]
-    ).add_to(m)
+cities = catalog.cities
+col_city, col_query = st.columns([1, 2])
+with col_city:
+    selected_city = st.selectbox("🔎 도시 필터", ["전체 보기"] + cities)
+with col_query:
+    query = st.text_input("🔍 검색 (이름, 설명, 숙소, 음식점)", placeholder="예: 와인, Bakery, Disney").strip()
+city_filter = None if selected_city == "전체 보기" else selected_city
+selected = select_places(city_filter, query, catalog.version)
+if query:
+    st.caption(f"'{query}' 검색 결과 {len(selected):,}곳")
+
+nearby = get_nearby_index(catalog.version)
+
+
+def place_label(i):
+    return f"{catalog.places[i]['name']} · {catalog.places[i]['city']}"
+
+
+def nearby_table(found, distance_km):
+    import pandas as pd  # pandas는 표를 처음 그릴 때 불러옴 (첫 화면을 늦추지 않도록)
+
+    return pd.DataFrame({
+        "장소": [catalog.places[i]["name"] for i in found],
+        "도시": [catalog.places[i]["city"] for i in found],
+        "거리 (km)": distance_km.round(1),
+    })
+
+
+# 여행 경로: 고른 장소들을 가장 짧게 도는 순서를 지도에 함께 표시
+st.subheader("🧭 여행 경로 만들기")
+stops = st.multiselect("방문할 장소", list(range(len(catalog))), format_func=place_label)
+route = ()
+closed = False
+if len(stops) >= 2:
+    col_start, col_closed = st.columns([3, 1])
+    with col_start:
+        start = st.selectbox("출발 장소", stops, format_func=place_label)
+    with col_closed:
+        closed = st.checkbox("출발지로 돌아오기", value=False)
+    ordered, total_km, greedy_km = get_route(tuple(sorted(stops)), start, closed, catalog.version)
+    route = tuple(ordered)
+    st.markdown(" → ".join(f"**{n}.** {catalog.places[i]['name']}" for n, i in enumerate(route, start=1)))
+    st.caption(f"총 직선 거리 {total_km:,.1f} km (가까운 곳부터 방문할 때 {greedy_km:,.1f} km)")
 
 # 지도 표시
 st.subheader("🗺️ 관광지 지도")
-st_data = st_folium(m, width=700, height=500)
+map_html = get_map_html(city_filter, query, catalog.version, route, closed)
+profiling.record_payload("관광지 지도", map_html)
+with profiling.timer("전송: 관광지 지도"):
+    st.iframe(map_html, width=700, height=500)
+
+# 주변 명소: 관광지 또는 직접 입력한 위치에서 가까운 곳
+st.subheader("📌 주변 명소 찾기")
+col_origin, col_count = st.columns([3, 1])
+with col_origin:
+    origin = st.radio("기준 위치", ["관광지", "내 위치 (좌표 입력)"], horizontal=True)
+with col_count:
+    k_nearest = st.number_input("개수", min_value=1, max_value=50, value=5)
+if origin == "관광지":
+    base = st.selectbox("기준 장소", list(range(len(catalog))), format_func=place_label)
+    found, distance_km = nearby.nearest(catalog.lat[base], catalog.lon[base], int(k_nearest), exclude=base)
+else:
+    col_lat, col_lon = st.columns(2)
+    with col_lat:
+        my_lat = st.number_input("위도", min_value=-90.0, max_value=90.0, value=34.0522, format="%.4f")
+    with col_lon:
+        my_lon = st.number_input("경도", min_value=-180.0, max_value=180.0, value=-118.2437, format="%.4f")
+    found, distance_km = nearby.nearest(my_lat, my_lon, int(k_nearest))
+
+st.dataframe(
+    nearby_table(found, distance_km),
+    hide_index=True,
+    use_container_width=True
+)
 
 # 장소 상세 출력
+# 카드는 CARDS_PER_PAGE개씩 보여주고, 보이는 카드의 이미지만 동시에 준비함 (필터가 바뀌면 처음부터)
 st.subheader("📍 관광지 상세 안내")
-for place in places:
-    if selected_city != "전체 보기" and place["city"] != selected_city:
-        continue
+if "cards_visible" not in st.session_state or st.session_state["cards_filter"] != (city_filter, query):
+    st.session_state["cards_filter"] = (city_filter, query)
+    st.session_state["cards_visible"] = CARDS_PER_PAGE
+visible = catalog.records(selected[:st.session_state["cards_visible"]])
+with profiling.timer("카드 이미지 준비"):
+    images = thumbnails.prefetch(place["image"] for place in visible)
+
+for place in visible:
     st.markdown(f"### {place['name']}")
-    st.image(place["image"], use_container_width=True)
+    st.image(images[place["image"]], use_container_width=True)
     st.markdown(place["description"])
     st.markdown(f"**🏨 추천 숙소:** {', '.join(place['hotels'])}")
     st.markdown(f"**🍽️ 추천 음식점:** {', '.join(place['food'])}")
     st.markdown("---")
+
+if len(visible) < len(selected):
+    st.caption(f"{len(selected):,}곳 중 {len(visible):,}곳 표시")
+    if st.button("더 보기"):
+        st.session_state["cards_visible"] += CARDS_PER_PAGE
+        st.rerun()
+
+profiling.finish_page()
@@ -1,102 +1,206 @@
 import streamlit as st
-import yfinance as yf
 import pandas as pd
 import plotly.graph_objects as go
-from datetime import datetime, timedelta
+
+from core import analytics, profiling
+from core.data_layer import STOCK_HISTORY_DAYS, TOP_10_TICKERS, get_data_layer
+from core.downsample import WEBGL_THRESHOLD, downsample_frame, figure_payload_bytes, max_points_for_width
+from core.price_provider import PROVIDERS
 
 # --- 페이지 설정 ---
 st.set_page_config(layout="wide", page_title="글로벌 시총 TOP 10 주가 변화")
+profiling.start_page("주식 데이터")  # ?profile=1 이면 단계별 시간 표시
+data_layer = get_data_layer()
+data_layer.start_warmup()  # 프로세스당 한 번: 기본 주가/지진 데이터를 백그라운드에서 미리 받아 둠
 st.title("💰 글로벌 시총 TOP 10 기업 주가 변화 (최근 3년) - 종가 기준")
 
 st.markdown("""
     이 앱은 글로벌 시가총액 상위 10개 기업의 지난 3년간 주가 변화를 보여줍니다.
     **'수정 종가(Adj Close)' 대신 '종가(Close)' 데이터를 사용합니다.**
     따라서 주식 분할이나 배당 등의 이벤트가 발생했을 경우 실제 가치 변동과 그래프가 다르게 보일 수 있습니다.
-    데이터는 `yfinance`를 통해 실시간으로 가져옵니다.
+    데이터는 `yfinance`를 통해 가져오며, 로컬에 저장된 데이터 이후의 최신 구간만 새로 받습니다.
 """)
 
-# --- 글로벌 시총 TOP 10 기업 티커 (2025년 6월 현재 기준 예상) ---
-# 실제 시총 순위는 변동되므로, 최신 정보를 반영하여 필요시 업데이트하세요.
-# 안정적인 시각화를 위해 Berkshire Hathaway는 B클래스(BRK-B)를 사용합니다.
-TOP_10_TICKERS = {
-    "Microsoft": "MSFT",
-    "Apple": "AAPL",
-    "NVIDIA": "NVDA",
-    "Amazon": "AMZN",
-    "Alphabet (Google)": "GOOGL",
-    "Meta Platforms": "META",
-    "Berkshire Hathaway (B)": "BRK-B", # BRK-A는 가격이 너무 높아 시각화가 어려움
-    "Eli Lilly and Company": "LLY",
-    "TSMC": "TSM",
-    "Johnson & Johnson": "JNJ"
-}
-
-# --- 날짜 범위 설정 (최근 3년) ---
-end_date = datetime.now()
-start_date = end_date - timedelta(days=3 * 365) # 3년 전
+# --- 종목 구성 및 데이터 제공자 선택 ---
+st.sidebar.header("종목 구성")
+universe = st.sidebar.radio("비교할 종목", ["글로벌 시총 TOP 10", "직접 입력 (S&P 500 등 대규모 목록)"])
+if universe == "글로벌 시총 TOP 10":
+    tickers_dict = TOP_10_TICKERS
+else:
+    raw_tickers = st.sidebar.text_area(
+        "티커 목록 (쉼표, 공백, 줄바꿈으로 구분)",
+        value=" ".join(TOP_10_TICKERS.values()),
+        height=200
+    )
+    # 중복은 제거하되 입력 순서는 유지
+    custom_tickers = dict.fromkeys(t.strip().upper() for t in raw_tickers.replace(",", " ").split() if t.strip())
+    tickers_dict = {ticker: ticker for ticker in custom_tickers}
+
+provider_key = st.sidebar.selectbox(
+    "데이터 제공자",
+    list(PROVIDERS),
+    format_func=lambda key: PROVIDERS[key].name
+)
+st.sidebar.caption(f"선택된 종목 수: {len(tickers_dict)}개")
+
+st.sidebar.header("차트 설정")
+chart_width = st.sidebar.number_input(
+    "차트 가로 해상도 (px)", min_value=300, max_value=4000, value=1200, step=100,
+    help="트레이스당 점 개수를 이 너비에 맞춰 줄입니다(LTTB). 봉우리와 골짜기는 유지됩니다."
+)
+show_payload = st.sidebar.checkbox("차트 전송량 비교 표시", value=False)
+max_points = max_points_for_width(chart_width)
+payload_rows = []
 
 # --- 데이터 가져오기 및 처리 함수 ---
-@st.cache_data(ttl=3600) # 1시간 캐싱 (자주 호출되면 API 제한 걸릴 수 있음)
-def get_stock_data_close(tickers_dict, start, end):
-    ticker_list = list(tickers_dict.values())
-    full_data = yf.download(ticker_list, start=start, end=end)
-
-    # 'Close' 컬럼만 추출하여 새 DataFrame 생성
-    close_data = pd.DataFrame()
-    for ticker in ticker_list:
-        if ('Close', ticker) in full_data.columns:
-            close_data[ticker] = full_data['Close'][ticker]
-        elif 'Close' in full_data.columns and len(ticker_list) == 1: # 단일 티커 요청 시
-            close_data[ticker] = full_data['Close']
-        else:
-            st.warning(f"티커 {ticker}의 'Close' 데이터를 찾을 수 없습니다. 이 기업은 제외됩니다.")
-            close_data[ticker] = None # 데이터를 찾을 수 없을 때 해당 컬럼을 NaN으로 채움
-
-    # 컬럼 이름을 회사 이름으로 변경 (시각화 편의성)
-    reverse_ticker_map = {v: k for k, v in tickers_dict.items()}
-    close_data.rename(columns=reverse_ticker_map, inplace=True)
+def get_stock_data_close(tickers_dict, provider_key="yahoo"):
+    # 공유 데이터 계층: 저장된 값이 있으면 바로 쓰고, 1시간이 지났으면 최근 구간만 백그라운드에서 새로 받음
+    # (처음 보는 종목 구성이라 저장본이 없을 때만 받을 때까지 기다림)
+    close_data, failures = data_layer.stock_close(tickers_dict.values(), provider_key, STOCK_HISTORY_DAYS)
+
+    # 실패한 티커는 경고를 하나씩 띄우지 않고 표 하나로 모아서 반환
+    failure_table = pd.DataFrame(
+        [
+            {
+                "티커": ticker,
+                "사유": reason,
+                "처리": "로컬 저장본 사용" if close_data[ticker].notna().any() else "제외"
+            }
+            for ticker, reason in failures.items()
+        ],
+        columns=["티커", "사유", "처리"]
+    )
 
-    return close_data
+    # 컬럼 이름을 회사 이름으로 변경 (시각화 편의성, 공유 데이터는 고치지 않음)
+    reverse_ticker_map = {v: k for k, v in tickers_dict.items()}
+    return close_data.rename(columns=reverse_ticker_map), failure_table
+
+# --- 차트 생성 함수 ---
+def line_figure(df, title, yaxis_title, height=600, max_points=None, **trace_kwargs):
+    """
+    컬럼마다 선 하나를 그립니다. max_points가 주어지면 트레이스당 점 개수를 LTTB로 줄이고,
+    그래도 점이 많으면 WebGL(Scattergl)로 그립니다.
+    """
+    series = downsample_frame(df, max_points) if max_points else [(col, df.index, df[col]) for col in df.columns]
+    total_points = sum(len(x) for _, x, _ in series)
+    trace_type = go.Scattergl if total_points > WEBGL_THRESHOLD else go.Scatter
+
+    fig = go.Figure()
+    for company_name, x, y in series:
+        fig.add_trace(trace_type(
+            x=x,
+            y=y,
+            mode='lines',
+            name=company_name,
+            **trace_kwargs
+        ))
+    fig.update_layout(
+        title=title,
+        xaxis_title='날짜',
+        yaxis_title=yaxis_title,
+        hovermode="x unified",
+        legend_title="기업",
+        height=height
+    )
+    return fig
+
+def show_line_chart(df, title, yaxis_title, height=600, **trace_kwargs):
+    # 확대 구간만 잘라서 같은 점 개수 예산으로 다시 줄이므로, 구간을 좁힐수록 세밀한 데이터가 보임
+    view = df.loc[pd.Timestamp(zoom_start):pd.Timestamp(zoom_end)]
+    with profiling.timer(f"차트 생성: {title}"):
+        fig = line_figure(view, title, yaxis_title, height, max_points, **trace_kwargs)
+    profiling.plotly_chart(fig, use_container_width=True)
+
+    if show_payload:
+        full_fig = line_figure(view, title, yaxis_title, height, None, **trace_kwargs)
+        full_bytes, sent_bytes = figure_payload_bytes(full_fig), figure_payload_bytes(fig)
+        payload_rows.append({
+            "차트": title,
+            "원본 점 개수": int(view.notna().to_numpy().sum()),
+            "원본 (KB)": full_bytes / 1024,
+            "전송 (KB)": sent_bytes / 1024,
+            "절감률": 1 - sent_bytes / full_bytes
+        })
 
 # --- 주가 데이터 로드 ---
-with st.spinner("최근 3년간 주가 데이터를 불러오는 중..."):
-    df_prices = get_stock_data_close(TOP_10_TICKERS, start_date, end_date)
+with st.spinner("최근 3년간 주가 데이터를 불러오는 중..."), profiling.timer("주가 데이터"):
+    df_prices, failure_table = get_stock_data_close(tickers_dict, provider_key)
+if data_layer.stocks.refreshing(data_layer.stock_key(tickers_dict.values(), provider_key)):
+    st.caption("🔄 최신 주가를 백그라운드에서 받는 중입니다. 잠시 후 새로고침하면 반영됩니다.")
+
+if not failure_table.empty:
+    excluded = (failure_table["처리"] == "제외").sum()
+    st.warning(
+        f"{len(failure_table)}개 티커의 데이터를 받지 못했습니다. "
+        f"(로컬 저장본으로 표시: {len(failure_table) - excluded}개, 제외: {excluded}개)"
+    )
+    with st.expander("실패한 티커 상세 보기"):
+        st.dataframe(failure_table, use_container_width=True, hide_index=True)
 
 if df_prices.empty or df_prices.isnull().all().all(): # 데이터가 비었거나 전부 NaN인 경우
     st.error("주가 데이터를 불러오지 못했습니다. Yahoo Finance API 또는 인터넷 연결 상태를 확인해주세요. (일부 티커에 문제 있을 수 있음)")
 else:
-    # --- 시각화: 상대적 주가 변화 (정규화) ---
-    st.subheader("📈 지난 3년간 주가 변화 (기준일 대비 정규화)")
-    st.info("각 기업의 주가를 시작일(3년 전) 대비 100%로 정규화하여 상대적인 상승/하락률을 비교합니다.")
-
-    # 각 컬럼의 첫 유효한 값으로 나누어 정규화 (NaN 처리 강화)
-    normalized_df = pd.DataFrame()
-    for col in df_prices.columns:
-        first_valid_value = df_prices[col].dropna().iloc[0] if not df_prices[col].dropna().empty else None
-        if first_valid_value is not None and first_valid_value != 0:
-            normalized_df[col] = (df_prices[col] / first_valid_value) * 100
-        else:
-            st.warning(f"{col}의 초기 주가 데이터가 없거나 0이어서 정규화할 수 없습니다. 이 기업은 그래프에서 제외됩니다.")
-            normalized_df[col] = None # 제외된 컬럼은 NaN으로 채움
-
-    fig_norm = go.Figure()
-    for company_name in normalized_df.columns:
-        if normalized_df[company_name].notna().any(): # NaN이 아닌 유효한 데이터가 있는 경우만 그림
-            fig_norm.add_trace(go.Scatter(
-                x=normalized_df.index,
-                y=normalized_df[company_name],
-                mode='lines',
-                name=company_name
-            ))
-    fig_norm.update_layout(
-        title='글로벌 시총 TOP 10 기업의 상대적 주가 변화',
-        xaxis_title='날짜',
-        yaxis_title='주가 (시작일 대비 100%)',
-        hovermode="x unified",
-        legend_title="기업",
-        height=600
+    # --- 분석 지표 계산 (전체 DataFrame을 float32 배열로 한 번에 계산) ---
+    with profiling.timer("분석 지표: 정규화"):
+        normalized_df = analytics.rebase(df_prices)
+    excluded = normalized_df.columns[normalized_df.isna().all().to_numpy()]
+    if len(excluded) > 0:
+        st.warning(f"초기 주가 데이터가 없거나 0이어서 정규화할 수 없는 기업은 그래프에서 제외됩니다: {', '.join(excluded)}")
+    plotted = normalized_df.columns.difference(excluded, sort=False) # NaN이 아닌 유효한 데이터가 있는 경우만 그림
+
+    # --- 확대 구간 선택 ---
+    zoom_start, zoom_end = df_prices.index[0].date(), df_prices.index[-1].date()
+    if zoom_start < zoom_end:  # 날짜가 하나뿐이면 슬라이더를 만들 수 없으므로 전체 구간을 그대로 씀
+        zoom_start, zoom_end = st.slider(
+            "🔍 확대 구간",
+            min_value=zoom_start,
+            max_value=zoom_end,
+            value=(zoom_start, zoom_end),
+            format="YYYY-MM-DD"
+        )
+
+    st.subheader("📈 지난 3년간 주가 분석")
+    tab_norm, tab_returns, tab_vol, tab_drawdown, tab_corr = st.tabs(
+        ["정규화 주가", "수익률 요약", "변동성", "낙폭 (Drawdown)", "상관관계"]
     )
-    st.plotly_chart(fig_norm, use_container_width=True)
+
+    # --- 시각화: 상대적 주가 변화 (정규화) ---
+    with tab_norm:
+        st.info("각 기업의 주가를 시작일(3년 전) 대비 100%로 정규화하여 상대적인 상승/하락률을 비교합니다.")
+        show_line_chart(normalized_df[plotted], '기업별 상대적 주가 변화', '주가 (시작일 대비 100%)')
+
+    with tab_returns:
+        st.info("일간 로그 수익률을 기준으로 누적/연환산 수익률, 연환산 변동성, 최대 낙폭을 요약합니다.")
+        with profiling.timer("분석 지표: 수익률 요약"):
+            returns_summary = analytics.summary(df_prices[plotted])
+        st.dataframe(
+            returns_summary.style.format("{:.2%}", na_rep="-"),
+            use_container_width=True
+        )
+
+    with tab_vol:
+        vol_window = st.slider("이동 창 크기 (거래일)", 5, 126, 21, key="vol_window")
+        show_line_chart(
+            analytics.rolling_volatility(df_prices[plotted], window=vol_window) * 100,
+            f'{vol_window}거래일 이동 변동성 (연환산)', '변동성 (%)'
+        )
+
+    with tab_drawdown:
+        show_line_chart(analytics.drawdown(df_prices[plotted]) * 100, '직전 고점 대비 낙폭', '낙폭 (%)')
+
+    with tab_corr:
+        with profiling.timer("분석 지표: 상관관계"):
+            corr = analytics.correlation(df_prices[plotted])
+        fig_corr = go.Figure(go.Heatmap(
+            z=corr.to_numpy(),
+            x=corr.columns,
+            y=corr.index,
+            zmin=-1,
+            zmax=1,
+            colorscale='RdBu_r'
+        ))
+        fig_corr.update_layout(title='일간 로그 수익률 상관관계', height=600)
+        profiling.plotly_chart(fig_corr, use_container_width=True)
 
     # --- 개별 기업 주가 선택 및 시각화 ---
     st.subheader("📊 개별 기업 주가 상세 보기")
@@ -106,22 +210,12 @@ else:
     )
 
     if selected_company_name in df_prices.columns:
-        fig_individual = go.Figure()
-        fig_individual.add_trace(go.Scatter(
-            x=df_prices.index,
-            y=df_prices[selected_company_name],
-            mode='lines',
-            name=selected_company_name,
+        show_line_chart(
+            df_prices[[selected_company_name]],
+            f'{selected_company_name} 주가 변화', '주가 (USD)',
+            height=500,
             line=dict(color='blue')
-        ))
-        fig_individual.update_layout(
-            title=f'{selected_company_name} 주가 변화',
-            xaxis_title='날짜',
-            yaxis_title='주가 (USD)',
-            hovermode="x unified",
-            height=500
         )
-        st.plotly_chart(fig_individual, use_container_width=True)
 
         # --- 데이터 테이블 보기 ---
         st.subheader(f"Raw Data: {selected_company_name}")
@@ -129,5 +223,18 @@ else:
     else:
         st.warning(f"선택하신 {selected_company_name}의 주가 데이터를 찾을 수 없습니다. 데이터 로드에 문제가 발생했을 수 있습니다.")
 
+    # --- 차트 전송량 비교 ---
+    if payload_rows:
+        st.subheader("📦 차트 전송량 비교 (다운샘플링 전/후)")
+        st.dataframe(
+            pd.DataFrame(payload_rows).style.format({
+                "원본 (KB)": "{:,.1f}", "전송 (KB)": "{:,.1f}", "절감률": "{:.1%}"
+            }),
+            use_container_width=True,
+            hide_index=True
+        )
+
 st.markdown("---")
 st.markdown("데이터 출처: Yahoo Finance (종가 기준)")
+
+profiling.finish_page()
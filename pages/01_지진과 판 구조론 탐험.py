@@ -1,77 +1,63 @@
 import streamlit as st
 import pandas as pd
 import folium
-from folium.plugins import MarkerCluster
+import numpy as np
 import requests
-import datetime
+from datetime import timedelta
+import plotly.graph_objects as go
+
+from core import profiling
+from core.data_layer import get_data_layer
+from core.plates import BOUNDARY_TYPE_COLORS, BOUNDARY_TYPE_LABELS, PlateBoundaryIndex
+from core.quake_cache import utc_now
+from core.quake_map import DEFAULT_POINT_LIMIT, add_boundary_layer, add_quake_layer
+from core.quake_parser import USGS_EVENT_URL
+from core.quake_stats import QuakeStatsEngine
 
 st.set_page_config(layout="wide", page_title="지진과 판 구조론 탐험")
+profiling.start_page("지진")  # ?profile=1 이면 단계별 시간 표시
+data_layer = get_data_layer()
+data_layer.start_warmup()  # 프로세스당 한 번: 기본 주가/지진 데이터를 백그라운드에서 미리 받아 둠
+
+st.title("🌍 지진과 판 구조론 탐험")
+st.markdown("이 앱은 USGS(미국 지질조사국)의 실시간 지진 데이터를 기반으로 지진 발생 빈도와 판 구조론의 관계를 시각적으로 보여줍니다.")
+st.markdown("---")
+
+st.info(f"**💡 Tip:** 왼쪽 사이드바에서 데이터 필터를 조절하여 지진 정보를 변경할 수 있습니다.")
+
+NEAR_BOUNDARY_KM = 300 # 이 거리 이내의 지진을 '판 경계 부근'으로 봄
 
 # --- 데이터 가져오기 함수 ---
-@st.cache_data(ttl=3600) # 1시간마다 데이터 갱신
 def load_earthquake_data(days=30, min_magnitude=2.5):
     """
-    USGS API에서 최근 지진 데이터를 가져옵니다.
+    최근 지진 데이터를 반환합니다.
+    공유 데이터 계층의 일 단위 파티션 캐시에서 답하고, 오늘/어제 파티션이 오래됐으면 백그라운드에서 갱신합니다.
+    (저장된 적 없는 날짜가 있을 때만 USGS 응답을 기다림)
     """
-    end_time = datetime.datetime.now()
-    start_time = end_time - datetime.timedelta(days=days)
-
-    url = (
-        f"https://earthquake.usgs.gov/fdsnws/event/1/query?"
-        f"format=geojson&starttime={start_time.strftime('%Y-%m-%d')}&endtime={end_time.strftime('%Y-%m-%d')}"
-        f"&minmagnitude={min_magnitude}"
-    )
-
     try:
-        response = requests.get(url)
-        response.raise_for_status() # HTTP 오류 발생 시 예외 처리 (4xx, 5xx 에러)
-        data = response.json()
-
-        features = data.get('features', []) # 'features' 키가 없을 경우 빈 리스트 반환
-        earthquakes = []
-        for feature in features:
-            props = feature.get('properties', {}) # 'properties' 키가 없을 경우 빈 딕셔너리 반환
-            geo = feature.get('geometry', {})     # 'geometry' 키가 없을 경우 빈 딕셔너리 반환
-
-            # 필요한 모든 데이터가 있는지 확인
-            if geo and geo.get('coordinates') and props.get('mag') is not None:
-                coords = geo['coordinates']
-                earthquakes.append({
-                    'place': props.get('place', '장소 정보 없음'),
-                    'magnitude': props['mag'],
-                    'time': datetime.datetime.fromtimestamp(props.get('time', 0)/1000), # 'time' 키가 없을 경우 0으로 처리
-                    'longitude': coords[0],
-                    'latitude': coords[1],
-                    'depth': props.get('depth', None), # 'depth' 키가 없을 경우 None으로 처리
-                    'url': props.get('url', '#')
-                })
-        return pd.DataFrame(earthquakes)
+        with profiling.timer("캐시 확인/갱신"):
+            data_layer.quakes.get(days)
     except requests.exceptions.RequestException as e:
-        st.error(f"지진 데이터를 불러오는 데 실패했습니다: {e}")
-        return pd.DataFrame()
+        st.error(f"지진 데이터를 불러오는 데 실패했습니다: {e} (저장된 데이터만 표시합니다)")
     except Exception as e:
-        st.error(f"데이터 처리 중 예상치 못한 오류가 발생했습니다: {e}")
-        return pd.DataFrame()
+        st.error(f"데이터 처리 중 예상치 못한 오류가 발생했습니다: {e} (저장된 데이터만 표시합니다)")
+    else:
+        if days in data_layer.quakes.errors:
+            st.warning(f"최근 지진 데이터 갱신에 실패했습니다: {data_layer.quakes.errors[days]} (저장된 데이터를 표시합니다)")
+    return data_layer.quake_cache().query(days, min_magnitude)
 
-# --- 지진 규모별 색상 및 설명 ---
-def get_magnitude_color(magnitude):
-    if magnitude is None: # None 값 처리 추가
-        return 'gray'
-    elif magnitude >= 8.0:
-        return 'darkred'
-    elif magnitude >= 7.0:
-        return 'red'
-    elif magnitude >= 6.0:
-        return 'orange'
-    elif magnitude >= 5.0:
-        return 'darkorange'
-    elif magnitude >= 4.0:
-        return 'lightred'
-    elif magnitude >= 3.0:
-        return 'beige'
-    else: # 2.5 이상
-        return 'lightblue'
+@profiling.cache_resource
+def get_quake_stats():
+    # 날짜 파티션별 통계 캐시
+    return QuakeStatsEngine()
+
+@profiling.cache_resource
+def get_plate_index():
+    # 판 경계 공간 인덱스는 서버에서 한 번만 만듦
+    return PlateBoundaryIndex.load()
 
+# --- 지진 규모별 색상 및 설명 ---
+# get_magnitude_color와 배열 전체를 한 번에 분류하는 버전은 core.quake_map에 있습니다.
 def get_magnitude_info(magnitude):
     if magnitude is None:
         return "정보 없음"
@@ -105,55 +91,85 @@ min_mag = st.sidebar.slider(
     min_value=1.0, max_value=8.0, value=2.5, step=0.1
 )
 
-st.title("🌍 지진과 판 구조론 탐험")
-st.markdown("이 앱은 USGS(미국 지질조사국)의 실시간 지진 데이터를 기반으로 지진 발생 빈도와 판 구조론의 관계를 시각적으로 보여줍니다.")
-st.markdown("---")
-
-st.info(f"**💡 Tip:** 왼쪽 사이드바에서 데이터 필터를 조절하여 지진 정보를 변경할 수 있습니다.")
+st.sidebar.header("지도 표시")
+point_limit = st.sidebar.number_input(
+    "개별 점으로 표시할 최대 지진 수",
+    min_value=1000, max_value=200000, value=DEFAULT_POINT_LIMIT, step=1000,
+    help="이보다 많으면 격자 집계 히트맵으로 전환합니다."
+)
 
 # 지진 데이터 로드
 df_earthquakes = load_earthquake_data(num_days, min_mag)
 
 if not df_earthquakes.empty:
+    # 지진마다 가장 가까운 판 경계와 거리 계산 (인덱스는 한 번만 만들어 재사용)
+    boundary_index = get_plate_index()
+    with profiling.timer("판 경계 거리 계산"):
+        df_earthquakes = boundary_index.annotate(df_earthquakes)
+
     st.header(f"최근 {num_days}일 간 규모 {min_mag} 이상 지진 분포")
 
     # 지도 생성 (평균 위도, 경도)
     # 데이터프레임이 비어 있지 않으므로 .mean() 사용 가능
-    map_center_lat = df_earthquakes['latitude'].mean()
-    map_center_lon = df_earthquakes['longitude'].mean()
-    m = folium.Map(location=[map_center_lat, map_center_lon], zoom_start=2, control_scale=True)
-
-    # 마커 클러스터 추가
-    marker_cluster = MarkerCluster().add_to(m)
-
-    for idx, row in df_earthquakes.iterrows():
-        # 'depth'가 None일 경우 '정보 없음'으로 표시
-        depth_info = f"{row['depth']:.1f} km" if row['depth'] is not None else "정보 없음"
-        popup_html = f"""
-        <b>장소:</b> {row['place']}<br>
-        <b>규모:</b> {row['magnitude']:.1f}<br>
-        <b>시간:</b> {row['time'].strftime('%Y-%m-%d %H:%M:%S')}<br>
-        <b>깊이:</b> {depth_info}<br>
-        <b>정보:</b> <a href="{row['url']}" target="_blank">자세히 보기</a>
-        """
-        # magnitude가 None일 경우 대비 (radius 계산 및 color 결정)
-        marker_radius = row['magnitude'] * 2 if row['magnitude'] is not None else 5
-        marker_color = get_magnitude_color(row['magnitude'])
-
-        folium.CircleMarker(
-            location=[row['latitude'], row['longitude']],
-            radius=marker_radius,
-            color=marker_color,
-            fill=True,
-            fill_color=marker_color,
-            fill_opacity=0.7,
-            popup=folium.Popup(popup_html, max_width=300)
-        ).add_to(marker_cluster)
+    with profiling.timer("지도 생성"):
+        map_center_lat = df_earthquakes['latitude'].mean()
+        map_center_lon = df_earthquakes['longitude'].mean()
+        m = folium.Map(location=[map_center_lat, map_center_lon], zoom_start=2, control_scale=True)
+
+        # 판 경계선 (지진 레이어 아래에 깔림)
+        add_boundary_layer(m, boundary_index)
+
+        # 지진 수가 적으면 GeoJSON 점 레이어 하나로, 많으면 격자 집계 히트맵으로 표시
+        # (색상/크기/팝업은 브라우저에서 만들어지므로 이벤트 수만큼 파이썬 객체를 만들지 않음)
+        map_mode = add_quake_layer(m, df_earthquakes, USGS_EVENT_URL, point_limit=point_limit)
+    if map_mode == "heatmap":
+        st.caption(f"지진이 {len(df_earthquakes):,}건으로 표시 한도({point_limit:,}건)를 넘어 격자 집계 히트맵으로 표시합니다. 원을 클릭하면 칸별 지진 수를 볼 수 있습니다.")
 
     # Streamlit에 Folium 지도 표시
     # use_container_width=True는 st_folium에서 지원되지 않으므로, width와 height를 직접 설정합니다.
     from streamlit_folium import st_folium
-    st_data = st_folium(m, width=1200, height=600) # Removed use_container_width=True
+    # returned_objects=[]: 지도를 움직여도 스크립트가 다시 실행되지 않게 함
+    profiling.record_payload("지진 지도", m)
+    with profiling.timer("전송: 지진 지도"):
+        st_data = st_folium(m, width=1200, height=600, returned_objects=[]) # Removed use_container_width=True
+
+    # --- 판 경계와 지진 ---
+    st.markdown("---")
+    st.header("판 경계와 지진")
+    st.caption("판 경계선은 주요 경계를 단순화한 근사 좌표이므로 거리는 수십 km 정도의 오차가 있을 수 있습니다.")
+    df_near = df_earthquakes.sample(min(len(df_earthquakes), 50000), random_state=0) # 산점도는 최대 5만 건만 표시
+    fig_distance = go.Figure()
+    for boundary_type, label in BOUNDARY_TYPE_LABELS.items():
+        subset = df_near[df_near['boundary_type'] == boundary_type]
+        fig_distance.add_trace(go.Scattergl(
+            x=subset['boundary_distance_km'],
+            y=subset['magnitude'],
+            mode='markers',
+            name=label,
+            marker=dict(color=BOUNDARY_TYPE_COLORS[boundary_type], size=4, opacity=0.5)
+        ))
+    fig_distance.update_layout(
+        title='가장 가까운 판 경계까지의 거리와 규모',
+        xaxis_title='판 경계까지 거리 (km)',
+        yaxis_title='규모 (M)',
+        legend_title='가장 가까운 경계 유형',
+        height=500
+    )
+    profiling.plotly_chart(fig_distance, use_container_width=True)
+
+    col_type, col_plate = st.columns(2)
+    with col_type:
+        near_boundary = df_earthquakes['boundary_distance_km'] <= NEAR_BOUNDARY_KM
+        st.metric(f"판 경계 {NEAR_BOUNDARY_KM}km 이내 지진 비율", f"{near_boundary.mean():.1%}")
+        type_counts = (
+            df_earthquakes.loc[near_boundary, 'boundary_type']
+            .value_counts()
+            .rename(index=BOUNDARY_TYPE_LABELS)
+        )
+        st.bar_chart(type_counts, horizontal=True, x_label="지진 수", y_label="경계 유형")
+    with col_plate:
+        st.markdown(f"**판별 지진 수** (경계 {NEAR_BOUNDARY_KM}km 이내, 경계 양쪽 판에 모두 포함)")
+        st.bar_chart(boundary_index.plate_counts(df_earthquakes, NEAR_BOUNDARY_KM), horizontal=True, x_label="지진 수")
 
     st.markdown("---")
     st.header("지진 규모 설명")
@@ -189,15 +205,64 @@ if not df_earthquakes.empty:
     st.markdown("---")
     st.header("지진 발생 빈도 통계")
     st.write(f"총 {len(df_earthquakes)} 건의 지진이 발생했습니다.")
-    # 'depth' 컬럼이 None 값을 포함할 수 있으므로, .head() 이후에 .fillna() 적용
-    st.dataframe(
-        df_earthquakes[['place', 'magnitude', 'depth', 'time']]
-        .sort_values(by='time', ascending=False)
-        .head(10)
-        .fillna({'depth': '정보 없음'}), # None 값을 '정보 없음'으로 표시
-        use_container_width=True
+
+    # 날짜 파티션별 히스토그램을 캐시해 두고 더하기만 하므로, 새 날짜가 추가될 때 그 날짜만 다시 계산
+    now = utc_now()
+    with profiling.timer("통계 집계"):
+        stats = get_quake_stats().summarize(
+            data_layer.quake_cache().partitions(num_days, now), now - timedelta(days=num_days), min_mag
+        )
+    tab_gr, tab_depth, tab_time, tab_region, tab_recent = st.tabs(
+        ["규모-빈도 (구텐베르크-리히터)", "깊이 분포", "일별/시간대별", "지역 TOP 10", "최근 지진"]
     )
 
+    with tab_gr:
+        cumulative = stats["cumulative_counts"]
+        cumulative = cumulative[cumulative > 0]
+        fig_gr = go.Figure()
+        fig_gr.add_trace(go.Bar(
+            x=stats["magnitude_counts"].index, y=stats["magnitude_counts"], name='구간별 지진 수', opacity=0.5
+        ))
+        fig_gr.add_trace(go.Scatter(
+            x=cumulative.index, y=cumulative, mode='markers', name='누적 지진 수 N(≥M)'
+        ))
+        if np.isfinite(stats["gr_b"]):
+            fit_m = cumulative.index[cumulative.index >= stats["gr_mc"] - 1e-9]
+            fig_gr.add_trace(go.Scatter(
+                x=fit_m, y=10 ** (stats["gr_a"] - stats["gr_b"] * fit_m), mode='lines',
+                name=f'log N = {stats["gr_a"]:.2f} - {stats["gr_b"]:.2f} M'
+            ))
+            st.metric("b값 (Aki 최대우도 추정)", f"{stats['gr_b']:.2f}", help=f"완전성 규모 Mc = {stats['gr_mc']:.1f} (최대 곡률법)")
+        fig_gr.update_layout(
+            xaxis_title='규모 (M)', yaxis_title='지진 수', yaxis_type='log', height=450,
+            title='규모-빈도 분포'
+        )
+        profiling.plotly_chart(fig_gr, use_container_width=True)
+
+    with tab_depth:
+        st.bar_chart(stats["depth_counts"], x_label="깊이 (km, 10km 구간 시작)", y_label="지진 수")
+
+    with tab_time:
+        st.markdown("**일별 지진 수**")
+        st.bar_chart(stats["day_counts"], x_label="날짜 (UTC)", y_label="지진 수")
+        st.markdown("**시간대별 지진 수**")
+        st.bar_chart(stats["hour_counts"], x_label="시각 (UTC)", y_label="지진 수")
+
+    with tab_region:
+        st.bar_chart(stats["top_regions"], horizontal=True, x_label="지진 수", y_label="지역")
+
+    with tab_recent:
+        # 'depth' 컬럼이 NaN 값을 포함할 수 있으므로, .head() 이후에 .fillna() 적용
+        st.dataframe(
+            df_earthquakes[['place', 'magnitude', 'depth', 'time']]
+            .sort_values(by='time', ascending=False)
+            .head(10)
+            .astype({'depth': object})
+            .fillna({'depth': '정보 없음'}), # NaN 값을 '정보 없음'으로 표시
+            use_container_width=True
+        )
+
 else:
     st.warning("선택된 필터 조건에 해당하는 지진 데이터가 없습니다. 필터를 조절해 보세요.")
 
+profiling.finish_page()
@@ -2,44 +2,323 @@ import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
 
+from core import profiling
+from core.animation import angle_sweep_animation, flight_animation, trajectory
+from core.downsample import figure_payload_bytes
+from core.drag import drag_factor, simulate
+from core.monte_carlo import (
+    available_workers,
+    dispersion,
+    launch_spec,
+    run_monte_carlo,
+    trajectory_bands
+)
+from core.projectile import G, display_stride, optimal_angles, sweep, trajectory_fan, vacuum_trajectory
+
+profiling.start_page("포물선 운동")  # ?profile=1 이면 단계별 시간 표시
+
 # 타이틀
 st.title("🎯 포물선 운동 시뮬레이터")
 
-# 사용자 입력
-initial_speed = st.slider("초기 속도 (m/s)", 1, 100, 30)
-angle_deg = st.slider("발사 각도 (도)", 0, 90, 45)
-g = 9.81  # 중력 가속도
-
-# 각도 라디안으로 변환
-angle_rad = np.radians(angle_deg)
-
-# 시간, 최대 도달 시간 계산
-t_flight = 2 * initial_speed * np.sin(angle_rad) / g
-t = np.linspace(0, t_flight, num=300)
-
-# 운동 방정식
-x = initial_speed * np.cos(angle_rad) * t
-y = initial_speed * np.sin(angle_rad) * t - 0.5 * g * t**2
-
-# Plotly 그래프
-fig = go.Figure()
-fig.add_trace(go.Scatter(x=x, y=y, mode='lines', name='운동 궤적'))
-fig.update_layout(
-    xaxis_title='거리 (m)',
-    yaxis_title='높이 (m)',
-    title='포물선 운동 궤적',
-    showlegend=False,
-    height=500
-)
+mode = st.radio("모드", ["단일 발사", "애니메이션", "파라미터 스윕", "몬테카를로"], horizontal=True)
+g = G  # 중력 가속도
+
+
+# --- 애니메이션: 프레임을 한 번 만들어 보내고 재생은 브라우저에서 ---
+@profiling.cache_data(max_entries=64)
+def get_angle_animation(speed, angles, k):
+    return angle_sweep_animation(speed, list(angles), k, g)
+
+
+@profiling.cache_data(max_entries=64)
+def get_flight_animation(speed, angle_deg, k):
+    return flight_animation(speed, angle_deg, k, g)
+
+
+# --- 몬테카를로 결과 그리기 ---
+def landing_histogram(down, stats):
+    """사거리 방향 착지 거리 히스토그램 (브라우저로는 막대 높이만 보냄)"""
+    counts, edges = np.histogram(down, bins=60)
+    fig = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges), name='표본 수'))
+    for key, label in (("range_p5", "5%"), ("range_p50", "50%"), ("range_p95", "95%")):
+        fig.add_vline(x=stats[key], line_dash='dash', annotation_text=label)
+    fig.update_layout(title='착지 거리 분포', xaxis_title='거리 (m)', yaxis_title='표본 수', height=400)
+    return fig
+
+
+def show_dispersion_metrics(stats, done, total):
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("표본", f"{done:,} / {total:,}")
+    col2.metric("평균 사거리", f"{stats['center_down']:.2f} m")
+    col3.metric("CEP (50%)", f"{stats['cep50']:.2f} m")
+    col4.metric("CEP (90%)", f"{stats['cep90']:.2f} m")
+
+
+def landing_scatter(down, cross, stats, max_points=3000):
+    """착지점 산점도(표본 일부)와 CEP 원"""
+    step = max(1, len(down) // max_points)
+    fig = go.Figure(go.Scattergl(
+        x=down[::step], y=cross[::step], mode='markers', name='착지점',
+        marker=dict(size=3, opacity=0.4)
+    ))
+    for key, label, color in (("cep50", "CEP 50%", "red"), ("cep90", "CEP 90%", "orange")):
+        radius = stats[key]
+        fig.add_shape(
+            type='circle', xref='x', yref='y', line=dict(color=color, width=2),
+            x0=stats["center_down"] - radius, x1=stats["center_down"] + radius,
+            y0=stats["center_cross"] - radius, y1=stats["center_cross"] + radius
+        )
+        fig.add_trace(go.Scatter(x=[None], y=[None], mode='lines', name=label, line=dict(color=color)))
+    fig.update_layout(
+        title='착지점 분산', xaxis_title='사거리 방향 (m)', yaxis_title='좌우 방향 (m)',
+        yaxis=dict(scaleanchor='x'), height=450
+    )
+    return fig
+
+
+def trajectory_band_figure(x_grid, bands):
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=x_grid, y=bands[95], mode='lines', line=dict(width=0), showlegend=False))
+    fig.add_trace(go.Scatter(
+        x=x_grid, y=bands[5], mode='lines', line=dict(width=0), fill='tonexty',
+        fillcolor='rgba(31, 119, 180, 0.3)', name='5~95% 구간'
+    ))
+    fig.add_trace(go.Scatter(x=x_grid, y=bands[50], mode='lines', name='중앙값', line=dict(color='#1f77b4')))
+    fig.update_layout(title='궤적 백분위 띠', xaxis_title='거리 (m)', yaxis_title='높이 (m)', height=450)
+    return fig
+
+
+if mode == "단일 발사":
+    # 사용자 입력
+    initial_speed = st.slider("초기 속도 (m/s)", 1, 100, 30)
+    angle_deg = st.slider("발사 각도 (도)", 0, 90, 45)
+
+    # --- 공기 저항 / 바람 / 발사 높이 ---
+    use_drag = st.checkbox("공기 저항 적용", value=False)
+    if use_drag:
+        col_ball, col_env = st.columns(2)
+        with col_ball:
+            drag_cd = st.number_input("항력 계수 Cd", min_value=0.0, max_value=2.0, value=0.47, step=0.01)
+            diameter = st.number_input("지름 (m)", min_value=0.01, max_value=1.0, value=0.22, step=0.01)
+            mass = st.number_input("질량 (kg)", min_value=0.01, max_value=100.0, value=0.43, step=0.01)
+        with col_env:
+            wind = st.slider("바람 (m/s, + 뒷바람 / - 맞바람)", -20.0, 20.0, 0.0, step=0.5)
+            launch_height = st.slider("발사 높이 (m)", 0.0, 100.0, 0.0, step=1.0)
+        k = float(drag_factor(drag_cd, diameter, mass))
+    else:
+        k, wind, launch_height = 0.0, 0.0, 0.0
+
+    # 운동 방정식 (시간, 최대 도달 시간 포함)
+    t, x, y, t_flight = vacuum_trajectory(initial_speed, angle_deg, g)
+
+    # Plotly 그래프
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=x, y=y, mode='lines', name='진공 궤적' if use_drag else '운동 궤적'))
+
+    # 각도 라디안으로 변환
+    angle_rad = np.radians(angle_deg)
+
+    # 최대 높이, 사거리, 비행 시간 계산
+    max_height = (initial_speed**2) * (np.sin(angle_rad)**2) / (2 * g)
+    range_ = (initial_speed**2) * np.sin(2 * angle_rad) / g
+
+    if use_drag:
+        # 공기 저항 궤적은 RK4로 적분 (착지 지점은 스텝 안에서 근을 찾아 보정)
+        with profiling.timer("공기 저항 적분"):
+            result = simulate(initial_speed, angle_deg, k, wind, launch_height, g, record=True)
+        drag_x, drag_y = result["paths"][0]
+        fig.add_trace(go.Scatter(x=drag_x, y=drag_y, mode='lines', name='공기 저항 궤적'))
+        max_height = float(result["max_height"])
+        range_ = float(result["range"])
+        t_flight = float(result["flight_time"])
+
+    fig.update_layout(
+        xaxis_title='거리 (m)',
+        yaxis_title='높이 (m)',
+        title='포물선 운동 궤적',
+        showlegend=use_drag,
+        height=500
+    )
+
+    # 결과 출력
+    profiling.plotly_chart(fig)
+    st.subheader("📊 결과")
+    st.markdown(f"- **최대 높이**: {max_height:.2f} m")
+    st.markdown(f"- **도달 거리**: {range_:.2f} m")
+    st.markdown(f"- **비행 시간**: {t_flight:.2f} s")
+    if use_drag:
+        st.markdown(f"- **착지 속도**: {float(result['impact_speed']):.2f} m/s")
+        st.caption(f"항력 계수 k = ρ·Cd·A / 2m = {k:.4f} 1/m, 공기 밀도 1.225 kg/m³ 기준")
+
+elif mode == "애니메이션":
+    st.markdown("프레임을 미리 계산해 한 번에 보내므로 재생과 슬라이더 이동은 서버를 거치지 않고 브라우저에서 바로 일어납니다.")
+    animation_kind = st.radio("애니메이션 종류", ["발사 각도 변화", "시간에 따른 비행"], horizontal=True)
+    col_speed, col_drag = st.columns(2)
+    with col_speed:
+        anim_speed = st.slider("초기 속도 (m/s)", 1, 100, 30, key="anim_speed")
+    with col_drag:
+        anim_drag = st.checkbox("공기 저항 적용 (축구공: Cd 0.47, 지름 0.22 m, 질량 0.43 kg)", value=False)
+    anim_k = round(float(drag_factor(0.47, 0.22, 0.43)), 6) if anim_drag else 0.0
+
+    if animation_kind == "발사 각도 변화":
+        angle_step = st.select_slider("각도 간격 (도)", options=[1, 2, 5, 10], value=2)
+        anim_fig = get_angle_animation(anim_speed, tuple(range(0, 91, angle_step)), anim_k)
+    else:
+        anim_angle = st.slider("발사 각도 (도)", 0, 90, 45, key="anim_angle")
+        anim_fig = get_flight_animation(anim_speed, anim_angle, anim_k)
+
+    profiling.plotly_chart(anim_fig, use_container_width=True)
+    cache = trajectory.cache_info()
+    st.caption(
+        f"프레임 {len(anim_fig.frames)}개, 전송량 {figure_payload_bytes(anim_fig) / 1024:.0f} KB · "
+        f"궤적 캐시 {cache.currsize}개 (적중 {cache.hits}, 계산 {cache.misses})"
+    )
+
+elif mode == "파라미터 스윕":
+    # --- 파라미터 스윕: 속도 x 각도 격자 전체를 한 번에 계산 ---
+    st.markdown("속도와 각도의 모든 조합을 NumPy 브로드캐스팅으로 한 번에 계산해 사거리, 최대 높이, 비행 시간을 비교합니다.")
+    col_speed, col_angle = st.columns(2)
+    with col_speed:
+        speed_range = st.slider("속도 범위 (m/s)", 1, 100, (1, 100))
+        n_speeds = st.number_input("속도 격자 수", min_value=10, max_value=2000, value=1000, step=10)
+    with col_angle:
+        angle_range = st.slider("각도 범위 (도)", 0, 90, (0, 90))
+        n_angles = st.number_input("각도 격자 수", min_value=10, max_value=2000, value=900, step=10)
+
+    speeds = np.linspace(speed_range[0], speed_range[1], int(n_speeds), dtype=np.float32)
+    angles = np.linspace(angle_range[0], angle_range[1], int(n_angles), dtype=np.float32)
+    with profiling.timer("스윕 계산"):
+        results = sweep(speeds, angles, g)
+        best_angles = optimal_angles(results["range"], angles)
+    st.caption(f"발사 {len(speeds) * len(angles):,}회를 계산했습니다.")
+
+    # 히트맵은 브라우저로 보내는 셀 수를 제한 (계산은 전체 격자로, 표시는 간격을 두고)
+    speed_step = display_stride(len(speeds), 300)
+    angle_step = display_stride(len(angles), 300)
+    heatmaps = [
+        ("range", "사거리 (m)"),
+        ("max_height", "최대 높이 (m)"),
+        ("flight_time", "비행 시간 (s)")
+    ]
+    for tab, (key, label) in zip(st.tabs([label for _, label in heatmaps]), heatmaps):
+        with tab:
+            fig_heat = go.Figure(go.Heatmap(
+                x=angles[::angle_step],
+                y=speeds[::speed_step],
+                z=results[key][::speed_step, ::angle_step],
+                colorscale='Viridis',
+                colorbar=dict(title=label)
+            ))
+            if key == "range":
+                # 속도별 최적 각도 곡선
+                fig_heat.add_trace(go.Scatter(
+                    x=best_angles[::speed_step],
+                    y=speeds[::speed_step],
+                    mode='lines',
+                    name='최적 각도',
+                    line=dict(color='white', width=2)
+                ))
+            fig_heat.update_layout(
+                title=f'속도 x 각도별 {label}',
+                xaxis_title='발사 각도 (도)',
+                yaxis_title='초기 속도 (m/s)',
+                height=550
+            )
+            profiling.plotly_chart(fig_heat, use_container_width=True)
+
+    # --- 같은 속도의 모든 궤적과 포락선 ---
+    st.subheader("🌈 같은 속도로 쏜 궤적과 포락선")
+    fan_speed = st.slider("속도 (m/s)", 1, 100, 30, key="fan_speed")
+    fan_angles = np.arange(5, 90, 5)
+    fan_x, fan_y, envelope_x, envelope_y = trajectory_fan(fan_speed, fan_angles, g)
+    fig_fan = go.Figure()
+    for angle, xs, ys in zip(fan_angles, fan_x, fan_y):
+        fig_fan.add_trace(go.Scatter(
+            x=xs, y=ys, mode='lines', name=f'{angle}°',
+            line=dict(width=1), opacity=0.6
+        ))
+    fig_fan.add_trace(go.Scatter(
+        x=envelope_x, y=envelope_y, mode='lines', name='포락선',
+        line=dict(color='black', width=3, dash='dash')
+    ))
+    fig_fan.update_layout(
+        title=f'초기 속도 {fan_speed} m/s 궤적 모음',
+        xaxis_title='거리 (m)',
+        yaxis_title='높이 (m)',
+        height=500
+    )
+    profiling.plotly_chart(fig_fan, use_container_width=True)
+
+else:
+    # --- 몬테카를로: 발사 조건의 불확실성이 착지점에 주는 영향 ---
+    st.markdown("속도, 각도, 방위각, 항력 계수에 정규분포 오차를 주고 수많은 발사를 한꺼번에 계산해 착지점이 얼마나 퍼지는지 봅니다.")
+    with st.form("monte_carlo_form"):
+        col_launch, col_air = st.columns(2)
+        with col_launch:
+            mc_speed = st.slider("평균 속도 (m/s)", 1, 100, 30)
+            mc_speed_sd = st.number_input("속도 표준편차 (m/s)", min_value=0.0, max_value=20.0, value=1.5, step=0.1)
+            mc_angle = st.slider("평균 각도 (도)", 0, 90, 45)
+            mc_angle_sd = st.number_input("각도 표준편차 (도)", min_value=0.0, max_value=20.0, value=3.0, step=0.1)
+            mc_azimuth_sd = st.number_input("방위각 표준편차 (도)", min_value=0.0, max_value=20.0, value=1.0, step=0.1)
+        with col_air:
+            mc_drag = st.checkbox("공기 저항 적용", value=False)
+            mc_cd = st.number_input("항력 계수 Cd 평균", min_value=0.0, max_value=2.0, value=0.47, step=0.01)
+            mc_cd_sd = st.number_input("항력 계수 표준편차", min_value=0.0, max_value=1.0, value=0.05, step=0.01)
+            mc_wind = st.slider("바람 (m/s, + 뒷바람 / - 맞바람)", -20.0, 20.0, 0.0, step=0.5)
+            mc_height = st.slider("발사 높이 (m)", 0.0, 100.0, 0.0, step=1.0)
+        mc_samples = st.select_slider("표본 수", options=[10_000, 100_000, 1_000_000], value=100_000)
+        mc_workers = st.number_input(
+            "작업 프로세스 수 (공기 저항일 때만)", min_value=1, max_value=available_workers(), value=1
+        )
+        submitted = st.form_submit_button("시뮬레이션 실행")
+
+    # 지름/질량은 단일 발사 모드의 기본 공(축구공)과 같은 값
+    spec = launch_spec(
+        mc_speed, mc_speed_sd, mc_angle, mc_angle_sd, mc_azimuth_sd,
+        drag=mc_drag, cd=mc_cd, cd_sd=mc_cd_sd, wind=mc_wind, height=mc_height, g=g
+    )
 
-# 최대 높이, 사거리, 비행 시간 계산
-max_height = (initial_speed**2) * (np.sin(angle_rad)**2) / (2 * g)
-range_ = (initial_speed**2) * np.sin(2 * angle_rad) / g
+    if submitted or "monte_carlo" not in st.session_state:
+        # 청크가 끝날 때마다 지표와 히스토그램을 다시 그려 수렴 과정을 보여줌
+        progress = st.progress(0.0, text="계산 중...")
+        metrics_slot = st.empty()
+        histogram_slot = st.empty()
+        with profiling.timer("몬테카를로 계산 (중간 결과 표시 포함)"):
+            for chunk_no, (done, landing) in enumerate(run_monte_carlo(spec, mc_samples, workers=int(mc_workers))):
+                stats = dispersion(landing["down"], landing["cross"])
+                progress.progress(done / mc_samples, text=f"{done:,} / {mc_samples:,}")
+                with metrics_slot.container():
+                    show_dispersion_metrics(stats, done, mc_samples)
+                histogram_slot.plotly_chart(
+                    landing_histogram(landing["down"], stats), use_container_width=True, key=f"mc_hist_{chunk_no}"
+                )
+        progress.empty()
+        metrics_slot.empty()
+        histogram_slot.empty()
+        # 실행 결과는 세션에 보관해 다른 위젯을 건드려도 다시 계산하지 않음
+        with profiling.timer("궤적 백분위 띠"):
+            bands = trajectory_bands(spec)
+        st.session_state["monte_carlo"] = {
+            "landing": {name: values.copy() for name, values in landing.items()},
+            "stats": stats,
+            "bands": bands,
+            "total": mc_samples,
+        }
 
-# 결과 출력
-st.plotly_chart(fig)
-st.subheader("📊 결과")
-st.markdown(f"- **최대 높이**: {max_height:.2f} m")
-st.markdown(f"- **도달 거리**: {range_:.2f} m")
-st.markdown(f"- **비행 시간**: {t_flight:.2f} s")
+    result = st.session_state["monte_carlo"]
+    stats = result["stats"]
+    show_dispersion_metrics(stats, result["total"], result["total"])
+    profiling.plotly_chart(landing_histogram(result["landing"]["down"], stats), use_container_width=True)
+    col_scatter, col_band = st.columns(2)
+    with col_scatter:
+        profiling.plotly_chart(
+            landing_scatter(result["landing"]["down"], result["landing"]["cross"], stats), use_container_width=True
+        )
+    with col_band:
+        profiling.plotly_chart(trajectory_band_figure(*result["bands"]), use_container_width=True)
+    st.caption(
+        f"사거리 5~95% 구간: {stats['range_p5']:.2f} ~ {stats['range_p95']:.2f} m, "
+        f"표준편차 {stats['range_sd']:.2f} m, 평균 비행 시간 {np.mean(result['landing']['flight_time']):.2f} s"
+    )
 
+profiling.finish_page()
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from core.drag import drag_factor, simulate
+from core.projectile import G
+
+SPEEDS = np.array([10.0, 35.0, 80.0])
+ANGLES = np.array([15.0, 45.0, 70.0])
+
+
+def test_zero_drag_matches_vacuum_solution():
+    # 항력이 없으면 가속도가 일정하므로 RK4와 에르미트 착지 보간 모두 해석해와 같아야 함
+    result = simulate(SPEEDS, ANGLES)
+    theta = np.radians(ANGLES)
+    np.testing.assert_allclose(result["range"], SPEEDS**2 * np.sin(2 * theta) / G, rtol=1e-8)
+    np.testing.assert_allclose(result["flight_time"], 2 * SPEEDS * np.sin(theta) / G, rtol=1e-8)
+    np.testing.assert_allclose(result["max_height"], (SPEEDS * np.sin(theta)) ** 2 / (2 * G), rtol=1e-8)
+    np.testing.assert_allclose(result["impact_speed"], SPEEDS, rtol=1e-8)
+
+
+def test_zero_drag_from_height():
+    speed, angle, height = 20.0, 30.0, 15.0
+    result = simulate(speed, angle, height=height)
+    vx, vy = speed * np.cos(np.radians(angle)), speed * np.sin(np.radians(angle))
+    t = (vy + np.sqrt(vy**2 + 2 * G * height)) / G
+    assert result["flight_time"] == pytest.approx(t, rel=1e-8)
+    assert result["range"] == pytest.approx(vx * t, rel=1e-8)
+    assert result["impact_speed"] == pytest.approx(np.sqrt(speed**2 + 2 * G * height), rel=1e-8)
+
+
+def test_landing_root_is_on_the_ground():
+    k = drag_factor(0.47, 0.22, 0.43)  # 축구공
+    result = simulate(SPEEDS, ANGLES, k=k, record=True)
+    for i, (px, py) in enumerate(result["paths"]):
+        assert py[-1] == 0.0
+        assert px[-1] == result["range"][i]
+        assert result["path_times"][i][-1] == result["flight_time"][i]
+        assert (py[1:-1] > 0).all()
+
+    # 기본 스텝 수의 결과가 스텝을 20배로 늘린 결과와 거의 같음 (착지를 스텝 끝이 아니라 보간 위의 근으로 잡기 때문)
+    fine = simulate(SPEEDS, ANGLES, k=k, steps_per_flight=4000)
+    np.testing.assert_allclose(result["range"], fine["range"], rtol=1e-5)
+    np.testing.assert_allclose(result["flight_time"], fine["flight_time"], rtol=1e-5)
+    assert (fine["range"] < SPEEDS**2 * np.sin(2 * np.radians(ANGLES)) / G).all()
+
+
+def test_unfinished_flights_are_nan():
+    with pytest.warns(RuntimeWarning, match="max_steps"):
+        result = simulate(SPEEDS.reshape(3, 1), ANGLES, max_steps=50)
+    for key in ("range", "flight_time", "max_height", "impact_speed"):
+        assert result[key].shape == (3, 3)
+        assert np.isnan(result[key]).all()
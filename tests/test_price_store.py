@@ -0,0 +1,108 @@
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from core.price_provider import NO_DATA, FixtureProvider, fetch_close_chunked
+from core.price_store import PriceStore
+
+START = date(2024, 1, 1)
+FRIDAY = date(2024, 3, 29)
+SATURDAY = date(2024, 3, 30)
+LATER = date(2024, 4, 12)
+
+
+class RecordingFetch:
+    """fetch_close_chunked를 감싸 요청된 (티커, 시작일, 종료일)을 기록합니다."""
+
+    def __init__(self, provider=None):
+        self.provider = provider or FixtureProvider()
+        self.calls = []
+
+    def __call__(self, tickers, start, end):
+        self.calls.append((list(tickers), start, end))
+        return fetch_close_chunked(self.provider, tickers, start, end, retries=0, backoff=0)
+
+
+def _fixture_close(tickers, start, end):
+    close = FixtureProvider().fetch_close(tickers, start, end)
+    close.index.name = "Date"
+    return close
+
+
+def test_refresh_fetches_full_range_then_only_the_tail(tmp_path):
+    store = PriceStore(str(tmp_path))
+    fetch = RecordingFetch()
+
+    close, failures = store.refresh(["AAA", "BBB"], START, FRIDAY, fetch)
+    assert failures == {}
+    assert fetch.calls == [(["AAA", "BBB"], START, FRIDAY)]
+    pd.testing.assert_frame_equal(close, _fixture_close(["AAA", "BBB"], START, FRIDAY), check_freq=False)
+
+    # 마지막 저장일(장중 값일 수 있음)부터만 다시 받음
+    close, failures = store.refresh(["AAA", "BBB"], START, LATER, fetch)
+    assert fetch.calls[1] == (["AAA", "BBB"], FRIDAY, LATER)
+    pd.testing.assert_frame_equal(close, _fixture_close(["AAA", "BBB"], START, LATER), check_freq=False)
+    assert store.last_date("AAA") == LATER
+    assert store.covers(["AAA", "BBB"], START)
+    assert not store.covers(["AAA", "CCC"], START)
+
+
+def test_newest_value_wins_for_the_same_date(tmp_path):
+    store = PriceStore(str(tmp_path))
+    store.refresh(["AAA"], START, FRIDAY, RecordingFetch())
+    before = store.read("AAA")
+
+    def intraday_fix(tickers, start, end):
+        # 마지막 저장일의 값이 장 마감 후 바뀐 경우
+        return pd.DataFrame({"AAA": [123.0]}, index=pd.DatetimeIndex([pd.Timestamp(FRIDAY)])), {}
+
+    store.refresh(["AAA"], START, FRIDAY, intraday_fix)
+    after = store.read("AAA")
+    assert after[pd.Timestamp(FRIDAY)] == 123.0
+    pd.testing.assert_series_equal(after.iloc[:-1], before.iloc[:-1])
+
+
+def test_wider_start_triggers_full_fetch(tmp_path):
+    store = PriceStore(str(tmp_path))
+    fetch = RecordingFetch()
+    store.refresh(["AAA"], date(2024, 2, 1), FRIDAY, fetch)
+    store.refresh(["AAA"], START, FRIDAY, fetch)
+
+    assert fetch.calls[1][1] == START
+    assert store.read("AAA").index[0] == pd.Timestamp(date(2024, 1, 1))
+    assert store.covers(["AAA"], START)
+
+
+def test_empty_incremental_window_is_not_a_failure(tmp_path):
+    store = PriceStore(str(tmp_path))
+    store.refresh(["AAA"], START, FRIDAY, RecordingFetch())
+
+    def weekend(tickers, start, end):
+        # 주말/휴장일 증분: 요청은 성공했지만 값이 없음
+        return pd.DataFrame(), {ticker: NO_DATA for ticker in tickers}
+
+    close, failures = store.refresh(["AAA", "NEW"], START, SATURDAY, weekend)
+    # 저장본이 있는 티커는 실패가 아니고, 저장본이 없는 티커만 데이터 없음으로 보고
+    assert failures == {"NEW": NO_DATA}
+    assert close["AAA"].dropna().index[-1] == pd.Timestamp(FRIDAY)
+
+
+@pytest.mark.parametrize("failing", ["provider", "exception"])
+def test_upstream_failure_returns_stored_data(tmp_path, failing):
+    store = PriceStore(str(tmp_path))
+    store.refresh(["AAA", "BBB"], START, FRIDAY, RecordingFetch())
+
+    if failing == "provider":
+        fetch = RecordingFetch(FixtureProvider(fail_tickers=["AAA"]))
+    else:
+        def fetch(tickers, start, end):
+            raise ConnectionError("network down")
+
+    close, failures = store.refresh(["AAA", "BBB"], START, LATER, fetch)
+    assert failures["AAA"].startswith("다운로드 실패")
+    # 실패한 티커도 저장된 구간은 그대로 돌려줌
+    pd.testing.assert_series_equal(
+        close["AAA"].dropna(), _fixture_close(["AAA"], START, FRIDAY)["AAA"], check_freq=False
+    )
+    assert store.last_date("AAA") == FRIDAY
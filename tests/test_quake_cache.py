@@ -0,0 +1,120 @@
+import copy
+import datetime
+
+import numpy as np
+
+from benchmarks.fake_usgs import FakeUSGSServer
+from benchmarks.fixtures import usgs_features
+from core.quake_cache import QuakeDayCache
+from core.usgs_fetch import USGSClient, make_session
+
+# QuakeDayCache는 tz 없는 UTC 시각을 씀
+NOW = datetime.datetime(2025, 6, 15, 12, 0)
+LATER = NOW + datetime.timedelta(minutes=15)
+TWO_DAYS_LATER = NOW + datetime.timedelta(days=2)
+
+
+def _ms(when):
+    return int(when.replace(tzinfo=datetime.timezone.utc).timestamp() * 1000)
+
+
+def _features(n=3_000, end=TWO_DAYS_LATER, days=12):
+    return list(usgs_features(n, seed=1, end_ms=_ms(end), days=days))
+
+
+def _cache(server, root):
+    return QuakeDayCache(USGSClient(base_url=server.base_url, session=make_session(backoff=0)), root=str(root))
+
+
+def _expected(features, days, min_magnitude, now):
+    # 서버 데이터에서 직접 고른 기대값 (magnitude는 float32로 저장되므로 같은 정밀도로 비교)
+    start_ms, end_ms = _ms(now - datetime.timedelta(days=days)), _ms(now)
+    return {
+        f["id"] for f in features
+        if start_ms <= f["properties"]["time"] <= end_ms
+        and np.float32(f["properties"]["mag"]) >= np.float32(min_magnitude)
+    }
+
+
+def test_fills_missing_days_then_answers_locally(tmp_path):
+    features = _features()
+    with FakeUSGSServer(features=features) as server:
+        cache = _cache(server, tmp_path)
+        assert not cache.covers(7, NOW)
+
+        cache.refresh(7, now=NOW)
+        requests_made = len(server.request_log)
+        assert requests_made > 0
+        assert cache.covers(7, NOW)
+        assert not cache.covers(9, NOW)
+
+        # 모두 저장되어 있고 아직 갱신 주기 전이므로 요청하지 않음
+        cache.refresh(7, now=NOW)
+        assert len(server.request_log) == requests_made
+
+    df = cache.query(7, 2.5, now=NOW)
+    assert set(df["id"]) == _expected(features, 7, 2.5, NOW)
+    assert df["time"].is_monotonic_decreasing
+
+    # 슬라이더를 좁히면 저장된 파티션에서 걸러냄
+    assert set(cache.query(3, 4.0, now=NOW)["id"]) == _expected(features, 3, 4.0, NOW)
+
+    # 새 인스턴스도 manifest와 Parquet 파일로 같은 답을 냄
+    reopened = QuakeDayCache(cache.client, root=str(tmp_path))
+    assert reopened.covers(7, NOW)
+    assert set(reopened.query(7, 2.5, now=NOW)["id"]) == set(df["id"])
+
+
+def test_stale_days_refresh_with_updatedafter_and_merge_by_id(tmp_path):
+    features = _features()
+    with FakeUSGSServer(features=features) as server:
+        cache = _cache(server, tmp_path)
+        cache.refresh(7, now=NOW)
+
+    # 오늘 일어난 이벤트 하나는 규모가 수정되고, 새 이벤트 하나가 추가된 상태의 서버
+    updated = copy.deepcopy(features)
+    today = [f for f in updated if _ms(NOW.replace(hour=0)) <= f["properties"]["time"] <= _ms(NOW)]
+    revised = today[0]
+    revised["properties"].update(mag=6.5, updated=_ms(NOW + datetime.timedelta(minutes=10)))
+    added = copy.deepcopy(today[1])
+    added["id"] = "new-event"
+    added["properties"].update(
+        time=_ms(NOW + datetime.timedelta(minutes=5)), updated=_ms(NOW + datetime.timedelta(minutes=5))
+    )
+    updated.append(added)
+
+    with FakeUSGSServer(features=updated) as server:
+        cache.client.base_url = server.base_url
+        cache.refresh(7, now=LATER)
+        # 확정되지 않은 날짜(어제, 오늘)를 조건부 요청 한 번(count + query)으로 갱신
+        assert server.request_log == ["count", "query"]
+
+    df = cache.query(7, 1.0, now=LATER)
+    assert df["id"].is_unique
+    assert set(df["id"]) == _expected(updated, 7, 1.0, LATER)
+    assert df.loc[df["id"] == revised["id"], "magnitude"].item() == np.float32(6.5)
+    assert "new-event" in set(df["id"])
+
+
+def test_day_is_final_after_the_following_day_ends(tmp_path):
+    features = _features()
+    with FakeUSGSServer(features=features) as server:
+        cache = _cache(server, tmp_path)
+        cache.refresh(7, now=NOW)
+        today, yesterday = NOW.date(), NOW.date() - datetime.timedelta(days=1)
+        assert cache._is_final(today - datetime.timedelta(days=2))
+        assert not cache._is_final(yesterday)
+        assert not cache._is_final(today)
+
+        # 이틀 뒤: 새 날짜는 받고, 그 사이 갱신된 날짜는 이제 확정됨
+        cache.refresh(7, now=TWO_DAYS_LATER)
+        assert cache._is_final(yesterday)
+        assert cache._is_final(today)
+        assert not cache._is_final(TWO_DAYS_LATER.date())
+
+        # 확정된 날짜는 다시 받지 않고, 확정되지 않은 날짜만 조건부로 확인 (바뀐 이벤트가 없으면 count 한 번)
+        requests_made = len(server.request_log)
+        cache.refresh(3, now=TWO_DAYS_LATER + datetime.timedelta(hours=1))
+        assert server.request_log[requests_made:] == ["count"]
+
+    assert set(cache.query(7, 1.0, now=TWO_DAYS_LATER)["id"]) == _expected(features, 7, 1.0, TWO_DAYS_LATER)
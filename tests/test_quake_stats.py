@@ -0,0 +1,90 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core import quake_stats
+from core.quake_stats import QuakeStatsEngine, fit_gutenberg_richter, magnitude_bin
+
+DAY = datetime.date(2025, 6, 10)
+
+
+def _gr_magnitudes(n, b, mc, seed=0):
+    # 구텐베르크-리히터 분포: Mc 이상의 규모는 기울기 b*ln(10)인 지수분포를 따름
+    rng = np.random.default_rng(seed)
+    return mc + rng.exponential(1 / (b * np.log(10)), size=n)
+
+
+def _day_frame(day, n, seed):
+    rng = np.random.default_rng(seed)
+    midnight = pd.Timestamp(day)
+    return pd.DataFrame({
+        "time": midnight + pd.to_timedelta(np.sort(rng.uniform(0, 86_400, size=n)), unit="s"),
+        "magnitude": np.round(_gr_magnitudes(n, 1.0, 1.0, seed), 1).astype(np.float32),
+        "depth": rng.uniform(0, 300, size=n),
+        "place": rng.choice(["10 km N of Town, Alaska", "100 km S of Fiji Islands", "5 km E of Ridge, Japan"], n),
+    })
+
+
+class CountingStats(quake_stats.PartitionStats):
+    built = 0
+
+    def __init__(self, df):
+        CountingStats.built += 1
+        super().__init__(df)
+
+
+@pytest.fixture
+def counting(monkeypatch):
+    CountingStats.built = 0
+    monkeypatch.setattr(quake_stats, "PartitionStats", CountingStats)
+    return CountingStats
+
+
+@pytest.mark.parametrize("b", [0.8, 1.0, 1.3])
+def test_aki_estimator_recovers_b_value(b):
+    magnitudes = _gr_magnitudes(50_000, b, mc=2.0, seed=int(b * 10))
+    counts = np.bincount(magnitude_bin(magnitudes), minlength=quake_stats.N_MAG)
+
+    a, fitted_b, mc = fit_gutenberg_richter(counts)
+    assert mc == pytest.approx(2.0)
+    assert fitted_b == pytest.approx(b, rel=0.03)
+    assert a == pytest.approx(np.log10(50_000) + fitted_b * mc)
+
+
+def test_too_few_events_give_nan():
+    counts = np.bincount(magnitude_bin([2.0, 2.5, 3.1]), minlength=quake_stats.N_MAG)
+    assert all(np.isnan(value) for value in fit_gutenberg_richter(counts))
+
+
+def test_only_changed_partitions_are_recomputed(counting):
+    days = [DAY + datetime.timedelta(days=i) for i in range(4)]
+    frames = {day: _day_frame(day, 500, seed=i) for i, day in enumerate(days)}
+    start = pd.Timestamp(days[0]) + pd.Timedelta(hours=12)
+    engine = QuakeStatsEngine()
+
+    partitions = [(day, "v1", frames[day]) for day in days]
+    first = engine.summarize(partitions, start, 2.0)
+    # 일부 시간만 포함되는 첫날은 캐시하지 않고 매번 계산하고, 나머지 3일은 한 번씩 계산
+    assert counting.built == 4
+    assert days[0] not in engine._cache
+
+    # 마지막 날만 갱신됨: 첫날과 바뀐 날짜만 다시 계산
+    frames[days[-1]] = _day_frame(days[-1], 600, seed=99)
+    partitions[-1] = (days[-1], "v2", frames[days[-1]])
+    second = engine.summarize(partitions, start, 2.0)
+    assert counting.built == 6
+
+    for result in (first, second):
+        assert result["day_counts"].index[0] == days[0]
+    everything = pd.concat(frames.values())
+    expected = everything[(everything["time"] >= start) & (everything["magnitude"] >= 2.0)]
+    assert second["total"] == len(expected)
+    assert second["day_counts"].sum() == len(expected)
+    assert second["hour_counts"].sum() == len(expected)
+    assert second["day_counts"][days[-1]] == (frames[days[-1]]["magnitude"] >= 2.0).sum()
+
+    # 같은 버전으로 다시 부르면 첫날만 계산
+    engine.summarize(partitions, start, 2.0)
+    assert counting.built == 7
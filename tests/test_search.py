@@ -0,0 +1,45 @@
+from core.search import SearchIndex, hangul_unigrams, tokenize
+
+PLACES = [
+    {"name": "해운대 해수욕장", "city": "부산", "description": "넓은 백사장과 야경", "hotels": ["파라다이스 호텔"],
+     "food": ["돼지국밥"]},
+    {"name": "설악산 국립공원", "city": "속초", "description": "단풍과 케이블카", "hotels": [], "food": ["순두부"]},
+    {"name": "Disneyland Park", "city": "Anaheim", "description": "theme park with rides", "hotels": ["Disney Hotel"],
+     "food": ["churros"]},
+    {"name": "한라산", "city": "제주", "description": "국립공원 안의 화산과 백록담", "hotels": [], "food": ["흑돼지"]},
+    {"name": "남산 공원", "city": "서울", "description": "공원 산책로와 타워, 야경", "hotels": [], "food": []},
+]
+
+
+def test_tokenize_uses_hangul_bigrams_and_english_words():
+    assert tokenize("국립공원에서 Hiking 2 days") == ["국립", "립공", "공원", "원에", "에서", "hiking", "2", "days"]
+    assert tokenize("차 한 잔") == ["차", "한", "잔"]
+    assert hangul_unigrams("공원 a 차") == ["공", "원"]
+
+
+def test_single_syllable_query():
+    index = SearchIndex(PLACES)
+    # 두 글자 이상 단어 안의 한 글자도 찾음 (공원, 국립공원)
+    assert set(index.search("공")) == {1, 3, 4}
+    assert set(index.search("산")) == {0, 1, 3, 4}  # 부산, 설악산, 한라산, 남산
+
+
+def test_partial_word_queries():
+    index = SearchIndex(PLACES)
+    # 한글: 띄어쓰기/조사가 달라도 2-gram으로 찾음
+    assert list(index.search("해운대에서")[:1]) == [0]
+    assert set(index.search("국립공원")) >= {1, 3}
+    # 영어: 세 글자 이상이면 접두어로 찾고, 두 글자는 정확히 같은 단어만
+    assert list(index.search("Disney")) == [2]
+    assert list(index.search("churr")) == [2]
+    assert list(index.search("di")) == []
+    assert list(index.search("없는검색어")) == []
+
+
+def test_ranking_prefers_name_matches_and_more_terms():
+    index = SearchIndex(PLACES)
+    # 이름에 있는 곳(설악산)이 설명에만 있는 곳(한라산)보다 앞
+    assert list(index.search("국립공원")[:2]) == [1, 3]
+    # 두 검색어 모두 맞는 곳이 하나만 맞는 곳보다 앞
+    assert list(index.search("야경 부산")) == [0, 4]
+    assert list(index.search("공원", limit=1)) == [4]
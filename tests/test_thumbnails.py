@@ -0,0 +1,103 @@
+import os
+import socket
+
+import pytest
+from PIL import Image
+
+from benchmarks.fake_images import FakeImageServer, rerouting_session
+from core.thumbnails import ThumbnailCache
+
+
+@pytest.fixture
+def server():
+    with FakeImageServer(size=(640, 360)) as server:
+        yield server
+
+
+def _closed_port_url():
+    # 아무도 듣지 않는 포트 (연결 거부 = 호스트 실패)
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}"
+
+
+def test_downloads_once_and_serves_webp_from_disk(server, tmp_path):
+    cache = ThumbnailCache(root=str(tmp_path), size=(320, 180))
+    urls = [server.url(f"images/{i}.jpg") for i in range(4)]
+
+    paths = cache.prefetch(urls + urls[:1])
+    assert len(server.request_log) == 4
+    for url in urls:
+        with Image.open(paths[url]) as image:
+            assert image.format == "WEBP"
+            assert image.width <= 320 and image.height <= 180
+
+    assert cache.get(urls[0]) == paths[urls[0]]
+    assert len(server.request_log) == 4
+    assert cache.stats["downloads"] == 4 and cache.stats["hits"] == 1
+
+
+def test_broken_url_is_remembered(server, tmp_path):
+    cache = ThumbnailCache(root=str(tmp_path))
+    url = server.url("broken/1.jpg")
+
+    assert cache.get(url) == cache.placeholder
+    requests_made = len(server.request_log)
+    assert cache.get(url) == cache.placeholder
+    assert len(server.request_log) == requests_made
+    assert cache.stats["failures"] == 1
+
+    # 다른 URL은 같은 호스트라도 그대로 받음 (응답 오류는 URL 단위로만 기억)
+    assert cache.get(server.url("images/1.jpg")) != cache.placeholder
+
+
+def test_unreachable_host_is_remembered(tmp_path):
+    cache = ThumbnailCache(root=str(tmp_path), timeout=(1, 1))
+    base = _closed_port_url()
+
+    assert cache.get(f"{base}/a.jpg") == cache.placeholder
+    # 같은 호스트의 다른 이미지는 요청하지 않고 바로 대체 이미지
+    assert cache.get(f"{base}/b.jpg") == cache.placeholder
+    assert cache.stats["failures"] == 1
+
+
+def test_failure_is_retried_after_retry_window(server, tmp_path):
+    cache = ThumbnailCache(root=str(tmp_path), retry_seconds=0)
+    url = server.url("broken/1.jpg")
+
+    cache.get(url)
+    cache.get(url)
+    assert cache.stats["failures"] == 2
+
+
+def test_evicts_least_recently_used(server, tmp_path):
+    # 모든 URL이 같은 원본을 받으므로 썸네일 크기가 같음
+    cache = ThumbnailCache(root=str(tmp_path), session=rerouting_session(server, n_images=1))
+    first, second, third = (f"https://example.com/{name}.jpg" for name in ("first", "second", "third"))
+
+    cache.get(first)
+    size = os.path.getsize(cache.path_for(first))
+    cache.max_bytes = int(size * 2.5)
+    cache.get(second)
+    os.utime(cache.path_for(first), (1, 1))
+    os.utime(cache.path_for(second), (2, 2))
+    cache.get(first)  # 적중하면 마지막 사용 시각이 갱신되어 second가 가장 오래된 파일이 됨
+
+    cache.get(third)
+    assert os.path.exists(cache.path_for(first))
+    assert not os.path.exists(cache.path_for(second))
+    assert os.path.exists(cache.path_for(third))
+    assert cache.stats["evictions"] == 1
+
+
+def test_evicted_file_is_downloaded_again(server, tmp_path):
+    cache = ThumbnailCache(root=str(tmp_path))
+    url = server.url("images/2.jpg")
+    path = cache.get(url)
+
+    # 다른 스레드의 정리로 파일이 사라진 경우: 오류 없이 다시 받음
+    os.remove(path)
+    assert cache.get(url) == path
+    assert os.path.exists(path)
+    assert cache.stats["downloads"] == 2
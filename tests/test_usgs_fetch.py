@@ -0,0 +1,103 @@
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from benchmarks.fake_usgs import FakeUSGSServer
+from benchmarks.fixtures import usgs_features
+from core.usgs_fetch import USGS_MAX_ALLOWED, USGSClient, make_session
+
+END = datetime.datetime(2025, 6, 15, tzinfo=datetime.timezone.utc)
+END_MS = int(END.timestamp() * 1000)
+
+
+def _feature(event_id, when, mag=3.0):
+    # 합성 feature 하나를 골라 id/시각/규모만 바꿈
+    feature = next(usgs_features(1, end_ms=END_MS))
+    feature["id"] = event_id
+    feature["properties"].update(time=int(when.timestamp() * 1000), mag=mag)
+    return feature
+
+
+def _client(server, **kwargs):
+    # 재시도 대기 없이 빠르게 확인
+    return USGSClient(base_url=server.base_url, session=make_session(backoff=0), **kwargs)
+
+
+def test_splits_windows_over_service_limit():
+    start = END - datetime.timedelta(days=30)
+    with FakeUSGSServer(n_events=45_000, end_ms=END_MS, days=30) as server:
+        client = _client(server)
+        frame = client.fetch(start, END, 1.0)
+        windows = len([name for name in server.request_log if name == "query"])
+
+    # 한 번에 받을 수 없는 양이므로 한도 이하의 구간 여러 개로 나눠 받아야 함
+    assert windows >= 3
+    expected = server.mags >= 1.0
+    assert len(frame) == expected.sum()
+    assert frame["id"].is_unique
+    assert frame["time"].is_monotonic_decreasing
+    assert client.max_per_window == USGS_MAX_ALLOWED
+
+
+def test_plan_windows_stay_under_limit():
+    start = END - datetime.timedelta(days=30)
+    with FakeUSGSServer(n_events=5_000, end_ms=END_MS, days=30, max_allowed=700) as server:
+        client = _client(server, max_per_window=700)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            windows = client.plan_windows(start, END, 1.0, executor)
+        counts = [client.count(w_start, w_end, 1.0) for w_start, w_end in windows]
+
+    assert len(windows) > 1
+    assert max(counts) <= 700
+    # 나눈 구간은 빈틈없이 이어짐 (이벤트가 없는 구간만 빠질 수 있음)
+    assert windows[0][0] >= start and windows[-1][1] <= END
+    assert all(a[1] <= b[0] for a, b in zip(windows, windows[1:]))
+
+
+def test_boundary_event_is_deduplicated():
+    start = END - datetime.timedelta(hours=2)
+    middle = END - datetime.timedelta(hours=1)
+    features = [
+        _feature("early", start + datetime.timedelta(minutes=10)),
+        _feature("boundary", middle),
+        _feature("late", END - datetime.timedelta(minutes=10)),
+    ]
+    # 한도 2개: 전체 3개는 반으로 나뉘고, 정확히 가운데 시각의 이벤트는 양쪽 구간에 모두 들어옴
+    with FakeUSGSServer(features=features, max_allowed=2) as server:
+        frame = _client(server, max_per_window=2).fetch(start, END, 1.0)
+        queries = [name for name in server.request_log if name == "query"]
+
+    assert len(queries) == 2
+    assert list(frame["id"]) == ["late", "boundary", "early"]
+
+
+def test_retries_transient_server_errors():
+    start = END - datetime.timedelta(days=1)
+    with FakeUSGSServer(n_events=200, end_ms=END_MS, days=1, fail_requests=2) as server:
+        frame = _client(server).fetch(start, END, 1.0)
+        requests_made = len(server.request_log)
+
+    assert len(frame) == (server.mags >= 1.0).sum()
+    # count 1번 + query 1번에 실패한 2번이 더해짐
+    assert requests_made == 4
+
+
+def test_gives_up_after_retries():
+    start = END - datetime.timedelta(days=1)
+    with FakeUSGSServer(n_events=10, end_ms=END_MS, days=1, fail_requests=100) as server:
+        with pytest.raises(requests.RequestException):
+            _client(server).fetch(start, END, 1.0)
+
+
+def test_dense_window_at_min_window_raises():
+    # 같은 초에 몰린 이벤트는 아무리 나눠도 한도 아래로 내려가지 않음
+    when = END - datetime.timedelta(hours=1)
+    features = [_feature(f"swarm-{i}", when) for i in range(5)]
+    with FakeUSGSServer(features=features, max_allowed=3) as server:
+        client = _client(server, max_per_window=3)
+        with pytest.raises(ValueError, match="5건"):
+            client.fetch(END - datetime.timedelta(days=1), END, 1.0)
+        # 한도를 넘는 query는 보내지 않음 (count만 요청)
+        assert set(server.request_log) == {"count"}